@@ -0,0 +1,7 @@
+"""
+Repeatable timings of pyonepassword operations against mock-op
+
+Run from the root of the source tree, with mock-op on the PATH:
+
+    python -m benchmarks
+"""
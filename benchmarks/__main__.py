@@ -0,0 +1,102 @@
+import json
+import sys
+from argparse import ArgumentParser, Namespace
+from typing import Dict
+
+from pyonepassword.api.json_backend import (
+    JSON_BACKEND_AUTO,
+    available_json_backends,
+    set_json_backend
+)
+
+from ._env import BenchmarkEnvironment
+from ._timing import COLUMNS, Instrumentation, summarize
+from .scenarios import LARGE_VAULT_SCENARIOS, SCENARIOS
+
+DEFAULT_ITERATIONS = 20
+
+
+def benchmarks_parse_args() -> Namespace:
+    parser = ArgumentParser(prog="python -m benchmarks",
+                            description="Time pyonepassword operations against mock-op")
+    parser.add_argument("scenarios", nargs="*", metavar="SCENARIO",
+                        help=f"Scenarios to run (default: all). One or more of: {', '.join(SCENARIOS)}. "
+                        f"With --large-vault, also: {', '.join(LARGE_VAULT_SCENARIOS)}")
+    parser.add_argument("--iterations", "-n", type=int, default=DEFAULT_ITERATIONS,
+                        help=f"Timed iterations per scenario (default: {DEFAULT_ITERATIONS})")
+    parser.add_argument("--warmup", type=int, default=1,
+                        help="Untimed iterations per scenario before timing (default: 1)")
+    parser.add_argument("--json", metavar="JSON_PATH",
+                        help="Also write results as JSON to the specified path")
+    parser.add_argument("--large-vault", metavar="VAULT_DIR",
+                        help="Directory generated by 'python -m benchmarks.large_vault', enabling scale benchmarks")
+    parser.add_argument("--json-backend", choices=available_json_backends() + [JSON_BACKEND_AUTO],
+                        default=JSON_BACKEND_AUTO,
+                        help="JSON backend for pyonepassword to use (default: auto)")
+
+    parsed = parser.parse_args()
+    available = dict(SCENARIOS)
+    if parsed.large_vault:
+        available.update(LARGE_VAULT_SCENARIOS)
+    unknown = [name for name in parsed.scenarios if name not in available]
+    if unknown:
+        parser.error(f"Unknown scenario(s): {', '.join(unknown)}")
+    if parsed.iterations < 1:
+        parser.error("--iterations must be at least 1")
+    return parsed
+
+
+def print_report(results: Dict[str, Dict]):
+    # mean milliseconds per iteration
+    name_width = max(len("scenario"), *(len(name) for name in results))
+    header = ["scenario".ljust(name_width), "cmds"]
+    header.extend(f"{column:>{max(len(column), 9)}}" for column in COLUMNS)
+    print("mean milliseconds per iteration")
+    print("  ".join(header))
+    for name, summary in results.items():
+        row = [name.ljust(name_width), f"{summary['op_commands']['mean']:4.1f}"]
+        for column in COLUMNS:
+            millis = summary[column]["mean"] * 1000
+            row.append(f"{millis:>{max(len(column), 9)}.3f}")
+        print("  ".join(row))
+
+
+def main():
+    args = benchmarks_parse_args()
+    try:
+        env = BenchmarkEnvironment(large_vault_dir=args.large_vault)
+    except RuntimeError as e:
+        print(e, file=sys.stderr)
+        return 1
+
+    scenarios = dict(SCENARIOS)
+    if env.large_vault is not None:
+        scenarios.update(LARGE_VAULT_SCENARIOS)
+        if env.large_vault["document"] is None:
+            scenarios.pop("large_document_get")
+    scenario_names = args.scenarios or list(scenarios)
+
+    json_backend = set_json_backend(args.json_backend)
+    print(f"JSON backend: {json_backend}")
+
+    instrumentation = Instrumentation()
+    results = {}
+    with instrumentation.active():
+        for name in scenario_names:
+            scenario = scenarios[name]
+            if args.warmup > 0:
+                scenario(env, instrumentation, args.warmup)
+            samples = scenario(env, instrumentation, args.iterations)
+            results[name] = summarize(samples)
+
+    print_report(results)
+    if args.json:
+        with open(args.json, "w") as f:
+            json.dump({"iterations": args.iterations, "json_backend": json_backend,
+                       "results": results},
+                      f, indent=2)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
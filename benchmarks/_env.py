@@ -0,0 +1,81 @@
+"""
+mock-op environment setup for benchmarks, mirroring the pytest fixtures in
+tests/fixtures/op_fixtures.py
+"""
+import json
+import os
+import shutil
+import tempfile
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Any, Dict, Optional, Union
+
+from pyonepassword import OP
+from tests.fixtures.paths import RESP_DIRECTORY_PATH
+from tests.fixtures.valid_op_cli_config import ValidOPCLIConfig
+
+ACCOUNT_ID = "5GHHPJK5HZC5BAT7WDUXW57G44"
+OP_MASTER_PASSWORD = "made-up-password"
+OP_PATH = "mock-op"
+
+
+class BenchmarkEnvironment:
+    """
+    A valid 'op' config in a temporary $HOME, plus the environment variables
+    mock-op needs in order to serve responses from tests/config/mock-op
+    """
+
+    def __init__(self, large_vault_dir: Optional[Union[str, Path]] = None):
+        if not Path(RESP_DIRECTORY_PATH).exists():
+            raise RuntimeError(
+                "Benchmarks must be run from the root of the source tree")
+        if shutil.which(OP_PATH) is None:
+            raise RuntimeError(f"'{OP_PATH}' not found on the PATH")
+        # ValidOPCLIConfig restores $HOME when it's garbage collected
+        # so hold on to it for as long as the benchmarks run
+        self._op_cli_config = ValidOPCLIConfig()
+        os.environ["MOCK_OP_RESPONSE_DIRECTORY"] = str(RESP_DIRECTORY_PATH)
+        os.environ["MOCK_OP_SIGNIN_SUCCEED"] = "1"
+        os.environ["LOG_OP_ERR"] = "1"
+
+        # a vault generated by benchmarks.large_vault
+        self.large_vault: Optional[Dict[str, Any]] = None
+        if large_vault_dir is not None:
+            with open(Path(large_vault_dir, "manifest.json"), "r") as f:
+                self.large_vault = json.load(f)
+
+    def signed_in_op(self) -> OP:
+        op = OP(op_path=OP_PATH,
+                account=ACCOUNT_ID,
+                password=OP_MASTER_PASSWORD)
+        return op
+
+    @contextmanager
+    def large_vault_responses(self):
+        """
+        Switch mock-op to the generated large vault's response directory
+        """
+        resp_dir = os.environ["MOCK_OP_RESPONSE_DIRECTORY"]
+        os.environ["MOCK_OP_RESPONSE_DIRECTORY"] = self.large_vault["response_directory"]
+        try:
+            yield
+        finally:
+            os.environ["MOCK_OP_RESPONSE_DIRECTORY"] = resp_dir
+
+    @contextmanager
+    def stateful(self, state_config_path: Path):
+        """
+        Switch mock-op to a fresh copy of a state config, since mock-op modifies
+        the state config as it iterates through states
+        """
+        with tempfile.TemporaryDirectory() as temp_dir:
+            copied_config_path = Path(temp_dir, state_config_path.name)
+            shutil.copyfile(state_config_path, copied_config_path)
+            resp_dir = os.environ.pop("MOCK_OP_RESPONSE_DIRECTORY", None)
+            os.environ["MOCK_OP_STATE_DIR"] = str(copied_config_path)
+            try:
+                yield
+            finally:
+                os.environ.pop("MOCK_OP_STATE_DIR", None)
+                if resp_dir is not None:
+                    os.environ["MOCK_OP_RESPONSE_DIRECTORY"] = resp_dir
@@ -0,0 +1,211 @@
+"""
+Timing instrumentation for benchmarks
+
+Time spent in 'op' subprocesses is collected via an OPCommandObserver. Time
+spent in selected Python functions is collected by temporarily wrapping them
+"""
+import functools
+import statistics
+import threading
+import time
+from contextlib import ExitStack, contextmanager
+from typing import Callable, Dict, List, NamedTuple
+
+from pyonepassword.api.observer import OPCommandObserver, OPCommandRecord
+
+# categories of 'op' subprocess time
+OP_COMMAND = "op_command"
+OP_AUTH_PREFLIGHT = "op_auth_preflight"
+OP_VERSION_CHECK = "op_version_check"
+
+# Python-side functions that get their own timings
+PY_JSON_LOADS = "py_json_loads"
+PY_CHECK_OP_VERSION = "py_check_op_version"
+PY_ITEM_PARSE = "py_item_parse"
+
+WALL = "wall"
+PYTHON = "python"
+
+# columns, in the order they're reported
+COLUMNS = [WALL, PYTHON, OP_COMMAND, OP_AUTH_PREFLIGHT, OP_VERSION_CHECK,
+           PY_JSON_LOADS, PY_CHECK_OP_VERSION, PY_ITEM_PARSE]
+
+
+class _SubprocessTimer(OPCommandObserver):
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.seconds: Dict[str, float] = {}
+        self.commands: int = 0
+
+    def command_finished(self, record: OPCommandRecord):
+        if record.auth_preflight:
+            category = OP_AUTH_PREFLIGHT
+        elif record.version_check:
+            category = OP_VERSION_CHECK
+        else:
+            category = OP_COMMAND
+        with self._lock:
+            self.seconds[category] = self.seconds.get(
+                category, 0.0) + record.wall_time
+            self.commands += 1
+
+    def total(self) -> float:
+        with self._lock:
+            return sum(self.seconds.values())
+
+    def reset(self):
+        with self._lock:
+            self.seconds = {}
+            self.commands = 0
+
+
+class _FunctionTimer:
+    """
+    Accumulates time spent in a wrapped function, excluding time spent in 'op'
+    subprocesses it happens to run. Only the outermost call is timed if the
+    function is reentered
+    """
+
+    def __init__(self, subprocess_timer: _SubprocessTimer):
+        self._subprocess_timer = subprocess_timer
+        self._local = threading.local()
+        self.seconds = 0.0
+        self.calls = 0
+
+    def wrap(self, func: Callable) -> Callable:
+
+        @functools.wraps(func)
+        def _timed(*args, **kwargs):
+            depth = getattr(self._local, "depth", 0)
+            if depth:
+                return func(*args, **kwargs)
+            self._local.depth = 1
+            subprocess_start = self._subprocess_timer.total()
+            start = time.perf_counter()
+            try:
+                return func(*args, **kwargs)
+            finally:
+                elapsed = time.perf_counter() - start
+                elapsed -= self._subprocess_timer.total() - subprocess_start
+                self.seconds += elapsed
+                self.calls += 1
+                self._local.depth = 0
+
+        return _timed
+
+    def reset(self):
+        self.seconds = 0.0
+        self.calls = 0
+
+
+@contextmanager
+def _patched(owner, attr_name, timer: _FunctionTimer):
+    original = owner.__dict__[attr_name]
+    if isinstance(original, classmethod):
+        patched = classmethod(timer.wrap(original.__func__))
+    elif isinstance(original, staticmethod):
+        patched = staticmethod(timer.wrap(original.__func__))
+    else:
+        patched = timer.wrap(original)
+    setattr(owner, attr_name, patched)
+    try:
+        yield
+    finally:
+        setattr(owner, attr_name, original)
+
+
+class Sample(NamedTuple):
+    """
+    Timings, in seconds, for a single iteration of a benchmark
+    """
+    seconds: Dict[str, float]
+    op_commands: int
+
+
+class Instrumentation:
+    """
+    Collects a Sample for each timed block while active
+    """
+
+    def __init__(self):
+        self._subprocess_timer = _SubprocessTimer()
+        self._function_timers = {
+            PY_JSON_LOADS: _FunctionTimer(self._subprocess_timer),
+            PY_CHECK_OP_VERSION: _FunctionTimer(self._subprocess_timer),
+            PY_ITEM_PARSE: _FunctionTimer(self._subprocess_timer),
+        }
+
+    @contextmanager
+    def active(self):
+        # imported here so benchmarks can set up the environment first
+        import json
+
+        from pyonepassword import OP
+        from pyonepassword._op_commands import _OPCommandInterface
+        from pyonepassword.json import _OrjsonJSONBackend, _StdlibJSONBackend
+        from pyonepassword.op_items._item_type_registry import OPItemFactory
+
+        timers = self._function_timers
+        with ExitStack() as stack:
+            # pyonepassword decodes JSON via the active JSON backend, or calls
+            # json.loads() directly via the 'json' module
+            stack.enter_context(
+                _patched(json, "loads", timers[PY_JSON_LOADS]))
+            for backend_class in [_StdlibJSONBackend, _OrjsonJSONBackend]:
+                for method_name in ["loads", "loads_multiple"]:
+                    stack.enter_context(
+                        _patched(backend_class, method_name, timers[PY_JSON_LOADS]))
+            stack.enter_context(
+                _patched(_OPCommandInterface, "_check_op_version", timers[PY_CHECK_OP_VERSION]))
+            stack.enter_context(
+                _patched(OPItemFactory, "op_item", timers[PY_ITEM_PARSE]))
+            OP.add_command_observer(self._subprocess_timer)
+            stack.callback(OP.remove_command_observer,
+                           self._subprocess_timer)
+            yield self
+
+    @contextmanager
+    def timed(self, samples: List[Sample]):
+        """
+        Time the enclosed block, appending a new Sample to 'samples'
+        """
+        self._subprocess_timer.reset()
+        for timer in self._function_timers.values():
+            timer.reset()
+        start = time.perf_counter()
+        yield
+        wall = time.perf_counter() - start
+
+        seconds = {OP_COMMAND: 0.0,
+                   OP_AUTH_PREFLIGHT: 0.0,
+                   OP_VERSION_CHECK: 0.0}
+        seconds.update(self._subprocess_timer.seconds)
+        seconds[WALL] = wall
+        seconds[PYTHON] = wall - self._subprocess_timer.total()
+        for name, timer in self._function_timers.items():
+            seconds[name] = timer.seconds
+        samples.append(Sample(seconds, self._subprocess_timer.commands))
+
+
+def summarize(samples: List[Sample]) -> Dict[str, Dict[str, float]]:
+    """
+    Summarize each column across all samples
+
+    Returns
+    -------
+    Dict[str, Dict[str, float]]
+        A dictionary, keyed by column, of "mean", "median", and "min" seconds
+    """
+    summary = {}
+    for column in COLUMNS:
+        values = [sample.seconds[column] for sample in samples]
+        summary[column] = {
+            "mean": statistics.mean(values),
+            "median": statistics.median(values),
+            "min": min(values),
+        }
+    summary["op_commands"] = {
+        "mean": statistics.mean(sample.op_commands for sample in samples)
+    }
+    return summary
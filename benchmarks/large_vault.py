@@ -0,0 +1,421 @@
+"""
+Generate a synthetic, production-sized vault for scale benchmarks
+
+Items are built from the item templates in pyonepassword/data. The output
+directory contains:
+
+  - response-directory.json and responses/: A mock-op response directory
+    serving 'op item list' for the vault, 'op item get' for each "wide" item
+    (by title and by ID), and 'op item get'/'op document get' for a large
+    document, plus the responses needed to sign in
+  - raw/: The same data as plain JSON, for benchmarking parsing without mock-op
+      - item-list.json: The vault's item list, as 'op item list' returns it
+      - items.json: A JSON array of every item, as 'op item get' would return it
+      - wide-item-NN.json: Each wide item
+  - manifest.json: Describes what was generated, for use by benchmarks
+
+Output is deterministic for a given set of arguments, including --seed
+
+Example:
+
+    python -m benchmarks.large_vault /tmp/large-vault --items 100000
+"""
+import base64
+import copy
+import json
+import random
+import shutil
+import sys
+from argparse import ArgumentParser, Namespace
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+from typing import Any, Dict, List
+
+from pyonepassword.op_items._item_type_registry import OPItemFactory
+from pyonepassword.op_items.template_directory import OPTemplateDirectory
+from tests.fixtures.paths import RESP_DIRECTORY_PATH
+
+MANIFEST_JSON = "manifest.json"
+RESPONSE_DIRECTORY_JSON = "response-directory.json"
+
+DEFAULT_VAULT_NAME = "Large Vault"
+DEFAULT_ITEMS = 10_000
+DEFAULT_WIDE_ITEMS = 3
+DEFAULT_FIELDS = 300
+DEFAULT_SECTIONS = 50
+DEFAULT_DOCUMENT_SIZE = 4 * 1024 * 1024
+
+ACCOUNT_ID = "5GHHPJK5HZC5BAT7WDUXW57G44"
+EPOCH = datetime(2020, 1, 1, tzinfo=timezone.utc)
+
+# commands from the test suite's response directory needed to sign in
+SIGNIN_COMMANDS = [
+    "--version",
+    "--format|json|account|list",
+    "--format|json|whoami",
+    f"--account|{ACCOUNT_ID}|--format|json|whoami",
+]
+
+# field types to cycle through for custom fields
+# OTP is left out, since it requires a valid TOTP URI
+CUSTOM_FIELD_TYPES = ["STRING", "CONCEALED", "URL", "EMAIL", "PHONE"]
+
+
+def large_vault_parse_args() -> Namespace:
+    parser = ArgumentParser(prog="python -m benchmarks.large_vault",
+                            description="Generate a synthetic vault for scale benchmarks")
+    parser.add_argument("output_dir", metavar="OUTPUT_DIR",
+                        help="Directory to write the vault to. Must not already exist")
+    parser.add_argument("--vault-name", default=DEFAULT_VAULT_NAME,
+                        help=f"Vault name (default: {DEFAULT_VAULT_NAME})")
+    parser.add_argument("--items", type=int, default=DEFAULT_ITEMS,
+                        help=f"Number of items in the vault (default: {DEFAULT_ITEMS})")
+    parser.add_argument("--wide-items", type=int, default=DEFAULT_WIDE_ITEMS,
+                        help=f"Number of additional items with many fields and sections (default: {DEFAULT_WIDE_ITEMS})")
+    parser.add_argument("--fields", type=int, default=DEFAULT_FIELDS,
+                        help=f"Custom fields per wide item (default: {DEFAULT_FIELDS})")
+    parser.add_argument("--sections", type=int, default=DEFAULT_SECTIONS,
+                        help=f"Sections per wide item (default: {DEFAULT_SECTIONS})")
+    parser.add_argument("--document-size", type=int, default=DEFAULT_DOCUMENT_SIZE,
+                        help=f"Size in bytes of the generated document (default: {DEFAULT_DOCUMENT_SIZE})")
+    parser.add_argument("--all-categories", action="store_true",
+                        help="Include categories pyonepassword has no item class for. "
+                        "Retrieving these requires generic_okay=True")
+    parser.add_argument("--seed", type=int, default=0,
+                        help="Random seed (default: 0)")
+
+    parsed = parser.parse_args()
+    if parsed.items < 0 or parsed.wide_items < 0 or parsed.document_size < 0:
+        parser.error("Counts and sizes must not be negative")
+    if parsed.fields > 0 and parsed.sections < 1:
+        parser.error("--sections must be at least 1 if wide items have fields")
+    return parsed
+
+
+class LargeVaultGenerator:
+
+    def __init__(self,
+                 vault_name: str = DEFAULT_VAULT_NAME,
+                 seed: int = 0,
+                 all_categories: bool = False):
+        self._rng = random.Random(seed)
+        self._templates = OPTemplateDirectory()
+        self._template_cache: Dict[str, Dict[str, Any]] = {}
+        self.vault = {"id": self._unique_id(), "name": vault_name}
+
+        categories = sorted(self._templates._registry.keys())
+        if not all_categories:
+            categories = [category for category in categories
+                          if category in OPItemFactory._TYPE_REGISTRY]
+        # documents are generated separately, since they need file attachments
+        self.categories = [c for c in categories if c != "DOCUMENT"]
+
+    def item(self, index: int, category: str, title: str = None) -> Dict[str, Any]:
+        if title is None:
+            title = f"{category.replace('_', ' ').title()} {index:06d}"
+        item = self._item_base(index, title, category)
+        template = self._template(category)
+        sections = copy.deepcopy(template.get("sections", []))
+        fields = copy.deepcopy(template.get("fields", []))
+        for field in fields:
+            self._fill_field(item, field)
+        if sections:
+            item["sections"] = sections
+        item["fields"] = fields
+        if category == "LOGIN":
+            item["urls"] = [{"label": "website",
+                             "primary": True,
+                             "href": f"https://login-{index:06d}.example/login"}]
+        return item
+
+    def wide_item(self, index: int, field_count: int, section_count: int) -> Dict[str, Any]:
+        item = self.item(index, "LOGIN", title=f"Wide Login {index:02d}")
+        sections = item.setdefault("sections", [])
+        new_sections = []
+        for section_num in range(section_count):
+            section = {"id": f"Section_{self._unique_id(hex=True)}",
+                       "label": f"Section {section_num:03d}"}
+            new_sections.append(section)
+        sections.extend(new_sections)
+
+        for field_num in range(field_count):
+            section = new_sections[field_num % section_count]
+            field_type = CUSTOM_FIELD_TYPES[field_num % len(CUSTOM_FIELD_TYPES)]
+            field = {"id": self._unique_id(hex=True),
+                     "section": dict(section),
+                     "type": field_type,
+                     "label": f"Field {field_num:04d}",
+                     "value": self._value_for_type(field_type, field_num)}
+            field["reference"] = self._reference(item, field)
+            item["fields"].append(field)
+        return item
+
+    def document_item(self, index: int, file_name: str, size: int) -> Dict[str, Any]:
+        item = self.item(index, "DOCUMENT",
+                         title=f"Document {index:02d} - {file_name}")
+        item["additional_information"] = f"{size // 1024} KB"
+        file_id = self._unique_id()
+        content_path = f"/v1/vaults/{self.vault['id']}/items/{item['id']}/files/{file_id}/content"
+        item["files"] = [{"id": file_id,
+                          "name": file_name,
+                          "size": size,
+                          "content_path": content_path}]
+        return item
+
+    def document_bytes(self, size: int) -> bytes:
+        return self._rng.randbytes(size)
+
+    @staticmethod
+    def item_list_entry(item: Dict[str, Any]) -> Dict[str, Any]:
+        # 'op item list' returns a subset of each item's top-level keys
+        keys = ["id", "title", "tags", "version", "vault", "category", "last_edited_by",
+                "created_at", "updated_at", "additional_information", "urls"]
+        entry = {key: item[key] for key in keys if key in item}
+        return entry
+
+    def _template(self, category):
+        template = self._template_cache.get(category)
+        if template is None:
+            template = self._templates.template_for_category(category)
+            self._template_cache[category] = template
+        return template
+
+    def _item_base(self, index, title, category):
+        created = EPOCH + timedelta(minutes=index)
+        updated = created + timedelta(days=self._rng.randrange(365))
+        item = {"id": self._unique_id(),
+                "title": title,
+                "version": self._rng.randrange(1, 20),
+                "vault": dict(self.vault),
+                "category": category,
+                "last_edited_by": ACCOUNT_ID,
+                "created_at": created.strftime("%Y-%m-%dT%H:%M:%SZ"),
+                "updated_at": updated.strftime("%Y-%m-%dT%H:%M:%SZ"),
+                "additional_information": f"user{index:06d}"}
+        if index % 4 == 0:
+            item["tags"] = [f"tag-{index % 10}", "benchmark"]
+        return item
+
+    def _fill_field(self, item, field):
+        if field.get("purpose") == "NOTES":
+            field["value"] = f"Notes for {item['title']}"
+        elif field.get("purpose") == "USERNAME":
+            field["value"] = item["additional_information"]
+        elif field["type"] in CUSTOM_FIELD_TYPES:
+            field["value"] = self._value_for_type(
+                field["type"], self._rng.randrange(10000))
+        # anything else, such as DATE or MENU fields, keeps the template's value
+        if field["type"] == "CONCEALED":
+            field["entropy"] = 94.353515625
+        field["reference"] = self._reference(item, field)
+
+    def _value_for_type(self, field_type, num):
+        if field_type == "CONCEALED":
+            value = self._password()
+        elif field_type == "URL":
+            value = f"https://field-{num:04d}.example"
+        elif field_type == "EMAIL":
+            value = f"user{num:04d}@example.com"
+        elif field_type == "PHONE":
+            value = f"555-{num % 10000:04d}"
+        else:
+            value = f"Value {num:04d} {self._password(8)}"
+        return value
+
+    def _password(self, length=16):
+        alphabet = "abcdefghijkmnopqrstuvwxyzABCDEFGHJKLMNPQRSTUVWXYZ23456789@#%&*"
+        password = "".join(self._rng.choice(alphabet) for _ in range(length))
+        return password
+
+    def _reference(self, item, field):
+        section = field.get("section")
+        parts = [item["vault"]["name"], item["title"]]
+        if section:
+            parts.append(section["label"])
+        parts.append(field["label"])
+        reference = "op://" + "/".join(parts)
+        return reference
+
+    def _unique_id(self, hex=False):
+        # same formats as OPUniqueIdentifierBase32 & OPUniqueIdentifierHex, but reproducible
+        unique_id_bytes = self._rng.randbytes(16)
+        if hex:
+            unique_id = unique_id_bytes.hex().upper()
+        else:
+            unique_id = base64.b32encode(
+                unique_id_bytes).decode("utf-8").rstrip("=").lower()
+        return unique_id
+
+
+class _ResponseDirectory:
+    """
+    Writes a response directory in the format mock-op reads
+    """
+
+    def __init__(self, output_dir: Path):
+        self.path = Path(output_dir, RESPONSE_DIRECTORY_JSON)
+        self.responses_path = Path(output_dir, "responses")
+        self.responses_path.mkdir()
+        self._directory: Dict[str, Any] = {
+            "meta": {"response_dir": str(self.responses_path.resolve())},
+            "commands": {},
+            "commands_with_input": {}
+        }
+
+    def add_command(self, argv: List[str], name: str, output: bytes, exit_status=0, error_output=b""):
+        response_path = Path(self.responses_path, name)
+        response_path.mkdir()
+        Path(response_path, "output").write_bytes(output)
+        Path(response_path, "error_output").write_bytes(error_output)
+        self._add_entry("|".join(argv), name, exit_status)
+
+    def copy_command(self, command_key: str, base_directory: Dict[str, Any]):
+        entry = base_directory["commands"][command_key]
+        base_responses = Path(base_directory["meta"]["response_dir"])
+        shutil.copytree(Path(base_responses, entry["name"]),
+                        Path(self.responses_path, entry["name"]))
+        self._add_entry(command_key, entry["name"], entry["exit_status"])
+
+    def write(self):
+        with open(self.path, "w") as f:
+            json.dump(self._directory, f, indent=2)
+
+    def _add_entry(self, command_key, name, exit_status):
+        self._directory["commands"][command_key] = {"exit_status": exit_status,
+                                                    "stdout": "output",
+                                                    "stderr": "error_output",
+                                                    "name": name}
+
+
+def _json_bytes(obj) -> bytes:
+    return json.dumps(obj, indent=2).encode("utf-8")
+
+
+def generate_large_vault(output_dir: Path,
+                         vault_name: str = DEFAULT_VAULT_NAME,
+                         item_count: int = DEFAULT_ITEMS,
+                         wide_item_count: int = DEFAULT_WIDE_ITEMS,
+                         field_count: int = DEFAULT_FIELDS,
+                         section_count: int = DEFAULT_SECTIONS,
+                         document_size: int = DEFAULT_DOCUMENT_SIZE,
+                         all_categories: bool = False,
+                         seed: int = 0) -> Dict[str, Any]:
+    """
+    Generate a synthetic vault, and a mock-op response directory serving it
+
+    Must be run from the root of the source tree, since sign-in responses are
+    copied from the test suite's mock-op configuration
+
+    Returns
+    -------
+    Dict[str, Any]
+        The manifest describing the generated vault, which is also written to
+        manifest.json in the output directory
+    """
+    output_dir = Path(output_dir)
+    output_dir.mkdir(parents=True, exist_ok=False)
+    raw_dir = Path(output_dir, "raw")
+    raw_dir.mkdir()
+
+    generator = LargeVaultGenerator(vault_name=vault_name,
+                                    seed=seed,
+                                    all_categories=all_categories)
+    responses = _ResponseDirectory(output_dir)
+    with open(RESP_DIRECTORY_PATH, "r") as f:
+        base_directory = json.load(f)
+    for command_key in SIGNIN_COMMANDS:
+        responses.copy_command(command_key, base_directory)
+
+    vault_args = ["--vault", vault_name]
+    item_list = []
+    # 100k items won't comfortably fit in memory, so write them out as we go
+    items_json_path = Path(raw_dir, "items.json")
+    with open(items_json_path, "w") as items_json:
+        items_json.write("[\n")
+        for index in range(item_count):
+            category = generator.categories[index % len(generator.categories)]
+            item = generator.item(index, category)
+            if index:
+                items_json.write(",\n")
+            json.dump(item, items_json)
+            item_list.append(generator.item_list_entry(item))
+        items_json.write("\n]\n")
+
+    wide_items = []
+    for index in range(wide_item_count):
+        item = generator.wide_item(index, field_count, section_count)
+        item_bytes = _json_bytes(item)
+        raw_path = Path(raw_dir, f"wide-item-{index:02d}.json")
+        raw_path.write_bytes(item_bytes)
+        responses.add_command(["--format", "json", "item", "get", item["title"]] + vault_args,
+                              f"item-get-wide-item-{index:02d}", item_bytes)
+        responses.add_command(["--format", "json", "item", "get", item["id"]],
+                              f"item-get-wide-item-{index:02d}-by-id", item_bytes)
+        item_list.append(generator.item_list_entry(item))
+        wide_items.append({"id": item["id"],
+                           "title": item["title"],
+                           "raw_json": str(raw_path)})
+
+    document = None
+    if document_size:
+        file_name = "large-document.bin"
+        item = generator.document_item(0, file_name, document_size)
+        responses.add_command(["--format", "json", "item", "get", item["title"]] + vault_args,
+                              "item-get-large-document", _json_bytes(item))
+        responses.add_command(["--format", "json", "document", "get", item["title"]] + vault_args,
+                              "document-get-large-document",
+                              generator.document_bytes(document_size))
+        item_list.append(generator.item_list_entry(item))
+        document = {"id": item["id"],
+                    "title": item["title"],
+                    "file_name": file_name,
+                    "size": document_size}
+
+    item_list_bytes = _json_bytes(item_list)
+    item_list_path = Path(raw_dir, "item-list.json")
+    item_list_path.write_bytes(item_list_bytes)
+    responses.add_command(["--format", "json", "item", "list"] + vault_args,
+                          "item-list-large-vault", item_list_bytes)
+    responses.write()
+
+    manifest = {
+        "vault": generator.vault,
+        "seed": seed,
+        "response_directory": str(responses.path.resolve()),
+        "item_count": len(item_list),
+        "item_list_json": str(item_list_path),
+        "items_json": str(items_json_path),
+        "wide_items": wide_items,
+        "fields_per_wide_item": field_count,
+        "sections_per_wide_item": section_count,
+        "document": document,
+    }
+    with open(Path(output_dir, MANIFEST_JSON), "w") as f:
+        json.dump(manifest, f, indent=2)
+    return manifest
+
+
+def main():
+    args = large_vault_parse_args()
+    if not Path(RESP_DIRECTORY_PATH).exists():
+        print("Must be run from the root of the source tree", file=sys.stderr)
+        return 1
+    try:
+        manifest = generate_large_vault(args.output_dir,
+                                        vault_name=args.vault_name,
+                                        item_count=args.items,
+                                        wide_item_count=args.wide_items,
+                                        field_count=args.fields,
+                                        section_count=args.sections,
+                                        document_size=args.document_size,
+                                        all_categories=args.all_categories,
+                                        seed=args.seed)
+    except FileExistsError:
+        print(f"{args.output_dir} already exists", file=sys.stderr)
+        return 1
+    print(f"Generated {manifest['item_count']} items in '{args.vault_name}' at {args.output_dir}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
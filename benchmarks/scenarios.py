@@ -0,0 +1,176 @@
+"""
+Benchmark scenarios
+
+Each scenario performs untimed setup, then runs one timed operation per
+iteration inside instrumentation.timed()
+"""
+import json
+from typing import Callable, Dict, List
+
+from pyonepassword.api.object_types import OPItemList
+from pyonepassword.op_items._item_type_registry import OPItemFactory
+from tests.fixtures.paths import ITEM_EDIT_STATE_CONFIG_PATH
+
+from ._env import BenchmarkEnvironment
+from ._timing import Instrumentation, Sample
+
+ITEM_NAME = "Example Login 1"
+VAULT = "Test Data"
+DOCUMENT_NAME = "Example Login 2 - 1200px-SpongeBob_SquarePants_character.svg.png.webp"
+
+EDIT_ITEM_NAME = "Example Login Item 00"
+EDIT_VAULT = "Test Data 2"
+DELETE_MULTIPLE_VAULT = "Test Data 3"
+
+ScenarioFunc = Callable[[BenchmarkEnvironment, Instrumentation, int], List[Sample]]
+
+
+def bench_signin(env: BenchmarkEnvironment, instr: Instrumentation, iterations: int) -> List[Sample]:
+    samples: List[Sample] = []
+    for _ in range(iterations):
+        with instr.timed(samples):
+            env.signed_in_op()
+    return samples
+
+
+def bench_item_get(env: BenchmarkEnvironment, instr: Instrumentation, iterations: int) -> List[Sample]:
+    samples: List[Sample] = []
+    op = env.signed_in_op()
+    for _ in range(iterations):
+        with instr.timed(samples):
+            op.item_get(ITEM_NAME, vault=VAULT)
+    return samples
+
+
+def bench_item_list(env: BenchmarkEnvironment, instr: Instrumentation, iterations: int) -> List[Sample]:
+    samples: List[Sample] = []
+    op = env.signed_in_op()
+    for _ in range(iterations):
+        with instr.timed(samples):
+            op.item_list(vault=VAULT)
+    return samples
+
+
+def bench_document_get(env: BenchmarkEnvironment, instr: Instrumentation, iterations: int) -> List[Sample]:
+    samples: List[Sample] = []
+    op = env.signed_in_op()
+    for _ in range(iterations):
+        with instr.timed(samples):
+            op.document_get(DOCUMENT_NAME, vault=VAULT)
+    return samples
+
+
+def bench_item_edit_set_password(env: BenchmarkEnvironment, instr: Instrumentation, iterations: int) -> List[Sample]:
+    samples: List[Sample] = []
+    for _ in range(iterations):
+        # editing changes mock-op's state, so each iteration needs a fresh state config
+        with env.stateful(ITEM_EDIT_STATE_CONFIG_PATH):
+            op = env.signed_in_op()
+            with instr.timed(samples):
+                op.item_edit_set_password(EDIT_ITEM_NAME,
+                                          "new password",
+                                          field_label="password",
+                                          insecure_operation=True,
+                                          vault=EDIT_VAULT)
+    return samples
+
+
+def bench_item_delete_multiple(env: BenchmarkEnvironment, instr: Instrumentation, iterations: int) -> List[Sample]:
+    samples: List[Sample] = []
+    op = env.signed_in_op()
+    for _ in range(iterations):
+        # mock-op's default responses don't change as items get deleted
+        with instr.timed(samples):
+            op.item_delete_multiple(DELETE_MULTIPLE_VAULT)
+    return samples
+
+
+SCENARIOS: Dict[str, ScenarioFunc] = {
+    "signin": bench_signin,
+    "item_get": bench_item_get,
+    "item_list": bench_item_list,
+    "document_get": bench_document_get,
+    "item_edit_set_password": bench_item_edit_set_password,
+    "item_delete_multiple": bench_item_delete_multiple,
+}
+
+
+# Scenarios using a vault generated by benchmarks.large_vault
+# Those named parse_* don't run 'op' at all
+
+
+def bench_large_item_list(env: BenchmarkEnvironment, instr: Instrumentation, iterations: int) -> List[Sample]:
+    samples: List[Sample] = []
+    vault_name = env.large_vault["vault"]["name"]
+    with env.large_vault_responses():
+        op = env.signed_in_op()
+        for _ in range(iterations):
+            with instr.timed(samples):
+                op.item_list(vault=vault_name)
+    return samples
+
+
+def bench_large_item_get_wide(env: BenchmarkEnvironment, instr: Instrumentation, iterations: int) -> List[Sample]:
+    samples: List[Sample] = []
+    vault_name = env.large_vault["vault"]["name"]
+    title = env.large_vault["wide_items"][0]["title"]
+    with env.large_vault_responses():
+        op = env.signed_in_op()
+        for _ in range(iterations):
+            with instr.timed(samples):
+                op.item_get(title, vault=vault_name)
+    return samples
+
+
+def bench_large_document_get(env: BenchmarkEnvironment, instr: Instrumentation, iterations: int) -> List[Sample]:
+    samples: List[Sample] = []
+    vault_name = env.large_vault["vault"]["name"]
+    title = env.large_vault["document"]["title"]
+    with env.large_vault_responses():
+        op = env.signed_in_op()
+        for _ in range(iterations):
+            with instr.timed(samples):
+                op.document_get(title, vault=vault_name)
+    return samples
+
+
+def bench_parse_item_list(env: BenchmarkEnvironment, instr: Instrumentation, iterations: int) -> List[Sample]:
+    samples: List[Sample] = []
+    with open(env.large_vault["item_list_json"], "r") as f:
+        item_list_json = f.read()
+    for _ in range(iterations):
+        with instr.timed(samples):
+            OPItemList(item_list_json)
+    return samples
+
+
+def bench_parse_items(env: BenchmarkEnvironment, instr: Instrumentation, iterations: int) -> List[Sample]:
+    samples: List[Sample] = []
+    with open(env.large_vault["items_json"], "r") as f:
+        # each item as the JSON 'op item get' would return for it
+        item_json_list = [json.dumps(item_dict) for item_dict in json.load(f)]
+    for _ in range(iterations):
+        with instr.timed(samples):
+            for item_json in item_json_list:
+                OPItemFactory.op_item(item_json)
+    return samples
+
+
+def bench_parse_wide_item(env: BenchmarkEnvironment, instr: Instrumentation, iterations: int) -> List[Sample]:
+    samples: List[Sample] = []
+    with open(env.large_vault["wide_items"][0]["raw_json"], "r") as f:
+        item_json = f.read()
+    for _ in range(iterations):
+        with instr.timed(samples):
+            OPItemFactory.op_item(item_json)
+    return samples
+
+
+LARGE_VAULT_SCENARIOS: Dict[str, ScenarioFunc] = {
+    "large_item_list": bench_large_item_list,
+    "large_item_get_wide": bench_large_item_get_wide,
+    "large_document_get": bench_large_document_get,
+    "parse_item_list": bench_parse_item_list,
+    "parse_items": bench_parse_items,
+    "parse_wide_item": bench_parse_wide_item,
+}
@@ -12,4 +12,5 @@ from ._api_initializer import _API_INITIALIZED as _
 # or do:
 # __all__ = ["OP"]
 # https://mypy.readthedocs.io/en/stable/config_file.html?highlight=export#confval-implicit_reexport
+from .async_op import AsyncOP as AsyncOP
 from .pyonepassword import OP as OP
@@ -26,7 +26,14 @@ class ABCMetaDict(ABCMeta):
             # you must override this method, and then call this method via super()
     """
 
-    def __call__(cls, *args, **kwargs):
+    def __init__(cls, name, bases, namespace, **kwargs):
+        super().__init__(name, bases, namespace, **kwargs)
+        # A class's enforced methods can't change once it's created (much like
+        # ABCMeta's __abstractmethods__), so work them out once here rather
+        # than walking the MRO every time the class is instantiated
+        cls._abc_enforced_methods = cls._find_enforced_methods()
+
+    def _find_enforced_methods(cls) -> frozenset:
         enforced = set()
         unenforced = set()
 
@@ -53,7 +60,10 @@ class ABCMetaDict(ABCMeta):
                 else:
                     # this item isn't flagged as enforced, so add it to the unenforced list
                     unenforced.add(name)
+        return frozenset(enforced)
 
+    def __call__(cls, *args, **kwargs):
+        enforced = cls._abc_enforced_methods
         if enforced:
             raise TypeError("Can't instantiate abstract class {} "
                             "with enforced methods {}".format(
@@ -0,0 +1,297 @@
+"""
+An opt-in, persistent cache of the facts gathered about 'op' every time an OP object
+is created: the version of 'op', 'op account list' output, and the 'op' config
+
+Cached facts are keyed by the 'op' executable's path, size, and modification time, as
+well as the 'op' config's path and modification time, so a cache hit requires no
+'op' commands at all. If either changes, the facts are gathered from 'op' again
+"""
+from __future__ import annotations
+
+import os
+import pathlib
+import shutil
+import tempfile
+import threading
+import time
+from typing import Any, Dict, NamedTuple, Optional, Union
+
+from ._op_cli_config import OPCLIConfig
+from ._op_cli_version import OPCLIVersion
+from .account import OPAccountList
+from .json import safe_unjson, serialize_json
+
+FACTS_CACHE_FILENAME = "facts.json"
+# Number of seconds cached facts remain valid, even if 'op' and its config are unchanged
+# 'op account list' may also depend on the 1Password app, which can change without
+# any change to 'op' or its config
+DEFAULT_FACTS_CACHE_MAX_AGE = 86400.0
+
+# bump this if the cache file's format changes, so old files are ignored
+_FACTS_CACHE_FORMAT = 1
+
+_active_facts_cache: Optional[OPFactsCache] = None
+_active_lock = threading.Lock()
+
+
+class OPFacts(NamedTuple):
+    """
+    Facts about 'op' gathered when an OP object is created
+    """
+    cli_version: OPCLIVersion
+    account_list: OPAccountList
+    # None if there's no 'op' config, e.g., if 'op' uses the 1Password app for authentication
+    op_config: Optional[OPCLIConfig]
+
+
+class OPFactsCache:
+    """
+    A cache file holding facts about one or more 'op' executables
+
+    Rather than creating this directly, call enable_facts_cache() to have every new OP
+    object use the cache
+    """
+
+    def __init__(self,
+                 cache_path: Union[str, pathlib.Path, None] = None,
+                 max_age: Optional[float] = DEFAULT_FACTS_CACHE_MAX_AGE):
+        """
+        Create an OPFactsCache object
+
+        Parameters
+        ----------
+        cache_path : Union[str, pathlib.Path], optional
+            Path to the cache file, by default $XDG_CACHE_HOME/pyonepassword/facts.json,
+            or ~/.cache/pyonepassword/facts.json if XDG_CACHE_HOME isn't set
+        max_age : float, optional
+            Number of seconds cached facts remain valid, by default 24 hours
+            If None, cached facts remain valid until 'op' or its config changes
+        """
+        if cache_path is None:
+            cache_path = self.default_cache_path()
+        self._cache_path = pathlib.Path(cache_path)
+        self._max_age = max_age
+        self._lock = threading.Lock()
+
+    @classmethod
+    def default_cache_path(cls) -> pathlib.Path:
+        try:
+            cache_home = pathlib.Path(os.environ["XDG_CACHE_HOME"])
+        except KeyError:
+            cache_home = pathlib.Path(pathlib.Path.home(), ".cache")
+        cache_path = pathlib.Path(
+            cache_home, "pyonepassword", FACTS_CACHE_FILENAME)
+        return cache_path
+
+    @property
+    def cache_path(self) -> pathlib.Path:
+        return self._cache_path
+
+    @property
+    def max_age(self) -> Optional[float]:
+        return self._max_age
+
+    def load(self, op_path: str, svc_account: bool = False) -> Optional[OPFacts]:
+        """
+        Look up cached facts for the 'op' executable at 'op_path'
+
+        Parameters
+        ----------
+        op_path : str
+            Path to 'op', or the name of 'op' to look up in PATH
+        svc_account : bool, optional
+            Whether OP_SERVICE_ACCOUNT_TOKEN is set, by default False
+
+        Returns
+        -------
+        Optional[OPFacts]
+            The cached facts, or None if there are none, or they're out of date
+        """
+        try:
+            key = self._facts_key(op_path, svc_account)
+        except OSError:
+            # let the caller run 'op' and raise the appropriate exception
+            return None
+
+        entries = self._read_entries()
+        entry = entries.get(key["op_path"])
+        if not isinstance(entry, dict) or entry.get("key") != key:
+            return None
+
+        facts = None
+        try:
+            age = time.time() - entry["saved_at"]
+            if self._max_age is None or 0 <= age <= self._max_age:
+                facts = self._facts_from_entry(entry)
+        except (KeyError, TypeError, ValueError):
+            # the entry is malformed, so ignore it. It'll get replaced
+            pass
+        return facts
+
+    def save(self, op_path: str, facts: OPFacts, svc_account: bool = False):
+        """
+        Save facts for the 'op' executable at 'op_path', replacing any cached facts for it
+
+        Failure to write the cache file is not an error, since the facts can always
+        be gathered again
+
+        Parameters
+        ----------
+        op_path : str
+            Path to 'op', or the name of 'op' to look up in PATH
+        facts : OPFacts
+            The facts to save
+        svc_account : bool, optional
+            Whether OP_SERVICE_ACCOUNT_TOKEN is set, by default False
+        """
+        try:
+            key = self._facts_key(op_path, svc_account)
+        except OSError:  # pragma: no coverage
+            return
+
+        op_config = None
+        if facts.op_config is not None:
+            op_config = dict(facts.op_config)
+        entry = {
+            "key": key,
+            "saved_at": time.time(),
+            "cli_version": str(facts.cli_version),
+            "account_list": list(facts.account_list),
+            "op_config": op_config
+        }
+        with self._lock:
+            entries = self._read_entries()
+            entries[key["op_path"]] = entry
+            try:
+                self._write_entries(entries)
+            except OSError:
+                pass
+
+    def clear(self):
+        """
+        Delete the cache file, if it exists
+        """
+        with self._lock:
+            try:
+                os.unlink(self._cache_path)
+            except FileNotFoundError:
+                pass
+
+    def _facts_key(self, op_path: str, svc_account: bool) -> Dict[str, Any]:
+        # get fully-qualified path even if "op" was provided
+        resolved_op_path = shutil.which(op_path) or op_path
+        resolved_op_path = os.path.abspath(resolved_op_path)
+        op_stat = os.stat(resolved_op_path)
+
+        config_path = OPCLIConfig._get_config_path()
+        config_mtime = None
+        if config_path is not None:
+            try:
+                config_mtime = os.stat(config_path).st_mtime
+            except FileNotFoundError:  # pragma: no coverage
+                config_path = None
+
+        key = {
+            "op_path": resolved_op_path,
+            "op_size": op_stat.st_size,
+            "op_mtime": op_stat.st_mtime,
+            "config_path": str(config_path) if config_path is not None else None,
+            "config_mtime": config_mtime,
+            "svc_account": svc_account
+        }
+        return key
+
+    def _facts_from_entry(self, entry: Dict[str, Any]) -> OPFacts:
+        cli_version = OPCLIVersion(entry["cli_version"])
+        account_list = OPAccountList(entry["account_list"])
+        op_config = None
+        if entry["op_config"] is not None:
+            config_path = pathlib.Path(entry["key"]["config_path"])
+            op_config = OPCLIConfig._from_config_dict(
+                config_path, entry["op_config"])
+        facts = OPFacts(cli_version, account_list, op_config)
+        return facts
+
+    def _read_entries(self) -> Dict[str, Any]:
+        entries: Dict[str, Any] = {}
+        try:
+            with open(self._cache_path, "r") as f:
+                cache_dict = safe_unjson(f.read())
+        except (OSError, ValueError):
+            # missing, unreadable, or not JSON
+            return entries
+
+        if isinstance(cache_dict, dict) and cache_dict.get("format") == _FACTS_CACHE_FORMAT:
+            cached_entries = cache_dict.get("entries")
+            if isinstance(cached_entries, dict):
+                entries = cached_entries
+        return entries
+
+    def _write_entries(self, entries: Dict[str, Any]):
+        cache_dir = self._cache_path.parent
+        # account list & config include email addresses and account details
+        # so keep the cache private to this user
+        cache_dir.mkdir(mode=0o700, parents=True, exist_ok=True)
+        cache_json = serialize_json(
+            {"format": _FACTS_CACHE_FORMAT, "entries": entries})
+        # write to a temporary file and move it into place, so other processes never
+        # read a partially written cache file
+        # mkstemp() creates files only readable and writable by this user
+        fd, tmp_path = tempfile.mkstemp(dir=cache_dir, prefix=".facts-")
+        try:
+            with os.fdopen(fd, "w") as f:
+                f.write(cache_json)
+            os.replace(tmp_path, self._cache_path)
+        except BaseException:
+            os.unlink(tmp_path)
+            raise
+
+
+def enable_facts_cache(cache_path: Union[str, pathlib.Path, None] = None,
+                       max_age: Optional[float] = DEFAULT_FACTS_CACHE_MAX_AGE) -> OPFactsCache:
+    """
+    Enable the process-wide facts cache, so new OP objects skip running 'op' to gather
+    facts that are already cached
+
+    If the facts cache is already enabled, it is replaced
+
+    Parameters
+    ----------
+    cache_path : Union[str, pathlib.Path], optional
+        Path to the cache file, by default $XDG_CACHE_HOME/pyonepassword/facts.json,
+        or ~/.cache/pyonepassword/facts.json if XDG_CACHE_HOME isn't set
+    max_age : float, optional
+        Number of seconds cached facts remain valid, by default 24 hours
+        If None, cached facts remain valid until 'op' or its config changes
+
+    Returns
+    -------
+    OPFactsCache
+        The process-wide facts cache object
+    """
+    global _active_facts_cache
+    with _active_lock:
+        _active_facts_cache = OPFactsCache(
+            cache_path=cache_path, max_age=max_age)
+        return _active_facts_cache
+
+
+def disable_facts_cache():
+    """
+    Disable the process-wide facts cache. The cache file is left as is
+    """
+    global _active_facts_cache
+    with _active_lock:
+        _active_facts_cache = None
+
+
+def get_facts_cache() -> Optional[OPFactsCache]:
+    """
+    Get the process-wide facts cache object, if the facts cache is enabled
+
+    Returns
+    -------
+    Optional[OPFactsCache]
+        The process-wide facts cache object, or None if the facts cache is not enabled
+    """
+    return _active_facts_cache
@@ -0,0 +1,210 @@
+"""
+Process-wide metrics about pyonepassword's use of 'op', exportable in
+Prometheus text format
+"""
+from __future__ import annotations
+
+import os
+import tempfile
+import threading
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple, Union
+
+from ._op_cli import _OPCLIExecute
+from ._op_cli_observer import OPCommandObserver, OPCommandRecord
+
+METRIC_PREFIX = "pyonepassword"
+
+# name, help text for each metric
+_COMMANDS_TOTAL = ("op_commands_total",
+                   "Number of 'op' processes spawned, by command")
+_COMMAND_SECONDS = ("op_command_seconds_total",
+                    "Cumulative wall time spent in 'op' processes, by command")
+_COMMAND_FAILURES = ("op_command_failures_total",
+                     "Number of 'op' processes that exited non-zero, by command")
+_COMMAND_TIMEOUTS = ("op_command_timeouts_total",
+                     "Number of 'op' processes killed after timing out, by command")
+_AUTH_CHECKS = ("auth_checks_total",
+                "Number of 'op whoami' authentication preflight checks")
+_VERSION_CHECKS = ("version_checks_total",
+                   "Number of 'op --version' checks")
+_VERSION_CACHE_HITS = ("version_check_cache_hits_total",
+                       "Number of 'op' version checks satisfied from cache")
+_VERSION_CACHE_MISSES = ("version_check_cache_misses_total",
+                         "Number of 'op' version checks that had to verify the version of 'op'")
+_ITEM_PARSES = ("item_parses_total",
+                "Number of item objects parsed by OPItemFactory.op_item()")
+_ITEM_PARSE_SECONDS = ("item_parse_seconds_total",
+                       "Cumulative time spent parsing item objects in OPItemFactory.op_item()")
+
+_active_metrics: Optional[OPMetrics] = None
+_active_lock = threading.Lock()
+
+
+def _escape_label_value(value: str) -> str:
+    value = value.replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+    return value
+
+
+def _format_value(value: Union[int, float]) -> str:
+    if isinstance(value, float):
+        return repr(value)
+    return str(value)
+
+
+class OPMetrics(OPCommandObserver):
+    """
+    Counters describing pyonepassword's use of 'op'
+
+    Rather than creating this directly, call enable_metrics() to get the process-wide
+    instance, which is registered to observe every 'op' command
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._per_command: Dict[Tuple[str, str], Union[int, float]] = {}
+        self._counters: Dict[Tuple[str, str], Union[int, float]] = {}
+
+    def command_finished(self, record: OPCommandRecord):
+        command = " ".join([record.command or ""] + record.subcommands).strip()
+        if not command:
+            # e.g., 'op --version'
+            command = "(none)"
+        with self._lock:
+            self._inc_per_command(_COMMANDS_TOTAL, command, 1)
+            self._inc_per_command(_COMMAND_SECONDS, command, record.wall_time)
+            if record.returncode is None:
+                self._inc_per_command(_COMMAND_TIMEOUTS, command, 1)
+            elif record.returncode != 0:
+                self._inc_per_command(_COMMAND_FAILURES, command, 1)
+            if record.auth_preflight:
+                self._inc(_AUTH_CHECKS, 1)
+            if record.version_check:
+                self._inc(_VERSION_CHECKS, 1)
+
+    def version_check_cached(self, hit: bool):
+        with self._lock:
+            self._inc(_VERSION_CACHE_HITS if hit else _VERSION_CACHE_MISSES, 1)
+
+    def item_parsed(self, seconds: float):
+        with self._lock:
+            self._inc(_ITEM_PARSES, 1)
+            self._inc(_ITEM_PARSE_SECONDS, seconds)
+
+    def reset(self):
+        """
+        Reset all counters to zero
+        """
+        with self._lock:
+            self._per_command.clear()
+            self._counters.clear()
+
+    def prometheus_text(self) -> str:
+        """
+        Render all metrics in the Prometheus text exposition format
+
+        Returns
+        -------
+        str
+            The rendered metrics
+        """
+        with self._lock:
+            per_command = dict(self._per_command)
+            counters = dict(self._counters)
+
+        lines: List[str] = []
+        for metric in [_COMMANDS_TOTAL, _COMMAND_SECONDS, _COMMAND_FAILURES, _COMMAND_TIMEOUTS]:
+            samples = sorted((command, value) for (name, command), value in per_command.items()
+                             if name == metric[0])
+            self._header(lines, metric)
+            for command, value in samples:
+                lines.append(
+                    f'{METRIC_PREFIX}_{metric[0]}{{command="{_escape_label_value(command)}"}} {_format_value(value)}')
+
+        for metric in [_AUTH_CHECKS, _VERSION_CHECKS, _VERSION_CACHE_HITS, _VERSION_CACHE_MISSES,
+                       _ITEM_PARSES, _ITEM_PARSE_SECONDS]:
+            self._header(lines, metric)
+            value = counters.get(metric, 0)
+            lines.append(f"{METRIC_PREFIX}_{metric[0]} {_format_value(value)}")
+
+        text = "\n".join(lines) + "\n"
+        return text
+
+    def write_prometheus(self, path: Union[str, Path]):
+        """
+        Write all metrics in the Prometheus text exposition format to a file, such as for
+        node_exporter's textfile collector
+
+        The file is replaced atomically, so readers never see a partially written file
+
+        Parameters
+        ----------
+        path : Union[str, Path]
+            The file to write
+        """
+        path = Path(path)
+        text = self.prometheus_text()
+        fd, tmp_path = tempfile.mkstemp(dir=path.parent, prefix=f".{path.name}.")
+        try:
+            with os.fdopen(fd, "w") as f:
+                f.write(text)
+            # mkstemp() creates files only readable by their owner, but
+            # metrics are typically collected by some other user
+            os.chmod(tmp_path, 0o644)
+            os.replace(tmp_path, path)
+        except BaseException:
+            os.unlink(tmp_path)
+            raise
+
+    def _inc_per_command(self, metric, command, value):
+        key = (metric[0], command)
+        self._per_command[key] = self._per_command.get(key, 0) + value
+
+    def _inc(self, metric, value):
+        self._counters[metric] = self._counters.get(metric, 0) + value
+
+    def _header(self, lines, metric):
+        name, help_text = metric
+        lines.append(f"# HELP {METRIC_PREFIX}_{name} {help_text}")
+        lines.append(f"# TYPE {METRIC_PREFIX}_{name} counter")
+
+
+def enable_metrics() -> OPMetrics:
+    """
+    Start collecting process-wide metrics, if not already collecting them
+
+    Returns
+    -------
+    OPMetrics
+        The process-wide metrics object
+    """
+    global _active_metrics
+    with _active_lock:
+        if _active_metrics is None:
+            metrics = OPMetrics()
+            _OPCLIExecute.add_command_observer(metrics)
+            _active_metrics = metrics
+        return _active_metrics
+
+
+def disable_metrics():
+    """
+    Stop collecting process-wide metrics. Metrics collected so far are discarded
+    """
+    global _active_metrics
+    with _active_lock:
+        if _active_metrics is not None:
+            _OPCLIExecute.remove_command_observer(_active_metrics)
+            _active_metrics = None
+
+
+def get_metrics() -> Optional[OPMetrics]:
+    """
+    Get the process-wide metrics object, if metrics are enabled
+
+    Returns
+    -------
+    Optional[OPMetrics]
+        The process-wide metrics object, or None if metrics are not enabled
+    """
+    return _active_metrics
@@ -1,10 +1,18 @@
+import asyncio
 import logging
+import os
+import signal
 import subprocess
+import threading
+import time
 from os import environ
+from typing import IO, Any, Callable, Dict, Iterator, Optional, Tuple
 
+from ._op_cli_observer import OPCommandObserver, _command_record
 from .py_op_exceptions import (
     OPCLIPanicException,
     OPCmdFailedException,
+    OPCommandTimeoutException,
     OPNotFoundException,
     OPRevokedSvcAcctTokenException
 )
@@ -12,6 +20,18 @@ from .py_op_exceptions import (
 # Mainly for use in automated testing
 LOG_OP_ERR_ENV_NAME = "LOG_OP_ERR"
 
+# Number of bytes at a time to write to 'op' when streaming its input
+INPUT_CHUNK_SIZE = 64 * 1024
+
+# Called with 'op''s stdout pipe while 'op' is still running, returning whatever
+# the command's output should be
+StdoutConsumer = Callable[[IO[bytes]], Any]
+
+# On POSIX systems, 'op' commands that have a timeout, or that stream their input
+# or output, are started in their own process group, so if they have to be killed,
+# any processes they started can be killed too
+_KILL_PROCESS_GROUP = os.name == "posix"
+
 """
 Module to hold stuff that interacts directly with 'op' or its config
 
@@ -19,6 +39,78 @@ TODO: Move other code that closely touches 'op' here
 """
 
 
+class _CountingReader:
+    """
+    Binary file-like wrapper around a pipe that counts the bytes read through it
+
+    Reads return whatever is available, up to 'size' bytes, rather than waiting
+    for 'size' bytes to be written
+    """
+
+    def __init__(self, pipe):
+        self._pipe = pipe
+        self.bytes_read = 0
+
+    def read(self, size: int = -1) -> bytes:
+        data = self._pipe.read1(size)
+        self.bytes_read += len(data)
+        return data
+
+    def drain(self, chunk_size: int = INPUT_CHUNK_SIZE):
+        # read & discard everything that's left
+        while self.read(chunk_size):
+            pass
+
+
+class _ProcessWatchdog:
+    """
+    Kill a process, using 'kill', if it's still running after 'timeout' seconds
+
+    Waiting for the process with wait() stops the watchdog before the process is
+    reaped, so a process that's already exited, or its reused process ID, is never
+    killed
+    """
+
+    def __init__(self, proc, timeout: Optional[float], kill: Callable[[Any], None]):
+        self._proc = proc
+        self._kill = kill
+        self._lock = threading.Lock()
+        self._finished = False
+        self._killed = False
+        self._timer = None
+        if timeout is not None:
+            self._timer = threading.Timer(timeout, self._on_timeout)
+            self._timer.start()
+
+    def _on_timeout(self):
+        with self._lock:
+            if not self._finished and self._proc.poll() is None:
+                self._killed = True
+                self._kill(self._proc)
+
+    def wait(self) -> int:
+        if hasattr(os, "waitid"):
+            try:
+                # wait for the process to exit without reaping it, so its
+                # process ID can't be reused until the watchdog is stopped
+                os.waitid(os.P_PID, self._proc.pid,
+                          os.WEXITED | os.WNOWAIT)
+            except ChildProcessError:
+                # already reaped by the watchdog's poll()
+                pass
+        with self._lock:
+            self._finished = True
+        if self._timer is not None:
+            self._timer.cancel()
+        return self._proc.wait()
+
+    def timed_out(self, returncode: int) -> bool:
+        # only if the process was killed by the watchdog, rather than exiting
+        # on its own just as the timeout expired
+        killed_status = returncode < 0 if _KILL_PROCESS_GROUP else True
+        return self._killed and killed_status
+
+
 class _OPCLIExecute:
     # we need to detect if a command failure was actually a mock-op failure
     MOCK_OP_ERR_EXIT = 255
@@ -27,6 +119,8 @@ class _OPCLIExecute:
     SVC_ACCT_REVOKED_MSG = "The Service Account used in this integration has been deleted"
     logger = logging.getLogger("_OPCLIExecute")
     logger.setLevel(logging.INFO)
+    # process-wide, see add_command_observer()
+    _observers: Tuple[OPCommandObserver, ...] = ()
 
     def __new__(cls, *args, logger=None, **kwargs):
         if logger:
@@ -50,8 +144,116 @@ class _OPCLIExecute:
         return should_log
 
     @classmethod
-    def _run_raw(cls, argv, input=None, capture_stdout=False, ignore_error=False, env=environ):
+    def _check_returncode(cls, argv, returncode, stdout, stderr):
+        # raise the appropriate exception if 'op' exited with an error
+        # shared by the synchronous and asyncio code paths
+        if returncode == 0:
+            return
+
+        err = subprocess.CalledProcessError(returncode, argv, stdout, stderr)
+        stderr_output = stderr.decode("utf-8").rstrip()
+        if cls._should_log_op_errors():
+            cls.logger.error(f"'op' command error: {stderr_output}")
+        # HACK:
+        # mock-op returns -1 (i.e., 255) if it can't find a response
+        # but op (currently) only ever returns 1 on error
+        #
+        # we need to check if this was a mock-op failure so that during
+        # testing we can distinguish between a simulated 'op' command failure
+        # and mock-op failing because we haven't provided an appropriate response
+        # definition
+        if (returncode >= cls.MOCK_OP_ERR_EXIT and
+                cls.MOCK_OP_RESP_ERR_MSG in stderr_output):  # pragma: no coverage
+            raise err
+        elif cls.GO_RUNTIME_PANIC_MSG in stderr_output:
+            # If we made 'op' crash, raise a special exception
+            raise OPCLIPanicException(stderr_output, returncode, argv)
+        elif cls.SVC_ACCT_REVOKED_MSG in stderr_output:
+            # do this unconditionally without checking if we're authed as
+            # a service account
+            # in case caller is accidentally running with OP_SERVICE_ACCOUNT_TOKEN
+            raise OPRevokedSvcAcctTokenException(
+                stderr_output, returncode)
+
+        raise OPCmdFailedException(stderr_output, returncode) from err
+
+    @classmethod
+    def add_command_observer(cls, observer: OPCommandObserver):
+        """
+        Register an observer to be notified after every 'op' command pyonepassword runs
+
+        Observers are process-wide, not specific to any one OP object
+
+        Parameters
+        ----------
+        observer : OPCommandObserver
+            The observer to register
+        """
+        # replace rather than mutate, so commands running on other threads
+        # can safely iterate over whatever was registered when they started
+        _OPCLIExecute._observers = _OPCLIExecute._observers + (observer,)
+
+    @classmethod
+    def remove_command_observer(cls, observer: OPCommandObserver):
+        """
+        Unregister a previously registered observer
+
+        Parameters
+        ----------
+        observer : OPCommandObserver
+            The observer to unregister
+        """
+        _OPCLIExecute._observers = tuple(
+            obs for obs in _OPCLIExecute._observers if obs is not observer)
+
+    @classmethod
+    def _notify_observers(cls, observers, argv, start, returncode, stdout, stderr, stdout_bytes=None):
+        wall_time = time.perf_counter() - start
+        record = _command_record(argv, wall_time, returncode, stdout, stderr,
+                                 stdout_bytes=stdout_bytes)
+        for observer in observers:
+            try:
+                observer.command_finished(record)
+            except Exception:
+                # a broken observer shouldn't break the caller's 1Password operation
+                cls.logger.warning(
+                    f"Command observer {observer!r} raised an exception", exc_info=True)
+
+    @classmethod
+    def _run_raw(cls, argv, input=None, capture_stdout=False, ignore_error=False, env=environ, timeout=None,
+                 stdout_consumer: Optional[StdoutConsumer] = None):
+        if stdout_consumer is not None:
+            return cls._run_raw_consuming_stdout(argv, input, stdout_consumer,
+                                                 ignore_error=ignore_error, env=env, timeout=timeout)
         stdout = subprocess.PIPE if capture_stdout else None
+        observers = _OPCLIExecute._observers
+        if not observers:
+            stdout, stderr, returncode = cls._run_process(
+                argv, input, stdout, env, timeout)
+        else:
+            start = time.perf_counter()
+            try:
+                stdout, stderr, returncode = cls._run_process(
+                    argv, input, stdout, env, timeout)
+            except OPCommandTimeoutException:
+                cls._notify_observers(observers, argv, start, None, None, None)
+                raise
+            cls._notify_observers(observers, argv, start,
+                                  returncode, stdout, stderr)
+
+        if not ignore_error:
+            cls._check_returncode(argv, returncode, stdout, stderr)
+
+        return (stdout, stderr, returncode)
+
+    @classmethod
+    def _run_process(cls, argv, input, stdout, env, timeout):
+        if input is not None and not isinstance(input, (str, bytes)):
+            # a file-like object or an iterable of chunks to stream to 'op'
+            return cls._run_raw_streaming_input(argv, input, stdout, env, timeout=timeout)
+        if timeout is not None:
+            return cls._run_raw_with_timeout(argv, input, stdout, env, timeout)
+
         if input:
             if isinstance(input, str):
                 input = input.encode("utf-8")
@@ -59,60 +261,317 @@ class _OPCLIExecute:
         _ran = subprocess.run(
             argv, input=input, stderr=subprocess.PIPE, stdout=stdout, env=env)
 
-        stdout = _ran.stdout
-        stderr = _ran.stderr
-        returncode = _ran.returncode
+        return (_ran.stdout, _ran.stderr, _ran.returncode)
 
-        if not ignore_error:
+    @classmethod
+    def _input_chunks(cls, input, chunk_size=INPUT_CHUNK_SIZE) -> Iterator[bytes]:
+        # yield chunks of bytes from either a file-like object or an iterable
+        if hasattr(input, "read"):
+            chunks = iter(lambda: input.read(chunk_size), input.read(0))
+        else:
+            chunks = iter(input)
+        for chunk in chunks:
+            if isinstance(chunk, str):
+                chunk = chunk.encode("utf-8")
+            if chunk:
+                yield chunk
+
+    @classmethod
+    def _kill_process_group(cls, proc):
+        # kill a timed out 'op' process, along with any processes it started
+        # 'proc' may be either a subprocess.Popen or an asyncio.subprocess.Process
+        if proc.returncode is not None:
+            return
+        try:
+            if _KILL_PROCESS_GROUP:
+                os.killpg(proc.pid, signal.SIGKILL)
+            else:  # pragma: no coverage
+                proc.kill()
+        except ProcessLookupError:  # pragma: no coverage
+            # already exited
+            pass
+
+    @classmethod
+    def _run_raw_with_timeout(cls, argv, input, stdout, env, timeout):
+        # like subprocess.run(timeout=...), but kill the whole process group
+        # rather than just 'op' itself
+        if isinstance(input, str):
+            input = input.encode("utf-8")
+        stdin = subprocess.PIPE if input else None
+
+        with subprocess.Popen(argv,
+                              stdin=stdin,
+                              stdout=stdout,
+                              stderr=subprocess.PIPE,
+                              env=env,
+                              start_new_session=_KILL_PROCESS_GROUP) as proc:
             try:
-                _ran.check_returncode()
-            except subprocess.CalledProcessError as err:
-                stderr_output = stderr.decode("utf-8").rstrip()
-                if cls._should_log_op_errors():
-                    cls.logger.error(f"'op' command error: {stderr_output}")
-                # HACK:
-                # mock-op returns -1 (i.e., 255) if it can't find a response
-                # but op (currently) only ever returns 1 on error
-                #
-                # we need to check if this was a mock-op failure so that during
-                # testing we can distinguish between a simulated 'op' command failure
-                # and mock-op failing because we haven't provided an appropriate response
-                # definition
-                if (returncode >= cls.MOCK_OP_ERR_EXIT and
-                        cls.MOCK_OP_RESP_ERR_MSG in stderr_output):  # pragma: no coverage
-                    raise err
-                elif cls.GO_RUNTIME_PANIC_MSG in stderr_output:
-                    # If we made 'op' crash, raise a special exception
-                    raise OPCLIPanicException(stderr_output, returncode, argv)
-                elif cls.SVC_ACCT_REVOKED_MSG in stderr_output:
-                    # do this unconditionally without checking if we're authed as
-                    # a service account
-                    # in case caller is accidentally running with OP_SERVICE_ACCOUNT_TOKEN
-                    raise OPRevokedSvcAcctTokenException(
-                        stderr_output, returncode)
-
-                raise OPCmdFailedException(stderr_output, returncode) from err
+                stdout, stderr = proc.communicate(
+                    input=input or None, timeout=timeout)
+            except subprocess.TimeoutExpired as err:
+                cls.logger.error(
+                    f"'op' command timed out after {timeout} seconds: {argv.cmd_str()}")
+                cls._kill_process_group(proc)
+                proc.communicate()
+                raise OPCommandTimeoutException(argv, timeout) from err
+            except BaseException:
+                # e.g., KeyboardInterrupt. 'op' is in its own process group,
+                # so it didn't get the signal, and we can't leave it running
+                cls._kill_process_group(proc)
+                raise
+            returncode = proc.returncode
 
         return (stdout, stderr, returncode)
 
     @classmethod
-    def _run(cls, argv, capture_stdout=False, input=None, decode=None, env=environ):
+    def _run_raw_streaming_input(cls, argv, input, stdout, env, timeout=None):
+        # like subprocess.run(input=...), but write input to 'op' a chunk at a time
+        # rather than requiring it all in memory at once
+        outputs: Dict[str, bytes] = {}
+
+        def _drain(name, pipe):
+            outputs[name] = pipe.read()
+
+        with subprocess.Popen(argv,
+                              stdin=subprocess.PIPE,
+                              stdout=stdout,
+                              stderr=subprocess.PIPE,
+                              env=env,
+                              start_new_session=_KILL_PROCESS_GROUP) as proc:
+            # we may be blocked writing to 'op' when the timeout expires,
+            # so kill it from another thread, which also unblocks us
+            watchdog = _ProcessWatchdog(proc, timeout, cls._kill_process_group)
+            # read stdout & stderr on other threads, so 'op' can't get blocked
+            # writing to them while we're blocked writing to its stdin
+            threads = [threading.Thread(
+                target=_drain, args=("stderr", proc.stderr))]
+            if proc.stdout is not None:
+                threads.append(threading.Thread(
+                    target=_drain, args=("stdout", proc.stdout)))
+            for thread in threads:
+                thread.start()
+            try:
+                for chunk in cls._input_chunks(input):
+                    proc.stdin.write(chunk)
+            except BrokenPipeError:
+                # 'op' exited without reading all of its input
+                # its exit status & error output will say why
+                pass
+            except BaseException:
+                # reading our input failed partway through, e.g., an OSError reading
+                # a file, or KeyboardInterrupt. kill 'op' before closing its stdin,
+                # so it never sees a normal end of input and acts on truncated input
+                cls._kill_process_group(proc)
+                watchdog.wait()
+                raise
+            finally:
+                try:
+                    proc.stdin.close()
+                except BrokenPipeError:  # pragma: no coverage
+                    pass
+                for thread in threads:
+                    thread.join()
+            returncode = watchdog.wait()
+
+        if watchdog.timed_out(returncode):
+            cls.logger.error(
+                f"'op' command timed out after {timeout} seconds: {argv.cmd_str()}")
+            raise OPCommandTimeoutException(argv, timeout)
+
+        return (outputs.get("stdout"), outputs["stderr"], returncode)
+
+    @classmethod
+    def _run_raw_consuming_stdout(cls, argv, input, stdout_consumer, ignore_error=False, env=environ, timeout=None):
+        # like _run_raw(capture_stdout=True), but the command's output is whatever
+        # 'stdout_consumer' returns after reading 'op''s stdout as it's written
+        observers = _OPCLIExecute._observers
+        start = time.perf_counter()
+        try:
+            output, stdout_bytes, consumer_err, stderr, returncode = cls._run_raw_streaming_output(
+                argv, input, stdout_consumer, env, timeout=timeout)
+        except OPCommandTimeoutException:
+            if observers:
+                cls._notify_observers(observers, argv, start, None, None, None)
+            raise
+        if observers:
+            cls._notify_observers(observers, argv, start, returncode, None, stderr,
+                                  stdout_bytes=stdout_bytes)
+
+        if not ignore_error:
+            # if 'op' failed, that's likely why the consumer failed too
+            cls._check_returncode(argv, returncode, None, stderr)
+        if consumer_err is not None:
+            raise consumer_err
+
+        return (output, stderr, returncode)
+
+    @classmethod
+    def _run_raw_streaming_output(cls, argv, input, stdout_consumer, env, timeout=None):
+        # hand 'op''s stdout pipe to 'stdout_consumer' while 'op' is still running,
+        # rather than waiting to collect all of its output
+        # returns (consumer's result, number of stdout bytes, consumer's exception,
+        #          stderr, returncode)
+        outputs: Dict[str, bytes] = {}
+        if isinstance(input, str):
+            input = input.encode("utf-8")
+
+        def _drain(name, pipe):
+            outputs[name] = pipe.read()
+
+        def _write_input(pipe):
+            try:
+                pipe.write(input)
+            except BrokenPipeError:
+                # 'op' exited without reading all of its input
+                # its exit status & error output will say why
+                pass
+            finally:
+                try:
+                    pipe.close()
+                except BrokenPipeError:  # pragma: no coverage
+                    pass
+
+        with subprocess.Popen(argv,
+                              stdin=subprocess.PIPE if input else None,
+                              stdout=subprocess.PIPE,
+                              stderr=subprocess.PIPE,
+                              env=env,
+                              start_new_session=_KILL_PROCESS_GROUP) as proc:
+            watchdog = _ProcessWatchdog(proc, timeout, cls._kill_process_group)
+            # write stdin & read stderr on other threads, so 'op' can't get blocked on
+            # either of them while we're reading its stdout
+            threads = [threading.Thread(
+                target=_drain, args=("stderr", proc.stderr))]
+            if input:
+                threads.append(threading.Thread(
+                    target=_write_input, args=(proc.stdin,)))
+            for thread in threads:
+                thread.start()
+            stdout = _CountingReader(proc.stdout)
+            output = None
+            consumer_err = None
+            try:
+                output = stdout_consumer(stdout)
+            except Exception as e:
+                # if 'op' failed partway through its output, its exit status
+                # & error output will say why, so check those before re-raising
+                consumer_err = e
+            except BaseException:
+                # e.g., KeyboardInterrupt. 'op' is in its own process group,
+                # so it didn't get the signal, and we can't leave it running
+                cls._kill_process_group(proc)
+                watchdog.wait()
+                raise
+            finally:
+                # read anything the consumer didn't, so 'op' isn't blocked writing to us
+                stdout.drain()
+                for thread in threads:
+                    thread.join()
+            returncode = watchdog.wait()
+
+        if watchdog.timed_out(returncode):
+            cls.logger.error(
+                f"'op' command timed out after {timeout} seconds: {argv.cmd_str()}")
+            raise OPCommandTimeoutException(argv, timeout)
+
+        return (output, stdout.bytes_read, consumer_err, outputs["stderr"], returncode)
+
+    @classmethod
+    def _run(cls, argv, capture_stdout=False, input=None, decode=None, env=environ, timeout=None,
+             stdout_consumer: Optional[StdoutConsumer] = None):
+        # if 'stdout_consumer' is provided, 'op''s output is whatever it returns
         cls.logger.debug(f"Running: {argv.cmd_str()}")
         output = None
         try:
             output, _, _ = cls._run_raw(
-                argv, input=input, capture_stdout=capture_stdout, env=env)
-            if decode and output is not None:
+                argv, input=input, capture_stdout=capture_stdout, env=env, timeout=timeout,
+                stdout_consumer=stdout_consumer)
+            if decode and output is not None and stdout_consumer is None:
                 output = output.decode(decode)
         except FileNotFoundError as err:
+            cls._log_op_not_found(argv)
+            raise OPNotFoundException(argv[0], err.errno) from err
+
+        return output
+
+    @classmethod
+    async def _run_raw_async(cls, argv, input=None, capture_stdout=False, ignore_error=False, env=environ, timeout=None):
+        # asyncio counterpart to _run_raw()
+        observers = _OPCLIExecute._observers
+        if not observers:
+            stdout, stderr, returncode = await cls._run_process_async(
+                argv, input, capture_stdout, env, timeout)
+        else:
+            start = time.perf_counter()
+            try:
+                stdout, stderr, returncode = await cls._run_process_async(
+                    argv, input, capture_stdout, env, timeout)
+            except OPCommandTimeoutException:
+                cls._notify_observers(observers, argv, start, None, None, None)
+                raise
+            cls._notify_observers(observers, argv, start,
+                                  returncode, stdout, stderr)
+
+        if not ignore_error:
+            cls._check_returncode(argv, returncode, stdout, stderr)
+
+        return (stdout, stderr, returncode)
+
+    @classmethod
+    async def _run_process_async(cls, argv, input, capture_stdout, env, timeout):
+        stdout_pipe = asyncio.subprocess.PIPE if capture_stdout else None
+        stdin_pipe = None
+        if input:
+            if isinstance(input, str):
+                input = input.encode("utf-8")
+            stdin_pipe = asyncio.subprocess.PIPE
+        else:
+            input = None
+
+        new_session = timeout is not None and _KILL_PROCESS_GROUP
+        proc = await asyncio.create_subprocess_exec(
+            *argv, stdin=stdin_pipe, stdout=stdout_pipe, stderr=asyncio.subprocess.PIPE, env=env,
+            start_new_session=new_session)
+        try:
+            stdout, stderr = await asyncio.wait_for(proc.communicate(input=input), timeout)
+        except asyncio.TimeoutError as err:
             cls.logger.error(
-                "1Password 'op' command not found at: {}".format(argv[0]))
-            cls.logger.error(
-                "See https://developer.1password.com/docs/cli for more information")
+                f"'op' command timed out after {timeout} seconds: {argv.cmd_str()}")
+            cls._kill_process_group(proc)
+            await proc.wait()
+            raise OPCommandTimeoutException(argv, timeout) from err
+        except asyncio.CancelledError:
+            # don't leave 'op' running if the caller gave up on it
+            if proc.returncode is None:
+                proc.kill()
+                await proc.wait()
+            raise
+
+        return (stdout, stderr, proc.returncode)
+
+    @classmethod
+    async def _run_async(cls, argv, capture_stdout=False, input=None, decode=None, env=environ, timeout=None):
+        # asyncio counterpart to _run()
+        cls.logger.debug(f"Running: {argv.cmd_str()}")
+        output = None
+        try:
+            output, _, _ = await cls._run_raw_async(
+                argv, input=input, capture_stdout=capture_stdout, env=env, timeout=timeout)
+            if decode and output is not None:
+                output = output.decode(decode)
+        except FileNotFoundError as err:
+            cls._log_op_not_found(argv)
             raise OPNotFoundException(argv[0], err.errno) from err
 
         return output
 
+    @classmethod
+    def _log_op_not_found(cls, argv):
+        cls.logger.error(
+            "1Password 'op' command not found at: {}".format(argv[0]))
+        cls.logger.error(
+            "See https://developer.1password.com/docs/cli for more information")
+
     @classmethod
     def set_logger(cls, logger: logging.Logger):
         cls.logger = logger
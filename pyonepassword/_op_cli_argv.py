@@ -15,6 +15,7 @@ class _OPArgv(list):
     The primary purpose of this class is to facilitate the 'mock-op' project's automated response generation,
     as it allows the preciese set of command line arguments to be captured for later playback.
     """
+    READ_ONLY_SUBCOMMANDS = ("get", "list")
 
     def __init__(self,
                  op_exe: str,
@@ -69,6 +70,14 @@ class _OPArgv(list):
         cmd_str = shlex.join(args)
         return cmd_str
 
+    def is_read_only(self) -> bool:
+        """
+        Whether this is a 'get' or 'list' operation, which is safe to repeat
+        """
+        read_only = bool(
+            self.subcommands) and self.subcommands[-1] in self.READ_ONLY_SUBCOMMANDS
+        return read_only
+
     def svc_account_supported(self) -> OPSvcAcctSupportCode:
         # OPSvcAcctSupportRegistry is a singleton
         # so this is fine
@@ -77,25 +86,55 @@ class _OPArgv(list):
         return supported
 
     @classmethod
-    def document_get_argv(cls, op_exe, document_name_or_id, vault=None, include_archive=False):
+    def document_get_argv(cls, op_exe, document_name_or_id, vault=None, include_archive=False, out_file=None):
 
         sub_cmd_args = [document_name_or_id]
         if vault:
             sub_cmd_args.extend(["--vault", vault])
         if include_archive:
             sub_cmd_args.append("--include-archive")
+        if out_file:
+            # --force keeps 'op' from interactively prompting
+            # if out_file already exists
+            sub_cmd_args.extend(["--out-file", str(out_file), "--force"])
         argv = cls._document_generic_argv(op_exe, "get", sub_cmd_args)
         return argv
 
+    @classmethod
+    def document_create_argv(cls,
+                             op_exe,
+                             file_path=None,
+                             title=None,
+                             file_name=None,
+                             vault=None,
+                             tags=None):
+        # without a path to the document, it's provided on stdin
+        sub_cmd_args = [file_path if file_path else "-"]
+
+        if title:
+            sub_cmd_args.extend(["--title", title])
+        if file_name:
+            sub_cmd_args.extend(["--file-name", file_name])
+        if vault:
+            sub_cmd_args.extend(["--vault", vault])
+        if tags:
+            sub_cmd_args.extend(["--tags", ",".join(tags)])
+        argv = cls._document_generic_argv(op_exe, "create", sub_cmd_args)
+        return argv
+
     @classmethod
     def document_edit_argv(cls,
                            op_exe,
                            document_identifier,
+                           file_path=None,
                            file_name=None,
                            new_title=None,
                            vault=None):
 
         sub_cmd_args = [document_identifier]
+        # without a path to the document, it's provided on stdin
+        if file_path:
+            sub_cmd_args.append(file_path)
 
         if file_name:
             sub_cmd_args.extend(["--file-name", file_name])
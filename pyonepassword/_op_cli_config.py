@@ -1,9 +1,11 @@
-import json
+from __future__ import annotations
+
 import os
 import pathlib
 from json.decoder import JSONDecodeError
 from typing import List, Optional
 
+from .json import safe_unjson
 from .py_op_exceptions import OPConfigNotFoundException
 
 
@@ -57,12 +59,28 @@ class OPCLIConfig(dict):
                 "Permission denied accessing op config at path: {}".format(configpath)) from e
 
         try:
-            config = json.loads(config_json)
+            config = safe_unjson(config_json)
             self.update(config)
         except JSONDecodeError as e:
             raise OPConfigNotFoundException(
                 "Unable to json decode config at path: {}".format(configpath)) from e
 
+        self._initialize_accounts()
+
+    @classmethod
+    def _from_config_dict(cls, configpath: pathlib.Path, config_dict: dict) -> OPCLIConfig:
+        """
+        Create an OPCLIConfig object from an already-parsed config, such as one
+        from the facts cache, rather than reading it from 'configpath'
+        """
+        config = cls.__new__(cls)
+        super(OPCLIConfig, config).__init__(config_dict)
+        config.configpath = configpath
+        config._configpath = configpath
+        config._initialize_accounts()
+        return config
+
+    def _initialize_accounts(self):
         accounts = self._initialize_account_objects()
         self["accounts"] = accounts
 
@@ -71,7 +89,8 @@ class OPCLIConfig(dict):
             account_map[account.shorthand] = account
         self.account_map = account_map
 
-    def _get_config_path(self) -> pathlib.Path:
+    @classmethod
+    def _get_config_path(cls) -> pathlib.Path:
         configpath: pathlib.Path = None
         config_home = None
         try:
@@ -80,7 +99,7 @@ class OPCLIConfig(dict):
         except KeyError:
             config_home = pathlib.Path.home()
 
-        for subpath in self.OP_CONFIG_PATHS:
+        for subpath in cls.OP_CONFIG_PATHS:
             _configpath = pathlib.Path(config_home, subpath)
             if os.path.exists(_configpath):
                 configpath = _configpath
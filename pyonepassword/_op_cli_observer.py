@@ -0,0 +1,95 @@
+"""
+Observer interface for instrumenting every 'op' command pyonepassword runs
+"""
+from __future__ import annotations
+
+import contextvars
+import shlex
+from abc import ABC, abstractmethod
+from contextlib import contextmanager
+from typing import List, NamedTuple, Optional
+
+from .string import RedactedString
+
+# Why an 'op' command is being run, if it's not on behalf of a caller's request
+# e.g., 'op whoami' before every command to verify authentication
+INVOCATION_AUTH_PREFLIGHT = "auth_preflight"
+INVOCATION_VERSION_CHECK = "version_check"
+
+_invocation_kind: contextvars.ContextVar[Optional[str]] = contextvars.ContextVar(
+    "_invocation_kind", default=None)
+
+
+class OPCommandRecord(NamedTuple):
+    """
+    A record of a single 'op' command invocation, passed to each registered
+    OPCommandObserver once the command completes
+    """
+    # the 'op' command, e.g., 'item', or None for commands such as 'op --version'
+    command: Optional[str]
+    # e.g., ['get']
+    subcommands: List[str]
+    # the full command line. This is redacted when printed, logged, or passed to str()
+    cmdline: RedactedString
+    # elapsed time, in seconds
+    wall_time: float
+    # None if the command timed out
+    returncode: Optional[int]
+    stdout_bytes: int
+    stderr_bytes: int
+    # whether this was an 'op whoami' run to verify authentication
+    auth_preflight: bool
+    # whether this was an 'op --version' run to check for a supported 'op'
+    version_check: bool
+
+
+class OPCommandObserver(ABC):
+    """
+    Base class for observing 'op' command invocations, e.g., to record timings or
+    create tracing spans
+
+    Register an observer via OP.add_command_observer(). Observers are process-wide,
+    and may be called from multiple threads concurrently
+    """
+
+    @abstractmethod
+    def command_finished(self, record: OPCommandRecord):  # pragma: no coverage
+        """
+        Called after each 'op' command completes, fails, or times out
+
+        Parameters
+        ----------
+        record : OPCommandRecord
+            Details about the command invocation
+        """
+        raise NotImplementedError()
+
+
+@contextmanager
+def _invocation(kind: str):
+    # mark any 'op' commands run in this context as being for 'kind'
+    token = _invocation_kind.set(kind)
+    try:
+        yield
+    finally:
+        _invocation_kind.reset(token)
+
+
+def _command_record(argv, wall_time, returncode, stdout, stderr, stdout_bytes=None) -> OPCommandRecord:
+    # 'stdout_bytes' is provided if stdout was consumed as it was written, rather than collected
+    if stdout_bytes is None:
+        stdout_bytes = len(stdout) if stdout else 0
+    kind = _invocation_kind.get()
+    # shlex.join() uses the unredacted values of any RedactedString args,
+    # so the whole command line gets redacted instead
+    cmdline = RedactedString(shlex.join(argv))
+    record = OPCommandRecord(command=argv.command,
+                             subcommands=list(argv.subcommands or []),
+                             cmdline=cmdline,
+                             wall_time=wall_time,
+                             returncode=returncode,
+                             stdout_bytes=stdout_bytes,
+                             stderr_bytes=len(stderr) if stderr else 0,
+                             auth_preflight=kind == INVOCATION_AUTH_PREFLIGHT,
+                             version_check=kind == INVOCATION_VERSION_CHECK)
+    return record
@@ -4,18 +4,42 @@ Description: A module that maps methods to to `op` commands and subcommands
 from __future__ import annotations
 
 import enum
+import io
 import logging
 import os
 import shutil
+import threading
+import time
 from os import environ
-from typing import TYPE_CHECKING, Dict, List, Mapping, Optional, Tuple, Union
+from typing import (
+    IO,
+    TYPE_CHECKING,
+    Any,
+    Dict,
+    Iterable,
+    List,
+    Mapping,
+    NamedTuple,
+    Optional,
+    Tuple,
+    Type,
+    TypeVar,
+    Union
+)
 
 if TYPE_CHECKING:  # pragma: no coverage
     from pyonepassword._field_assignment import OPFieldTypeEnum
 
-from ._op_cli import _OPCLIExecute
+from ._facts_cache import OPFacts, get_facts_cache
+from ._metrics import get_metrics
+from ._op_cli import StdoutConsumer, _OPCLIExecute
 from ._op_cli_argv import _OPArgv
 from ._op_cli_config import OPCLIConfig
+from ._op_cli_observer import (
+    INVOCATION_AUTH_PREFLIGHT,
+    INVOCATION_VERSION_CHECK,
+    _invocation
+)
 from ._op_cli_version import OPCLIVersion, OPVersionSupport
 from ._svc_account import (
     SVC_ACCT_CMD_NOT_SUPPORTED,
@@ -30,7 +54,9 @@ from .py_op_exceptions import (
     OPAuthenticationException,
     OPCmdFailedException,
     OPCmdMalformedSvcAcctTokenException,
+    OPCommandTimeoutException,
     OPConfigNotFoundException,
+    OPDocumentCreateException,
     OPDocumentDeleteException,
     OPDocumentEditException,
     OPDocumentGetException,
@@ -65,6 +91,49 @@ EXISTING_AUTH_AVAIL = ExistingAuthEnum.AVAILABLE
 EXISTING_AUTH_REQD = ExistingAuthEnum.REQUIRED
 
 
+class AuthVerifyPolicyEnum(enum.IntEnum):
+    ALWAYS = 0      # Verify authentication via 'op whoami' before every command
+    TTL = 1         # Verify authentication at most once per TTL window
+    ON_FAILURE = 2  # Only verify authentication after a command fails
+    REACTIVE = 3    # Never verify, classify command failures by their error output instead
+
+
+AUTH_VERIFY_ALWAYS = AuthVerifyPolicyEnum.ALWAYS
+AUTH_VERIFY_TTL = AuthVerifyPolicyEnum.TTL
+AUTH_VERIFY_ON_FAILURE = AuthVerifyPolicyEnum.ON_FAILURE
+AUTH_VERIFY_REACTIVE = AuthVerifyPolicyEnum.REACTIVE
+
+# seconds an authentication verification remains valid under AUTH_VERIFY_TTL
+DEFAULT_AUTH_VERIFY_TTL = 300.0
+
+
+class OPSessionSnapshot(NamedTuple):
+    """
+    The state of a signed-in OP object, from which an equivalent OP object can be
+    created, e.g., in a worker process, without running 'op'
+
+    It can be pickled, or converted to a JSON-compatible dictionary via _asdict()
+
+    NOTE: The session token itself is not included, only the name of the environment
+    variable that holds it
+    """
+    # fully-qualified path to 'op', and its size & modification time when the snapshot was taken
+    op_path: str
+    op_size: int
+    op_mtime: float
+    cli_version: str
+    account_identifier: Optional[str]
+    session_var: Optional[str]
+    uses_bio: bool
+    svc_account: bool
+    vault: Optional[str]
+    signed_in_account: Optional[Dict[str, Any]]
+
+
+_OPCommandInterfaceT = TypeVar(
+    "_OPCommandInterfaceT", bound="_OPCommandInterface")
+
+
 class _OPCommandInterface(_OPCLIExecute):
     """
     A class that directly maps methods to `op` commands
@@ -79,11 +148,23 @@ class _OPCommandInterface(_OPCLIExecute):
     SVC_ACCT_TOKEN_MALFORMED_TEXT = "failed to DecodeSACCredentials"
     SVC_ACCT_TOKEN_NOT_AUTH_TXT = "service account token set, but not authenticated yet"
 
+    # error output fragments indicating 'op' is not authenticated
+    SIGNED_OUT_FRAGMENTS = [NO_ACTIVE_SESSION_FOUND_TEXT,
+                            NOT_SIGNED_IN_TEXT,
+                            NO_SESSION_TOKEN_FOUND_TEXT,
+                            ACCT_IS_NOT_SIGNED_IN_TEXT]
+
     OP_SVC_ACCOUNT_ENV_VAR = "OP_SERVICE_ACCOUNT_TOKEN"
     OP_PATH = 'op'  # let subprocess find 'op' in the system path
+    # number of seconds before a previously checked 'op' path is resolved
+    # and stat()ed again, in order to detect a binary that was replaced
+    # set to 0 to check on every command
+    OP_PATH_REVALIDATE_INTERVAL = 10.0
 
     _version_support = OPVersionSupport()
     _op_paths_checked: set[Tuple[int, float]] = set()
+    # op_path -> (time of last check, (size, mtime))
+    _op_path_cache: Dict[str, Tuple[float, Tuple[int, float]]] = {}
 
     def __init__(self,
                  account: str = None,
@@ -92,7 +173,12 @@ class _OPCommandInterface(_OPCLIExecute):
                  vault: str = None,
                  password_prompt: bool = True,
                  op_path: str = OP_PATH,
-                 logger: logging.Logger = None):
+                 logger: logging.Logger = None,
+                 auth_verify_policy: AuthVerifyPolicyEnum = AUTH_VERIFY_ALWAYS,
+                 auth_verify_ttl: float = DEFAULT_AUTH_VERIFY_TTL,
+                 auth_retry: bool = False,
+                 timeout: Optional[float] = None,
+                 timeout_retries: int = 0):
         """
         Constructor to authenticate or verify existing authentication to `op`
         """
@@ -112,6 +198,16 @@ class _OPCommandInterface(_OPCLIExecute):
         self._account_list: OPAccountList = None
         self._uses_bio: bool = False
         self._sess_var: str = None
+        self._auth_verify_policy = AuthVerifyPolicyEnum(auth_verify_policy)
+        self._auth_verify_ttl = auth_verify_ttl
+        self._auth_retry = auth_retry
+        self._timeout = timeout
+        self._timeout_retries = timeout_retries
+        self._password_prompt = password_prompt
+        # monotonic timestamp of the last successful authentication verification
+        self._auth_verified_at: Optional[float] = None
+        # held while signing in again, see _reauthenticate_after_failure()
+        self._reauth_lock = threading.Lock()
         # gathering facts will attempt to set the above instance variables
         # that got initialized to None or False
         self._gather_facts()
@@ -137,6 +233,10 @@ class _OPCommandInterface(_OPCLIExecute):
             self.logger.error(msg)
             raise OPAuthenticationException(msg)
 
+        # remember whether we're allowed to perform a new sign-in later
+        # if authentication expires
+        self._existing_auth = existing_auth
+
         # So far everything above has been fairly lightweight, with no remote
         # contact to the 1Password account.
         # The next steps will attempt to talk to the 1Password account, and
@@ -145,6 +245,9 @@ class _OPCommandInterface(_OPCLIExecute):
             existing_auth, password, password_prompt)
         self._signed_in_account = account_obj
         self._token = token
+        # signing in or verifying an existing sign-in both ran 'op whoami'
+        # so that counts as verifying authentication
+        self._auth_verified_at = time.monotonic()
         if self._signed_in_account.is_service_account():
             self.logger.debug("Signed in as a service account")
         else:
@@ -169,6 +272,7 @@ class _OPCommandInterface(_OPCLIExecute):
         """
         cls._version_support = OPVersionSupport()
         cls._op_paths_checked = set()
+        cls._op_path_cache = {}
         cls._reset_class_logger()
 
     @property
@@ -179,6 +283,157 @@ class _OPCommandInterface(_OPCLIExecute):
     def session_var(self) -> str:
         return self._sess_var
 
+    @property
+    def auth_verify_policy(self) -> AuthVerifyPolicyEnum:
+        return self._auth_verify_policy
+
+    @property
+    def timeout(self) -> Optional[float]:
+        return self._timeout
+
+    def snapshot(self) -> OPSessionSnapshot:
+        """
+        Capture this object's session state, so an equivalent object can be created
+        with from_snapshot(), e.g., in a worker process
+
+        The session token is not captured. Objects created from the snapshot get it from
+        the session environment variable, which child processes inherit, or from the
+        'token' argument to from_snapshot()
+
+        Returns
+        -------
+        OPSessionSnapshot
+            The snapshot of this object's session state
+        """
+        # get fully-qualified path even if "op" was provided,
+        # so the snapshot doesn't depend on PATH
+        op_path = shutil.which(self.op_path) or self.op_path
+        op_path = os.path.abspath(op_path)
+        op_size, op_mtime = self._op_path_size_mtime(op_path)
+        signed_in_account = None
+        if self._signed_in_account is not None:
+            signed_in_account = dict(self._signed_in_account)
+
+        snapshot = OPSessionSnapshot(op_path=op_path,
+                                     op_size=op_size,
+                                     op_mtime=op_mtime,
+                                     cli_version=str(self._cli_version),
+                                     account_identifier=self._account_identifier,
+                                     session_var=self._sess_var,
+                                     uses_bio=self._uses_bio,
+                                     svc_account=self.svc_account_env_var_set(),
+                                     vault=self.vault,
+                                     signed_in_account=signed_in_account)
+        return snapshot
+
+    @classmethod
+    def from_snapshot(cls: Type[_OPCommandInterfaceT],
+                      snapshot: OPSessionSnapshot,
+                      token: Optional[str] = None,
+                      vault: Optional[str] = None,
+                      logger: logging.Logger = None,
+                      auth_verify_policy: AuthVerifyPolicyEnum = AUTH_VERIFY_ON_FAILURE,
+                      auth_verify_ttl: float = DEFAULT_AUTH_VERIFY_TTL,
+                      auth_retry: bool = False,
+                      password_prompt: bool = False,
+                      timeout: Optional[float] = None,
+                      timeout_retries: int = 0) -> _OPCommandInterfaceT:
+        """
+        Create an object from a session snapshot taken by snapshot(), without running 'op'
+
+        Neither facts about 'op' are gathered, nor is authentication verified, when the
+        object is created. Authentication is verified according to 'auth_verify_policy',
+        which by default is only after a command fails
+
+        If 'op' has been replaced since the snapshot was taken, its version is checked again
+
+        Parameters
+        ----------
+        snapshot : OPSessionSnapshot
+            The snapshot to create the object from
+        token : str, optional
+            The session token. If not provided, it's read from the session environment
+            variable, if there is one. If provided, the session environment variable is set
+        vault : str, optional
+            If set, this becomes the default argument to the --vault flag,
+            by default the snapshot's default vault
+        logger : logging.Logger, optional
+            A logging object. If not provided a basic logger is created and used
+        auth_verify_policy : AuthVerifyPolicyEnum, optional
+            When to verify authentication, by default AUTH_VERIFY_ON_FAILURE
+            See the OP constructor for details
+        auth_verify_ttl : float, optional
+            Number of seconds an authentication verification is considered valid
+            when 'auth_verify_policy' is AUTH_VERIFY_TTL, by default 300
+        auth_retry : bool, optional
+            See the OP constructor, by default False
+        password_prompt : bool, optional
+            Whether an interactive password prompt may be presented if signing in again is
+            necessary, by default False
+        timeout : float, optional
+            See the OP constructor, by default None
+        timeout_retries : int, optional
+            See the OP constructor, by default 0
+
+        Returns
+        -------
+        The new object, an instance of the class this method is called on
+
+        Raises
+        ------
+        OPNotFoundException
+            If the 1Password command can't be found
+        """
+        op_path = snapshot.op_path
+        try:
+            op_size_mtime = cls._op_path_size_mtime(op_path)
+        except FileNotFoundError as err:
+            raise OPNotFoundException(op_path, err.errno)
+
+        if op_size_mtime == (snapshot.op_size, snapshot.op_mtime):
+            cli_version = OPCLIVersion(snapshot.cli_version)
+        else:
+            # 'op' was replaced, so the snapshot's version may be wrong
+            cli_version = cls._get_cli_version(op_path)
+        cls._check_op_version(op_path, cli_version=cli_version)
+
+        # only a caller-provided logger replaces the class logger, same as __init__()
+        op = cls.__new__(cls, logger=logger)
+        if not logger:
+            logger = logging.getLogger(cls.__name__)
+            logger.setLevel(logging.INFO)
+        op.vault = vault if vault is not None else snapshot.vault
+        op.logger = logger
+        op.op_path = op_path
+        op._account_identifier = snapshot.account_identifier
+        op._signed_in_account = None
+        if snapshot.signed_in_account is not None:
+            op._signed_in_account = OPAccount(snapshot.signed_in_account)
+        op._cli_version = cli_version
+        # only needed to resolve the account identifier, which the snapshot already has
+        op._op_config = None
+        op._account_list = None
+        op._uses_bio = snapshot.uses_bio
+        op._sess_var = snapshot.session_var
+        op._auth_verify_policy = AuthVerifyPolicyEnum(auth_verify_policy)
+        op._auth_verify_ttl = auth_verify_ttl
+        op._auth_retry = auth_retry
+        op._timeout = timeout
+        op._timeout_retries = timeout_retries
+        op._password_prompt = password_prompt
+        # authentication hasn't been verified by this object
+        op._auth_verified_at = None
+        op._reauth_lock = threading.Lock()
+        if snapshot.svc_account:
+            op._existing_auth = EXISTING_AUTH_REQD
+        else:
+            op._existing_auth = EXISTING_AUTH_AVAIL
+
+        if token and op._sess_var:
+            environ[op._sess_var] = token
+        op._token = op._get_existing_token(op._signed_in_account)
+        return op
+
     @classmethod
     def _op_path_size_mtime(cls, op_path):
         # get fully-qualified path even if "op" was provided
@@ -191,26 +446,43 @@ class _OPCommandInterface(_OPCLIExecute):
         return (sz, mt)
 
     @classmethod
-    def _check_op_version(cls, op_path, cli_version=None):
+    def _check_op_version(cls, op_path, cli_version=None, timeout: Optional[float] = None):
         if not isinstance(op_path, str):
             op_path = str(op_path)
+
+        # skip resolving and stat()ing 'op' if this path was recently checked
+        now = time.monotonic()
+        cached = cls._op_path_cache.get(op_path)
+        if cached is not None:
+            checked_at, sz_mt = cached
+            if now - checked_at < cls.OP_PATH_REVALIDATE_INTERVAL:
+                metrics = get_metrics()
+                if metrics is not None:
+                    metrics.version_check_cached(True)
+                return
+
         try:
             sz_mt = cls._op_path_size_mtime(op_path)
         except FileNotFoundError as err:
+            cls._op_path_cache.pop(op_path, None)
             raise OPNotFoundException(op_path, err.errno)
 
         # don't check 'op' at the same path more than once
         # but allow for different 'op' executables to be used
         # over the course of execution
+        metrics = get_metrics()
+        if metrics is not None:
+            metrics.version_check_cached(sz_mt in cls._op_paths_checked)
         if sz_mt not in cls._op_paths_checked:
             if cli_version:
                 ver = cli_version
             else:
-                ver = cls._get_cli_version(op_path)
+                ver = cls._get_cli_version(op_path, timeout=timeout)
             # exception is raised if version is unsupported
             # deprecation warning is issued if version support is deprecated
             cls._version_support.check_version_support(ver)
             cls._op_paths_checked.add(sz_mt)
+        cls._op_path_cache[op_path] = (now, sz_mt)
 
     @classmethod
     def svc_account_env_var_set(cls):
@@ -241,31 +513,59 @@ class _OPCommandInterface(_OPCLIExecute):
         return uses_bio
 
     def _gather_facts(self):
-        self._cli_version = self._get_cli_version(self.op_path)
-        self._check_op_version(self.op_path, cli_version=self._cli_version)
+        facts_cache = get_facts_cache()
+        svc_account = self.svc_account_env_var_set()
+        facts = None
+        if facts_cache is not None:
+            facts = facts_cache.load(self.op_path, svc_account=svc_account)
+
+        if facts is not None:
+            self.logger.debug("Using cached facts")
+            self._check_op_version(
+                self.op_path, cli_version=facts.cli_version)
+        else:
+            facts = self._gather_facts_from_op()
+            if facts_cache is not None:
+                facts_cache.save(self.op_path, facts,
+                                 svc_account=svc_account)
+
+        self._cli_version = facts.cli_version
+        self._account_list = facts.account_list
         self._uses_bio = self.uses_biometric(
             op_path=self.op_path, account_list=self._account_list)
         self.logger.debug(f"uses bio: {self._uses_bio}")
+        self._op_config = facts.op_config
+        self._account_identifier = self._normalize_account_id()
+        self._sess_var = self._compute_session_var_name()
+
+    def _gather_facts_from_op(self) -> OPFacts:
+        # run each 'op' query once, and share its result with everything that needs it
+        cli_version = self._get_cli_version(
+            self.op_path, timeout=self._timeout)
+        self._check_op_version(self.op_path, cli_version=cli_version)
+        account_list = self._get_account_list(self.op_path)
+        uses_bio = self.uses_biometric(
+            op_path=self.op_path, account_list=account_list)
         try:
             # if we haven't done a sign-in via the CLI/without desktop app integration
             # there won't be a config
-            self._op_config = OPCLIConfig()
+            op_config = OPCLIConfig()
         except OPConfigNotFoundException:
-            if self._uses_bio:
+            if uses_bio:
                 # set this to None. We should only use it if biometric is diabled,
                 # in which case this should be a hard error
-                self._op_config = None
+                op_config = None
             else:
                 raise
-        self._account_list = self._get_account_list(self.op_path)
-
-        self._account_identifier = self._normalize_account_id()
-        self._sess_var = self._compute_session_var_name()
+        facts = OPFacts(cli_version, account_list, op_config)
+        return facts
 
     @classmethod
-    def _get_cli_version(cls, op_path: str) -> OPCLIVersion:
+    def _get_cli_version(cls, op_path: str, timeout: Optional[float] = None) -> OPCLIVersion:
         argv = _OPArgv.cli_version_argv(op_path)
-        output = cls._run(argv, capture_stdout=True, decode="utf-8")
+        with _invocation(INVOCATION_VERSION_CHECK):
+            output = cls._run(argv, capture_stdout=True,
+                              decode="utf-8", timeout=timeout)
         output = output.rstrip()
         cli_version = OPCLIVersion(output)
         return cli_version
@@ -346,7 +646,7 @@ class _OPCommandInterface(_OPCLIExecute):
         return (account, token)
 
     @classmethod
-    def _auth_expired(cls, op_path, account):
+    def _auth_expired(cls, op_path, account, timeout: Optional[float] = None):
         # this is a test to see if the previously valid authentication
         # is still valid, with the assumption that if it is not, then it
         # has expired
@@ -357,7 +657,10 @@ class _OPCommandInterface(_OPCLIExecute):
         expired = False
 
         try:
-            cls._whoami(op_path, account=account)
+            with _invocation(INVOCATION_AUTH_PREFLIGHT):
+                # the command being preflighted has already checked 'op''s version
+                cls._whoami(op_path, account=account,
+                            timeout=timeout, check_version=False)
         except OPWhoAmiException:  # pragma: no cover
             expired = True
 
@@ -384,22 +687,51 @@ class _OPCommandInterface(_OPCLIExecute):
             account = self._whoami(self.op_path, env=env)
         except OPWhoAmiException as ocfe:
             # scrape error message about not being signed in
-
-            fragments = [self.NO_ACTIVE_SESSION_FOUND_TEXT,
-                         self.NOT_SIGNED_IN_TEXT,
-                         self.NO_SESSION_TOKEN_FOUND_TEXT,
-                         self.ACCT_IS_NOT_SIGNED_IN_TEXT]
-            unknown_err = True
-            for frag in fragments:
-                if frag in ocfe.err_output:
-                    unknown_err = False
-                    break
-            # there was a different error so raise the exception
-            if unknown_err:  # pragma: no cover
+            # if there was a different error so raise the exception
+            if not self._is_signed_out_error(ocfe.err_output):  # pragma: no cover
                 raise ocfe
 
         return account
 
+    @classmethod
+    def _is_signed_out_error(cls, err_output: str) -> bool:
+        signed_out = False
+        for frag in cls.SIGNED_OUT_FRAGMENTS:
+            if frag in err_output:
+                signed_out = True
+                break
+        return signed_out
+
+    def _reauthenticate(self):
+        # perform a new sign-in after authentication has expired
+        # this is only possible if:
+        # - we're not relying on a service account token, which 'op' doesn't let us replace
+        # - caller didn't tell us existing authentication is required
+        # the password provided at construction isn't retained, so without biometric
+        # a new sign-in requires an interactive password prompt
+        # _do_normal_signin() raises OPAuthenticationException if that's not allowed
+        if self._existing_auth == EXISTING_AUTH_REQD:
+            raise OPAuthenticationException(
+                "Authentication has expired, and existing authentication is required")
+        token = self._do_normal_signin(None, self._password_prompt)
+        account = self._verify_signin(token=token)
+        if not account:  # pragma: no cover
+            raise OPAuthenticationException("Re-authentication failed")
+        self._signed_in_account = account
+        self._token = token
+        if token and self._sess_var:
+            environ[self._sess_var] = token
+        self._auth_verified_at = time.monotonic()
+
+    def _reauthenticate_after_failure(self, started_at: float):
+        # sign in again after a command that started at 'started_at' failed
+        # several threads' commands may have failed for the same reason,
+        # but only one of them needs to sign in again
+        with self._reauth_lock:
+            verified_at = self._auth_verified_at
+            if verified_at is None or verified_at < started_at:
+                self._reauthenticate()
+
     def _do_normal_signin(self, password: str, password_prompt: bool) -> Union[str, None]:
         # normalize empty string to None, otherwise use password as given
         password = None if password == "" else password
@@ -443,15 +775,36 @@ class _OPCommandInterface(_OPCLIExecute):
 
         return output
 
-    @classmethod
-    def _run_with_auth_check(cls,
+    def _auth_verification_due(self) -> bool:
+        # whether authentication should be verified before running the next command,
+        # according to the authentication verification policy
+        due = True
+        if self._auth_verify_policy in [AUTH_VERIFY_ON_FAILURE, AUTH_VERIFY_REACTIVE]:
+            due = False
+        elif self._auth_verify_policy == AUTH_VERIFY_TTL:
+            if self._auth_verified_at is not None:
+                elapsed = time.monotonic() - self._auth_verified_at
+                due = elapsed >= self._auth_verify_ttl
+        return due
+
+    def _verify_auth(self, op_path: str, account: str, timeout: Optional[float] = None):
+        if self._auth_expired(op_path, account, timeout=timeout):
+            self._auth_verified_at = None
+            raise OPAuthenticationException(
+                "Authentication has expired")  # pragma: no cover
+        self._auth_verified_at = time.monotonic()
+
+    def _run_with_auth_check(self,
                              op_path: str,
                              account: str,
                              argv: _OPArgv,
                              capture_stdout: bool = False,
-                             input: Union[str, bytes] = None,
+                             input: Union[str, bytes, IO[bytes],
+                                          Iterable[bytes]] = None,
                              decode: str = None,
-                             env: Mapping = environ):
+                             env: Mapping = environ,
+                             timeout: Optional[float] = None,
+                             stdout_consumer: Optional[StdoutConsumer] = None):
         # this somewhat of a hack to detect if authentication has expired
         # so that we can raise OPAuthenticationException rather than the generic OPCmdFailedException
         # under the hood, it calls 'whoami' which will fail if not authenticated
@@ -461,57 +814,150 @@ class _OPCommandInterface(_OPCLIExecute):
         # - this method is racey, since authentication may expire between the check and the
         #   operation
         # - this adds roughly 20% overhead (as measured by the full suite of pytest tests)
+        #
+        # The overhead may be reduced by choosing an authentication verification policy
+        # other than AUTH_VERIFY_ALWAYS:
+        # - AUTH_VERIFY_TTL: only verify if the last verification is older than the TTL
+        # - AUTH_VERIFY_ON_FAILURE: only verify once a command has failed
+        # - AUTH_VERIFY_REACTIVE: never verify. Instead, if a command fails, inspect its
+        #   error output for signs of not being signed in. This also avoids the race above
+
+        # the version check and authentication preflight are subject to the same
+        # timeout as the command itself
+        if timeout is None:
+            timeout = self._timeout
+        self._check_op_version(op_path, timeout=timeout)
+        if self._auth_verification_due():
+            self._verify_auth(op_path, account, timeout=timeout)
+
+        self._check_svc_account_support(argv)
+
+        # at most one retry, and only if a new sign-in is performed in between
+        attempts = 0
+        max_attempts = 2 if self._auth_retry else 1
+        rewindable_input: Optional[io.IOBase] = None
+        input_pos = 0
+        if input is not None and not isinstance(input, (str, bytes)):
+            # streamed input can only be sent again if it can be rewound
+            if isinstance(input, io.IOBase) and input.seekable():
+                rewindable_input = input
+                input_pos = input.tell()
+            else:
+                max_attempts = 1
+        while True:
+            attempts += 1
+            started_at = time.monotonic()
+            try:
+                output = self._run_with_timeout_retry(argv,
+                                                      capture_stdout=capture_stdout,
+                                                      input=input,
+                                                      decode=decode,
+                                                      env=env,
+                                                      timeout=timeout,
+                                                      stdout_consumer=stdout_consumer)
+                break
+            except OPCmdFailedException as ocfe:
+                if self._auth_verify_policy == AUTH_VERIFY_REACTIVE:
+                    self._raise_unless_reauth_possible(
+                        ocfe, attempts, max_attempts)
+                    self._reauthenticate_after_failure(started_at)
+                    if rewindable_input is not None:
+                        rewindable_input.seek(input_pos)
+                    if env is not environ and self._sess_var and self.token:
+                        # caller gave us a copy of the environment,
+                        # so it doesn't have the new session token
+                        env = dict(env)
+                        env[self._sess_var] = self.token
+                    continue
+                elif self._auth_verify_policy != AUTH_VERIFY_ALWAYS:
+                    # we may have skipped verification before running the command,
+                    # so the failure may be due to expired authentication
+                    # if so, raise OPAuthenticationException as if we'd checked first
+                    # otherwise, the original exception propagates
+                    self._verify_auth(op_path, account, timeout=timeout)
+                raise
 
-        cls._check_op_version(op_path)
-        if cls._auth_expired(op_path, account):
-            raise OPAuthenticationException(
-                "Authentication has expired")  # pragma: no cover
+        return output
 
-        if cls.svc_account_env_var_set():
+    def _check_svc_account_support(self, argv: _OPArgv):
+        # raise OPSvcAcctCommandNotSupportedException if we're authenticated
+        # with a service account, and it can't be used for this command
+        if self.svc_account_env_var_set():
             err_msg = None
             supported = argv.svc_account_supported()
             if supported.code in [SVC_ACCT_INCOMPAT_OPTIONS, SVC_ACCT_CMD_NOT_SUPPORTED]:
                 err_msg = supported.msg
             elif supported.code == SVC_ACCT_SUPPORTED:
-                cls.logger.debug("Command supported with service accounts")
+                self.logger.debug("Command supported with service accounts")
             else:
                 raise Exception(  # pragma: no cover
                     f"Unknown service account support code {supported.code}")
 
             if err_msg:
-                if cls._should_log_op_errors():
-                    cls.logger.error(err_msg)
+                if self._should_log_op_errors():
+                    self.logger.error(err_msg)
                 raise OPSvcAcctCommandNotSupportedException(err_msg)
 
-        return cls._run(argv,
-                        capture_stdout=capture_stdout,
-                        input=input,
-                        decode=decode,
-                        env=env)
+    def _run_with_timeout_retry(self, argv: _OPArgv, timeout: Optional[float] = None, **kwargs):
+        # run 'op', applying this object's timeout unless one was provided for this call
+        # if a read-only command ('get' or 'list') times out, it's safe to try again,
+        # up to 'timeout_retries' more times
+        if timeout is None:
+            timeout = self._timeout
+        retries = self._timeout_retries if argv.is_read_only() else 0
+        attempt = 0
+        while True:
+            try:
+                output = self._run(argv, timeout=timeout, **kwargs)
+                break
+            except OPCommandTimeoutException:
+                if attempt >= retries:
+                    raise
+                attempt += 1
+                self.logger.warning(
+                    f"Retrying timed out 'op' command, attempt {attempt} of {retries}")
+        return output
+
+    def _raise_unless_reauth_possible(self, ocfe: OPCmdFailedException, attempts: int, max_attempts: int):
+        # under AUTH_VERIFY_REACTIVE, decide what to do about a failed command:
+        # - if it failed for some reason other than authentication, re-raise the original exception
+        # - if authentication has expired but we can't or shouldn't sign in again, raise
+        #   OPAuthenticationException
+        # - otherwise return, so the caller can sign in again and retry
+        if not self._is_signed_out_error(ocfe.err_output):
+            raise ocfe
+        if attempts >= max_attempts or self.svc_account_env_var_set():
+            raise OPAuthenticationException(
+                "Authentication has expired") from ocfe
 
     @classmethod
-    def _item_template_list_special(cls, op_path,  env: Dict[str, str] = None):
-        cls._check_op_version(op_path)
+    def _item_template_list_special(cls, op_path,  env: Dict[str, str] = None, timeout: Optional[float] = None,
+                                    check_version: bool = True):
+        if check_version:
+            cls._check_op_version(op_path, timeout=timeout)
         if not env:
             env = dict(environ)
         # special "template list" class method we can use for testing authentication
         argv = _OPArgv.item_template_list_argv(op_path)
         template_list_json = cls._run(
-            argv, capture_stdout=True, decode="utf-8", env=env)
+            argv, capture_stdout=True, decode="utf-8", env=env, timeout=timeout)
         return template_list_json
 
     @classmethod
-    def _whoami_base(cls, op_path, env: Dict[str, str] = None, account: str = None):
-        cls._check_op_version(op_path)
+    def _whoami_base(cls, op_path, env: Dict[str, str] = None, account: str = None, timeout: Optional[float] = None,
+                     check_version: bool = True):
+        if check_version:
+            cls._check_op_version(op_path, timeout=timeout)
         if not env:
             env = dict(environ)
         argv = _OPArgv.whoami_argv(op_path, account=account)
         account_json = cls._run(
-            argv, capture_stdout=True, decode="utf-8", env=env)
+            argv, capture_stdout=True, decode="utf-8", env=env, timeout=timeout)
         return account_json
 
     @classmethod
-    def _whoami_svc_account(cls, op_path, env: Dict[str, str] = None):
+    def _whoami_svc_account(cls, op_path, env: Dict[str, str] = None, timeout: Optional[float] = None,
+                            check_version: bool = True):
         # whoami behaves differently under certain circumstances if OP_SERVICE_ACCOUNT_TOKEN
         # is set, and we need to handle this situations differently
         # They include:
@@ -525,11 +971,13 @@ class _OPCommandInterface(_OPCLIExecute):
             # then try at most one more time
             attempts += 1
             try:
-                account_json = cls._whoami_base(op_path, env=env)
+                account_json = cls._whoami_base(
+                    op_path, env=env, timeout=timeout, check_version=check_version)
             except OPCmdFailedException as ocfe:
                 if attempts < max_attempts and cls.SVC_ACCT_TOKEN_NOT_AUTH_TXT in ocfe.err_output:
                     # Trigger a service account authenticated session (v 2.20.0 and later)
-                    cls._item_template_list_special(op_path, env=env)
+                    cls._item_template_list_special(
+                        op_path, env=env, timeout=timeout, check_version=check_version)
                     continue
                 elif cls.SVC_ACCT_TOKEN_MALFORMED_TEXT in ocfe.err_output:  # pragma: no cover
                     # OP_SERVICE_ACCOUNT_TOKEN got set to something malformed
@@ -546,7 +994,8 @@ class _OPCommandInterface(_OPCLIExecute):
         return account_json
 
     @classmethod
-    def _whoami(cls, op_path, env: Dict[str, str] = None, account: str = None) -> OPAccount:
+    def _whoami(cls, op_path, env: Dict[str, str] = None, account: str = None, timeout: Optional[float] = None,
+                check_version: bool = True) -> OPAccount:
         # outer/normal whoami method
         # if a service account var is set, this method will call
         # _whoami_svc_account(), which will call _whoami_base()
@@ -554,10 +1003,11 @@ class _OPCommandInterface(_OPCLIExecute):
 
         try:
             if cls.svc_account_env_var_set():
-                account_json = cls._whoami_svc_account(op_path, env=env)
+                account_json = cls._whoami_svc_account(
+                    op_path, env=env, timeout=timeout, check_version=check_version)
             else:
                 account_json = cls._whoami_base(
-                    op_path, env=env, account=account)
+                    op_path, env=env, account=account, timeout=timeout, check_version=check_version)
         except OPCmdFailedException as ocfe:
             raise OPWhoAmiException.from_opexception(ocfe)
 
@@ -591,20 +1041,72 @@ class _OPCommandInterface(_OPCLIExecute):
 
         return document_bytes
 
+    def _document_get_to_file(self,
+                              document_name_or_id: str,
+                              out_file: str,
+                              vault: Optional[str] = None,
+                              include_archive: Optional[bool] = False):
+        """
+        Download a document object from a 1Password vault by name or UUID, having 'op'
+        write it directly to a file rather than to stdout
+
+        Arguments:
+            - 'document_name_or_id': The item to look up
+            - 'out_file': Path of the file to write
+        Raises:
+            - OPDocumentGetException if the lookup fails for any reason.
+            - OPNotFoundException if the 1Password command can't be found.
+        """
+        get_document_argv = self._document_get_argv(
+            document_name_or_id, vault=vault, include_archive=include_archive, out_file=out_file)
+
+        try:
+            # 'op document get --out-file' doesn't have any output if successful
+            # if it fails, stderr will be in the exception object
+            self._run_with_auth_check(
+                self.op_path, self._account_identifier, get_document_argv)
+        except OPCmdFailedException as ocfe:
+            raise OPDocumentGetException.from_opexception(ocfe) from ocfe
+
+    def _document_create(self,
+                         document_input,
+                         file_path: Optional[str] = None,
+                         title: Optional[str] = None,
+                         file_name: Optional[str] = None,
+                         vault: Optional[str] = None,
+                         tags: Optional[List[str]] = None,
+                         decode: str = "utf-8"):
+        # either 'document_input' is streamed to 'op' on stdin, or 'op'
+        # reads the document from 'file_path' itself
+
+        document_create_argv = self._document_create_argv(
+            file_path=file_path, title=title, file_name=file_name, vault=vault, tags=tags)
+        try:
+            output = self._run_with_auth_check(
+                self.op_path, self._account_identifier, document_create_argv,
+                capture_stdout=True, input=document_input, decode=decode)
+        except OPCmdFailedException as ocfe:
+            raise OPDocumentCreateException.from_opexception(ocfe)
+
+        return output
+
     def _document_edit(self,
                        document_identifier: str,
-                       document_bytes: bytes,
+                       document_input,
+                       file_path: Optional[str] = None,
                        file_name: Optional[str] = None,
                        new_title: Optional[str] = None,
                        vault: Optional[str] = None):
+        # either 'document_input' is streamed to 'op' on stdin, or 'op'
+        # reads the document from 'file_path' itself
 
         document_edit_argv = self._document_edit_argv(
-            document_identifier, file_name=file_name, new_title=new_title, vault=vault)
+            document_identifier, file_path=file_path, file_name=file_name, new_title=new_title, vault=vault)
         try:
             # 'op document edit' doesn't have any output if successful
             # if it fails, stderr will be in the exception object
             self._run_with_auth_check(
-                self.op_path, self._account_identifier, document_edit_argv, input=document_bytes)
+                self.op_path, self._account_identifier, document_edit_argv, input=document_input)
         except OPCmdFailedException as ocfe:
             raise OPDocumentEditException.from_opexception(ocfe)
 
@@ -624,12 +1126,31 @@ class _OPCommandInterface(_OPCLIExecute):
 
         return
 
-    def _item_get(self, item_name_or_id, vault=None, fields=None, include_archive=False, decode="utf-8"):
+    def _item_get(self, item_name_or_id, vault=None, fields=None, include_archive=False, decode="utf-8", timeout=None):
         item_get_argv = self._item_get_argv(
             item_name_or_id, vault=vault, fields=fields, include_archive=include_archive)
         try:
             output = self._run_with_auth_check(
-                self.op_path, self._account_identifier, item_get_argv, capture_stdout=True, decode=decode)
+                self.op_path, self._account_identifier, item_get_argv, capture_stdout=True, decode=decode,
+                timeout=timeout)
+        except OPCmdFailedException as ocfe:
+            raise OPItemGetException.from_opexception(ocfe) from ocfe
+
+        return output
+
+    def _item_get_multiple(self, batch_json, vault=None, include_archive=False, decode="utf-8",
+                           stdout_consumer: Optional[StdoutConsumer] = None):
+        # op item get takes '-' for the item to get if objects are
+        # provided over stdin
+        # if 'stdout_consumer' is provided, it reads the output as 'op' writes it,
+        # and whatever it returns is returned instead
+        item_id = "-"
+        item_get_argv = self._item_get_argv(
+            item_id, vault=vault, include_archive=include_archive)
+        try:
+            output = self._run_with_auth_check(
+                self.op_path, self._account_identifier, item_get_argv, capture_stdout=True, input=batch_json, decode=decode,
+                stdout_consumer=stdout_consumer)
         except OPCmdFailedException as ocfe:
             raise OPItemGetException.from_opexception(ocfe) from ocfe
 
@@ -798,7 +1319,7 @@ class _OPCommandInterface(_OPCLIExecute):
         argv = _OPArgv.account_forget_argv(op_path, account)
         cls._run(argv)
 
-    def _item_list(self, categories=[], include_archive=False, tags=[], vault=None, decode="utf-8"):
+    def _item_list(self, categories=[], include_archive=False, tags=[], vault=None, decode="utf-8", timeout=None):
         # default lists to the categories & list kwargs
         # get initialized at module load
         # so its the same list object on every call to this funciton
@@ -811,7 +1332,8 @@ class _OPCommandInterface(_OPCLIExecute):
             categories=categories, include_archive=include_archive, tags=tags, vault=vault)
         try:
             output = self._run_with_auth_check(
-                self.op_path, self._account_identifier, argv, capture_stdout=True, decode=decode)
+                self.op_path, self._account_identifier, argv, capture_stdout=True, decode=decode,
+                timeout=timeout)
         except OPCmdFailedException as e:
             raise OPItemListException.from_opexception(e)
         return output
@@ -916,23 +1438,43 @@ class _OPCommandInterface(_OPCLIExecute):
     def _document_get_argv(self,
                            document_name_or_id: str,
                            vault: Optional[str] = None,
-                           include_archive: Optional[bool] = False):
+                           include_archive: Optional[bool] = False,
+                           out_file: Optional[str] = None):
         vault_arg = vault if vault else self.vault
         document_get_argv = _OPArgv.document_get_argv(self.op_path,
                                                       document_name_or_id,
                                                       vault=vault_arg,
-                                                      include_archive=include_archive)
+                                                      include_archive=include_archive,
+                                                      out_file=out_file)
 
         return document_get_argv
 
+    def _document_create_argv(self,
+                              file_path: Optional[str] = None,
+                              title: Optional[str] = None,
+                              file_name: Optional[str] = None,
+                              vault: Optional[str] = None,
+                              tags: Optional[List[str]] = None):
+        vault_arg = vault if vault else self.vault
+        document_create_argv = _OPArgv.document_create_argv(self.op_path,
+                                                            file_path=file_path,
+                                                            title=title,
+                                                            file_name=file_name,
+                                                            vault=vault_arg,
+                                                            tags=tags)
+
+        return document_create_argv
+
     def _document_edit_argv(self,
                             document_identifier: str,
+                            file_path: Optional[str] = None,
                             file_name: Optional[str] = None,
                             new_title: Optional[str] = None,
                             vault: Optional[str] = None):
         vault_arg = vault if vault else self.vault
         document_edit_argv = _OPArgv.document_edit_argv(self.op_path,
                                                         document_identifier,
+                                                        file_path=file_path,
                                                         file_name=file_name,
                                                         new_title=new_title,
                                                         vault=vault_arg)
@@ -1,6 +1,9 @@
+from __future__ import annotations
+
 import enum
 import json
-from typing import Any, Dict, List, NamedTuple, Optional, Set
+from types import MappingProxyType
+from typing import Dict, FrozenSet, List, Mapping, NamedTuple, Optional, Tuple
 
 from pysingleton import PySingleton  # type: ignore
 
@@ -33,6 +36,26 @@ class OPSvcAcctSupportCode(NamedTuple):
     msg: Optional[str]
 
 
+class _SvcAcctCmdOptions(NamedTuple):
+    # options that must be, and must not be, provided with a command
+    # when using a service account
+    required_options: FrozenSet[str]
+    prohibited_options: FrozenSet[str]
+
+    @classmethod
+    def from_cmd_dict(cls, cmd_dict: Dict) -> _SvcAcctCmdOptions:
+        cmd_options = cls(frozenset(cmd_dict["required_options"]),
+                          frozenset(cmd_dict["prohibited_options"]))
+        return cmd_options
+
+
+# subcommand chain, e.g., ("template", "list") for 'op item template list',
+# or () for the top-level command -> that command's options
+_CompiledCmdSpec = Mapping[Tuple[str, ...], _SvcAcctCmdOptions]
+# (command, subcommand chain, subcommand options)
+_SupportKey = Tuple[Optional[str], Optional[Tuple[str, ...]], FrozenSet[str]]
+
+
 class _CmdSpec(dict):
 
     def __init__(self, cmd_dict):
@@ -49,188 +72,178 @@ class _CmdSpec(dict):
         cmd_dict = self.get("cmd_dict", {})
         return cmd_dict
 
-    def command_lookup(self, subcommand_list: OptionalStrList = None):
-        # subcommand_list, if provided, is a subcommand chain of one or more items
-        # e.g, the "op item" command has the following subcommands (not exhaustive):
+    def compile(self) -> _CompiledCmdSpec:
+        """
+        Flatten this command's subcommand tree into an immutable mapping of
+        subcommand chains to the options for each
+        """
+        compiled: Dict[Tuple[str, ...], _SvcAcctCmdOptions] = {}
+        main_cmd_dict = self._main_command_dict()
+        if main_cmd_dict:
+            compiled[()] = _SvcAcctCmdOptions.from_cmd_dict(main_cmd_dict)
+        self._compile_subcommands(self.get("subcommands", {}), (), compiled)
+        return MappingProxyType(compiled)
+
+    @classmethod
+    def _compile_subcommands(cls,
+                             subcmd_dict: Dict,
+                             chain: Tuple[str, ...],
+                             compiled: Dict[Tuple[str, ...], _SvcAcctCmdOptions]):
+        # the "op item" command has the following subcommands (not exhaustive):
         # - get (e.g., op item get <item>)
         # - template list (e.g., op item template list <item_type>)
-        subcmd_dict = self.get("subcommands", {})
-        found: Dict[Any, Any] = {}
-
-        if subcommand_list:
-            # if we were given a subcommand list with one or more items
-            # then try to find the command dict for the subcommand chain
-            for subcmd in subcommand_list:
-                subcmd_dict = subcmd_dict.get(subcmd, {})
-                if "has_arg" in subcmd_dict:
-                    # check if current subcommand is the most deeply nested,
-                    # if so, the next entry in our list may be a positional
-                    # argument argument and not another subcommand,
-                    # so stop processing here
-                    found = subcmd_dict
-                    break
-        else:
-            # there was no subcommand list (e.g., in the case of op whoami)
-            # so get the top-level command dict
-            found = self._main_command_dict()
-
-        return found
+        for subcmd, cmd_dict in subcmd_dict.items():
+            subcmd_chain = chain + (subcmd,)
+            if "has_arg" in cmd_dict:
+                # this is the most deeply nested subcommand in the chain
+                # anything after it on the command line may be a positional argument
+                compiled[subcmd_chain] = _SvcAcctCmdOptions.from_cmd_dict(
+                    cmd_dict)
+            else:
+                cls._compile_subcommands(cmd_dict, subcmd_chain, compiled)
 
 
 # Make the registry a singleton to avoid
 # loading all the JSON files from disk each time
 # it gets instantiated
 class OPSvcAcctSupportRegistry(metaclass=PySingleton):
-    # This allows the instance to be freed & reinitialized
-    # once the last reference released
-    _PYSINGLETON_WEAKREF = True
+    # Keep the instance, and its compiled command specs & cached results,
+    # for the life of the process rather than reloading
+    # once the last reference is released
+    _PYSINGLETON_WEAKREF = False
     """
     A registry of supported commands, subcommands, and required & prohibited options
     in the context of service accounts
     """
 
+    # the following global options each take an argument
+    # e.g., "--format json"
+    GLOBAL_OPTIONS_WITH_ARGS = frozenset(
+        ["--format", "--encoding", "--session", "--config"])
+
     def __init__(self):
-        self._supported_commands = {}
+        supported_commands: Dict[str, _CompiledCmdSpec] = {}
         # data_location_as_path() satisfies mypy
         # by returning a Path instead of a Traversable
         data_path = data_location_as_path(data, data.SVC_ACCOUNT_COMMANDS)
 
         for json_file in data_path.glob("*.json"):
-            cmd_dict = json.load(open(json_file, "r"))
-            self._process(cmd_dict)
-
-    def _process(self, cmd_dict: Dict):
-        cmd_spec = _CmdSpec(cmd_dict)
-        cmd = cmd_spec.command_name
-        self._supported_commands[cmd] = cmd_spec
+            with open(json_file, "r") as f:
+                cmd_spec = _CmdSpec(json.load(f))
+            supported_commands[cmd_spec.command_name] = cmd_spec.compile()
+        self._supported_commands: Mapping[str, _CompiledCmdSpec] = MappingProxyType(
+            supported_commands)
+        # (command, subcommand chain, options) -> support code
+        # positional arguments aren't part of the key, so it stays small
+        self._support_cache: Dict[_SupportKey, OPSvcAcctSupportCode] = {}
 
     def command_supported(self, _argv: List[str]) -> OPSvcAcctSupportCode:
-        # This function is much more complex than I'd like, but most of the complexity is
-        # around building necessary context for a meaningful exception message
-
-        _support_code = _SVC_ACCT_CMD_NOT_VALIDATED
-        _support_msg: str = None
-
-        # for testing of all required options are provided
-        # and for generating error message
-        reqd_opt_diff: Set[str] = set()
-        required_opt_satified = False
-        # for generating error message if any prohibted options are found
-        prohib_opt_diff: Set[str] = set()
-        prohibited_opt_satisfied = False
-        # copy argv so we don't modify the original
-        argv_list: List[str] = list(_argv)
-        # [op_exe, [global options, ...], [subcommands, ...], [--sub-cmd-options, ...]]
-        cmd_spec: _CmdSpec
-
-        # pop argv[0], the op exe path
-        argv_list.pop(0)
-
-        # the following global options each take an argument
-        # e.g., "--format json"
-        global_options_with_args = ["--format",
-                                    "--encoding", "--session", "--config"]
-
-        # pop global options
-        while argv_list and argv_list[0].startswith("--"):
-            arg = argv_list.pop(0)
-            # does the option have an argument that also
-            # needs to be popped?
-            # e.g., if we popped "--format", we also
-            # need to pop its argument, "json"
-            if arg in global_options_with_args:
-                argv_list.pop(0)
+        command, subcommands, subcmd_options = self._split_argv(_argv)
 
-        # get primary command
-        command = None
-        if argv_list:
-            command = argv_list.pop(0)
-
-        # build subcommands:
-        subcommands = []
-        while argv_list and not argv_list[0].startswith("--"):
-            subcommands.append(argv_list.pop(0))
-
-        # build subcommand option list
-        subcmd_options = []
-        while argv_list:
-            # pop off all subcommand options, ignoring option-arguments
-            # e.g, save "--vault", but skip argument "Test Data"
-            option = argv_list.pop(0)
-            if option.startswith("--"):
-                subcmd_options.append(option)
-
-        if command is None:
-            # command-less options such as --version are always supported
-            _support_code = SVC_ACCT_SUPPORTED
-            _support_msg = None
-            cmd_spec = None
-            required_opt_satified = True
-            prohibited_opt_satisfied = True
-        else:
+        cmd_spec: Optional[_CompiledCmdSpec] = None
+        chain: Optional[Tuple[str, ...]] = None
+        if command is not None:
             cmd_spec = self._supported_commands.get(command)
-
-        cmd_dict = {}
-        if cmd_spec:
-            cmd_dict = cmd_spec.command_lookup(subcommand_list=subcommands)
-
-        # if we either failed to find a command spec or
-        # we found a command spec but not a subcommand dictionary
-        # then command is not supported
-        _cmd_not_found = command is not None and cmd_spec is None
-        if (cmd_spec and not cmd_dict) or _cmd_not_found:
+        if cmd_spec is not None:
+            chain = self._subcommand_chain(cmd_spec, subcommands)
+
+        if command is not None and chain is None:
+            # either we failed to find a command spec or
+            # we found a command spec but not the subcommand
+            # so command is not supported
+            # not cached, since the message includes any positional arguments
             _support_msg = f"Command or subcommand not supported: [{command} {' '.join(subcommands)}]"
-            _support_code = SVC_ACCT_CMD_NOT_SUPPORTED
-
-        if cmd_dict and _support_code == _SVC_ACCT_CMD_NOT_VALIDATED:
-            required_options = set(cmd_dict["required_options"])
+            return OPSvcAcctSupportCode(SVC_ACCT_CMD_NOT_SUPPORTED, _support_msg)
 
-            # how many required options remain after we mask out
-            # the provided options? Hopefully none
-            # we use the diff for two purposes:
-            # 1. to test if any required options were omitted
-            # 2. to generate a meaninful error message if needed
-            reqd_opt_diff = required_options - set(subcmd_options)
+        key = (command, chain, frozenset(subcmd_options))
+        supported = self._support_cache.get(key)
+        if supported is None:
+            cmd_options = None
+            if cmd_spec is not None and chain is not None:
+                cmd_options = cmd_spec[chain]
+            supported = self._options_supported(cmd_options, key[2])
+            self._support_cache[key] = supported
 
-            if not reqd_opt_diff:
-                # all required options were in use, so we're good here
-                required_opt_satified = True
-            else:
-                _support_code = SVC_ACCT_INCOMPAT_OPTIONS
-
-            prohibited_options = set(cmd_dict["prohibited_options"])
+        return supported
 
-            # how many probited options remain after we mask out
-            # the provided options? Hopefully all of them
-            remaining = prohibited_options - set(subcmd_options)
+    @classmethod
+    def _split_argv(cls, argv: List[str]) -> Tuple[Optional[str], List[str], List[str]]:
+        # [op_exe, [global options, ...], command, [subcommands, ...], [--sub-cmd-options, ...]]
+        # skip argv[0], the op exe path
+        i = 1
+        argc = len(argv)
 
-            if remaining == prohibited_options:
-                # didn't use any prohbited options, so we're good here
-                prohibited_opt_satisfied = True
-            else:
-                # which prohibted options were actually used?
-                # we need this to generate the error message
-                prohib_opt_diff = prohibited_options - remaining
-                _support_code = SVC_ACCT_INCOMPAT_OPTIONS
+        # skip global options
+        while i < argc and argv[i].startswith("--"):
+            # does the option have an argument that also
+            # needs to be skipped?
+            # e.g., if we skipped "--format", we also
+            # need to skip its argument, "json"
+            if argv[i] in cls.GLOBAL_OPTIONS_WITH_ARGS:
+                i += 1
+            i += 1
 
-            if required_opt_satified and prohibited_opt_satisfied:
-                # if both
-                _support_code = SVC_ACCT_SUPPORTED
+        # get primary command
+        command = None
+        if i < argc:
+            command = argv[i]
+            i += 1
 
-        if _support_code == SVC_ACCT_INCOMPAT_OPTIONS:
-            _support_msg = ""
-            if not required_opt_satified:
-                _support_msg += f"Required options not provided: [{','.join(list(reqd_opt_diff))}]"
+        # build subcommands, which may include positional arguments
+        subcommands = []
+        while i < argc and not argv[i].startswith("--"):
+            subcommands.append(argv[i])
+            i += 1
+
+        # all remaining subcommand options, ignoring option-arguments
+        # e.g, save "--vault", but skip argument "Test Data"
+        subcmd_options = [arg for arg in argv[i:] if arg.startswith("--")]
+
+        return (command, subcommands, subcmd_options)
+
+    @classmethod
+    def _subcommand_chain(cls,
+                          cmd_spec: _CompiledCmdSpec,
+                          subcommands: List[str]) -> Optional[Tuple[str, ...]]:
+        # find the shortest leading part of 'subcommands' that's a known subcommand chain
+        # anything following it may be a positional argument rather than a subcommand
+        # if there are no subcommands (e.g., in the case of op whoami)
+        # then look for the top-level command
+        if not subcommands:
+            return () if () in cmd_spec else None
+
+        chain: Tuple[str, ...] = ()
+        for subcmd in subcommands:
+            chain = chain + (subcmd,)
+            if chain in cmd_spec:
+                return chain
+        return None
+
+    @classmethod
+    def _options_supported(cls,
+                           cmd_options: Optional[_SvcAcctCmdOptions],
+                           subcmd_options: FrozenSet[str]) -> OPSvcAcctSupportCode:
+        if cmd_options is None:
+            # command-less options such as --version are always supported
+            return OPSvcAcctSupportCode(SVC_ACCT_SUPPORTED, None)
 
-            if not prohibited_opt_satisfied:
-                _support_msg += f" Prohibited options found: [{','.join(list(prohib_opt_diff))}]"
+        # which required options were omitted? Hopefully none
+        # we use the diff for two purposes:
+        # 1. to test if any required options were omitted
+        # 2. to generate a meaninful error message if needed
+        reqd_opt_diff = cmd_options.required_options - subcmd_options
+        # which prohibited options were used? Hopefully none
+        prohib_opt_diff = cmd_options.prohibited_options & subcmd_options
 
-            _support_msg = _support_msg.lstrip()
+        if not reqd_opt_diff and not prohib_opt_diff:
+            return OPSvcAcctSupportCode(SVC_ACCT_SUPPORTED, None)
 
-        if _support_code == _SVC_ACCT_CMD_NOT_VALIDATED:  # pragma: no cover
-            # something's gone wrong if we reach this point
-            raise Exception("Failed to validate service account compatibility")
+        _support_msg = ""
+        if reqd_opt_diff:
+            _support_msg += f"Required options not provided: [{','.join(list(reqd_opt_diff))}]"
 
-        supported = OPSvcAcctSupportCode(_support_code, _support_msg)
+        if prohib_opt_diff:
+            _support_msg += f" Prohibited options found: [{','.join(list(prohib_opt_diff))}]"
 
-        return supported
+        _support_msg = _support_msg.lstrip()
+        return OPSvcAcctSupportCode(SVC_ACCT_INCOMPAT_OPTIONS, _support_msg)
@@ -1,16 +1,28 @@
 from .._op_commands import (
+    AUTH_VERIFY_ALWAYS,
+    AUTH_VERIFY_ON_FAILURE,
+    AUTH_VERIFY_REACTIVE,
+    AUTH_VERIFY_TTL,
     EXISTING_AUTH_AVAIL,
     EXISTING_AUTH_IGNORE,
     EXISTING_AUTH_REQD,
-    ExistingAuthEnum
+    AuthVerifyPolicyEnum,
+    ExistingAuthEnum,
+    OPSessionSnapshot
 )
 
 # This causes these types to properly re-exported
 # https://mypy.readthedocs.io/en/stable/config_file.html?highlight=export#confval-implicit_reexport
 # anything that gets imported needs to be added to this list
 __all__ = [
+    "AUTH_VERIFY_ALWAYS",
+    "AUTH_VERIFY_ON_FAILURE",
+    "AUTH_VERIFY_REACTIVE",
+    "AUTH_VERIFY_TTL",
+    "AuthVerifyPolicyEnum",
     "EXISTING_AUTH_AVAIL",
     "EXISTING_AUTH_IGNORE",
     "EXISTING_AUTH_REQD",
-    "ExistingAuthEnum"
+    "ExistingAuthEnum",
+    "OPSessionSnapshot"
 ]
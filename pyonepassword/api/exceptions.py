@@ -3,6 +3,7 @@
 from .. import py_op_exceptions as __py_op_exceptions
 from .._op_cli_version import OPCLIVersionSupportException
 from .._svc_account import OPSvcAcctCommandNotSupportedException
+from ..json import OPJSONBackendException
 from ..op_items._item_type_registry import OPUnknownItemTypeException
 from ..op_items.fields_sections._new_fields import OPNewTOTPUriException
 from ..op_items.fields_sections.item_section import (
@@ -28,7 +29,9 @@ from ..py_op_exceptions import (
     OPCLIPanicException,
     OPCmdFailedException,
     OPCmdMalformedSvcAcctTokenException,
+    OPCommandTimeoutException,
     OPConfigNotFoundException,
+    OPDocumentCreateException,
     OPDocumentDeleteException,
     OPDocumentEditException,
     OPDocumentGetException,
@@ -64,7 +67,9 @@ __all__ = [
     "OPCLIVersionSupportException",
     "OPCmdFailedException",
     "OPCmdMalformedSvcAcctTokenException",
+    "OPCommandTimeoutException",
     "OPConfigNotFoundException",
+    "OPDocumentCreateException",
     "OPDocumentDeleteException",
     "OPDocumentEditException",
     "OPDocumentGetException",
@@ -88,6 +93,7 @@ __all__ = [
     "OPItemGetException",
     "OPItemListException",
     "OPItemShareException",
+    "OPJSONBackendException",
     "OPNewLoginItemURLException",
     "OPNewTOTPUriException",
     "OPNotFoundException",
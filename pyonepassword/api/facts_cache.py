@@ -0,0 +1,20 @@
+from .._facts_cache import (
+    DEFAULT_FACTS_CACHE_MAX_AGE,
+    OPFacts,
+    OPFactsCache,
+    disable_facts_cache,
+    enable_facts_cache,
+    get_facts_cache
+)
+
+# This causes these types to properly re-exported
+# https://mypy.readthedocs.io/en/stable/config_file.html?highlight=export#confval-implicit_reexport
+# anything that gets imported needs to be added to this list
+__all__ = [
+    "DEFAULT_FACTS_CACHE_MAX_AGE",
+    "OPFacts",
+    "OPFactsCache",
+    "disable_facts_cache",
+    "enable_facts_cache",
+    "get_facts_cache"
+]
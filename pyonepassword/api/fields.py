@@ -0,0 +1,13 @@
+from ..op_items.item_field_policy import (
+    disable_lazy_fields,
+    enable_lazy_fields,
+    get_lazy_fields,
+    set_eager_fields_for_class,
+    set_lazy_fields_for_class
+)
+
+__all__ = ["enable_lazy_fields",
+           "disable_lazy_fields",
+           "get_lazy_fields",
+           "set_lazy_fields_for_class",
+           "set_eager_fields_for_class"]
@@ -0,0 +1,22 @@
+from ..json import (
+    JSON_BACKEND_AUTO,
+    JSON_BACKEND_ENV_VAR,
+    JSON_BACKEND_ORJSON,
+    JSON_BACKEND_STDLIB,
+    available_json_backends,
+    get_json_backend,
+    set_json_backend
+)
+
+# This causes these types to properly re-exported
+# https://mypy.readthedocs.io/en/stable/config_file.html?highlight=export#confval-implicit_reexport
+# anything that gets imported needs to be added to this list
+__all__ = [
+    "JSON_BACKEND_AUTO",
+    "JSON_BACKEND_ENV_VAR",
+    "JSON_BACKEND_ORJSON",
+    "JSON_BACKEND_STDLIB",
+    "available_json_backends",
+    "get_json_backend",
+    "set_json_backend"
+]
@@ -0,0 +1,11 @@
+from .._metrics import OPMetrics, disable_metrics, enable_metrics, get_metrics
+
+# This causes these types to properly re-exported
+# https://mypy.readthedocs.io/en/stable/config_file.html?highlight=export#confval-implicit_reexport
+# anything that gets imported needs to be added to this list
+__all__ = [
+    "OPMetrics",
+    "disable_metrics",
+    "enable_metrics",
+    "get_metrics"
+]
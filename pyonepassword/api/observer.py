@@ -0,0 +1,9 @@
+from .._op_cli_observer import OPCommandObserver, OPCommandRecord
+
+# This causes these types to properly re-exported
+# https://mypy.readthedocs.io/en/stable/config_file.html?highlight=export#confval-implicit_reexport
+# anything that gets imported needs to be added to this list
+__all__ = [
+    "OPCommandObserver",
+    "OPCommandRecord"
+]
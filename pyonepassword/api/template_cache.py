@@ -0,0 +1,14 @@
+from ..op_items.template_directory import (
+    clear_template_cache,
+    preload_templates,
+    templates_frozen
+)
+
+# This causes these types to properly re-exported
+# https://mypy.readthedocs.io/en/stable/config_file.html?highlight=export#confval-implicit_reexport
+# anything that gets imported needs to be added to this list
+__all__ = [
+    "clear_template_cache",
+    "preload_templates",
+    "templates_frozen"
+]
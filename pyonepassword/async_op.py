@@ -0,0 +1,562 @@
+from __future__ import annotations
+
+import asyncio
+import fnmatch
+import time
+from typing import Iterable, List, Optional, Tuple, Union
+
+from ._op_cli_argv import _OPArgv
+from ._op_commands import AUTH_VERIFY_ALWAYS, AUTH_VERIFY_REACTIVE
+from .op_items._item_list import OPItemList
+from .op_items._item_type_registry import (
+    OPItemFactory,
+    OPUnknownItemTypeException
+)
+from .op_items.item_types._item_base import OPAbstractItem
+from .op_items.item_types._item_descriptor_base import OPAbstractItemDescriptor
+from .op_items.totp import OPTOTPItem
+from .op_objects import (
+    OPGroup,
+    OPGroupDescriptorList,
+    OPUser,
+    OPUserDescriptorList,
+    OPVault,
+    OPVaultDescriptorList
+)
+from .py_op_exceptions import (
+    OPCmdFailedException,
+    OPCommandTimeoutException,
+    OPDocumentGetException,
+    OPGroupGetException,
+    OPGroupListException,
+    OPInvalidDocumentException,
+    OPInvalidItemException,
+    OPItemGetException,
+    OPItemListException,
+    OPUserGetException,
+    OPUserListException,
+    OPVaultGetException,
+    OPVaultListException
+)
+from .pyonepassword import OP
+
+# Default maximum number of concurrent 'op' processes for an AsyncOP object
+DEFAULT_ASYNC_MAX_CONCURRENCY = 8
+
+
+class AsyncOP:
+    """
+    Class for querying a 1Password account via the 'op' cli command from asyncio code.
+
+    AsyncOP wraps a signed-in OP object, and provides coroutine versions of OP's query methods.
+    'op' commands are run via asyncio subprocesses rather than blocking the event loop,
+    and at most 'max_concurrency' 'op' commands run at a time.
+
+    Operations not provided here, such as item creation and editing, are available
+    synchronously on the wrapped OP object via AsyncOP.op
+
+    Authentication verification policy and 'auth_retry' are taken from the wrapped OP object.
+    Since 'op whoami' and re-authentication are run in a worker thread, a policy other than
+    AUTH_VERIFY_ALWAYS, such as AUTH_VERIFY_REACTIVE, is recommended
+    """
+
+    def __init__(self, op: OP, max_concurrency: int = DEFAULT_ASYNC_MAX_CONCURRENCY):
+        """
+        Create an AsyncOP object from an already signed-in OP object
+
+        Parameters
+        ----------
+        op : OP
+            The signed-in OP object to run commands on behalf of
+        max_concurrency : int, optional
+            Maximum number of 'op' commands to run concurrently, by default 8
+        """
+        if max_concurrency < 1:
+            raise ValueError("max_concurrency must be at least 1")
+        self._op = op
+        self._max_concurrency = max_concurrency
+        # created lazily, so they're bound to the event loop the AsyncOP object is used from
+        self._semaphore: Optional[asyncio.Semaphore] = None
+        self._reauth_lock: Optional[asyncio.Lock] = None
+
+    @classmethod
+    async def create(cls, *args, max_concurrency: int = DEFAULT_ASYNC_MAX_CONCURRENCY, **kwargs) -> AsyncOP:
+        """
+        Create and sign in an OP object without blocking the event loop, and return
+        an AsyncOP object wrapping it
+
+        All arguments other than 'max_concurrency' are passed through to OP()
+
+        Parameters
+        ----------
+        max_concurrency : int, optional
+            Maximum number of 'op' commands to run concurrently, by default 8
+
+        Returns
+        -------
+        AsyncOP
+            An AsyncOP object wrapping the newly created OP object
+        """
+        op = await asyncio.to_thread(OP, *args, **kwargs)
+        return cls(op, max_concurrency=max_concurrency)
+
+    @property
+    def op(self) -> OP:
+        return self._op
+
+    @property
+    def max_concurrency(self) -> int:
+        return self._max_concurrency
+
+    async def item_get(self, item_identifier, vault=None, include_archive=False, generic_okay=False, relaxed_validation=False) -> OPAbstractItem:
+        """
+        Get an 'item' object from a 1Password vault.
+
+        See OP.item_get() for details
+
+        Raises
+        ------
+        OPItemGetException
+            If the lookup fails for any reason during command execution
+        OPInvalidItemException
+            If the item JSON fails to decode
+        OPUnknownItemTypeException
+            If the item object returned by 1Password isn't a known type and generic_okay is False
+        OPNotFoundException
+            If the 1Password command can't be found
+
+        Returns
+        -------
+        item: OPAbstractItem
+            An item object of one of the types extending OPAbstractItem
+        """
+        argv = self._op._item_get_argv(
+            item_identifier, vault=vault, include_archive=include_archive)
+        try:
+            output = await self._run_with_auth_check(argv, capture_stdout=True, decode="utf-8")
+        except OPCmdFailedException as ocfe:
+            raise OPItemGetException.from_opexception(ocfe) from ocfe
+        op_item = OPItemFactory.op_item(
+            output, generic_okay=generic_okay, relaxed_validation=relaxed_validation)
+        return op_item
+
+    async def item_get_many(self,
+                            item_identifiers: Iterable[Union[str, OPAbstractItemDescriptor]],
+                            vault=None,
+                            include_archive=False,
+                            generic_okay=False,
+                            relaxed_validation=False) -> List[Union[OPAbstractItem, Exception]]:
+        """
+        Get multiple 'item' objects from a 1Password vault concurrently.
+
+        See OP.item_get_many() for details. Concurrency is limited by this object's 'max_concurrency'
+
+        Returns
+        -------
+        items: List[Union[OPAbstractItem, Exception]]
+            A list of item objects, in the same order as 'item_identifiers'.
+            If an individual lookup fails, the exception raised for that item is placed in the list
+            instead, rather than aborting the remaining lookups
+        """
+        async def _get_one(item_identifier) -> Union[OPAbstractItem, Exception]:
+            item: Union[OPAbstractItem, Exception]
+            if isinstance(item_identifier, OPAbstractItemDescriptor):
+                item_identifier = item_identifier.unique_id
+            try:
+                item = await self.item_get(item_identifier,
+                                           vault=vault,
+                                           include_archive=include_archive,
+                                           generic_okay=generic_okay,
+                                           relaxed_validation=relaxed_validation)
+            except (OPItemGetException,
+                    OPInvalidItemException,
+                    OPUnknownItemTypeException) as e:
+                item = e
+            return item
+
+        tasks = [asyncio.ensure_future(_get_one(identifier))
+                 for identifier in item_identifiers]
+        try:
+            items = await asyncio.gather(*tasks)
+        except BaseException:
+            # any other exception means the remaining lookups are likely to fail as well
+            for task in tasks:
+                task.cancel()
+            raise
+        return list(items)
+
+    async def item_get_password(self, item_identifier, vault=None, relaxed_validation=False) -> str:
+        """
+        Get the value of the password field from the item specified by name or UUID.
+
+        See OP.item_get_password() for details
+
+        Raises
+        ------
+        OPInvalidItemException
+            If the item has no password attribute
+        OPItemGetException
+            If the lookup fails for any reason during command execution
+
+        Returns
+        -------
+        password: str
+            Value of the item's 'password' attribute
+        """
+        item = await self.item_get(item_identifier, vault=vault,
+                                   relaxed_validation=relaxed_validation)
+
+        # satisfy 'mypy': OPAbstractItem has no "password" attribute
+        if not hasattr(item, "password"):
+            raise OPInvalidItemException(
+                f"Item: {item.title} has no password attribute")
+        password = item.password
+        return password
+
+    async def item_get_filename(self, item_identifier, vault=None, include_archive=False, relaxed_validation=False):
+        """
+        Get the fileName attribute of a document item from a 1Password vault by name or UUID.
+
+        See OP.item_get_filename() for details
+
+        Raises
+        ------
+        AttributeError
+            If the item doesn't have a 'fileName' attribute
+        OPItemGetException
+            If the lookup fails for any reason during command execution
+
+        Returns
+        -------
+        file_name: str
+            Value of the item's 'fileName' attribute
+        """
+        item = await self.item_get(item_identifier, vault=vault,
+                                   include_archive=include_archive, relaxed_validation=relaxed_validation)
+
+        if hasattr(item, "file_name"):
+            file_name = item.file_name
+        else:
+            raise AttributeError(
+                f"{item.__class__.__name__} object has no attribute 'file_name'")
+
+        return file_name
+
+    async def item_get_totp(self, item_identifier: str, vault=None) -> OPTOTPItem:
+        """
+        Get a TOTP code from the item specified by name or UUID.
+
+        See OP.item_get_totp() for details
+
+        Raises
+        ------
+        OPItemGetException
+            If the lookup fails for any reason during command execution
+
+        Returns
+        -------
+        totp: OPTOTPItem
+            An OPTOTPItem object
+        """
+        argv = self._op._item_get_totp_argv(item_identifier, vault=vault)
+        try:
+            output = await self._run_with_auth_check(argv, capture_stdout=True, decode="utf-8")
+        except OPCmdFailedException as ocfe:
+            raise OPItemGetException.from_opexception(ocfe) from ocfe
+        totp = OPTOTPItem(output)
+        return totp
+
+    async def item_list(self,
+                        categories: Optional[List[str]] = None,
+                        include_archive: bool = False,
+                        tags: Optional[List[str]] = None,
+                        title_glob: str = None,
+                        vault: str = None,
+                        generic_okay: bool = True) -> OPItemList:
+        """
+        Return a list of items in an account.
+
+        See OP.item_list() for details
+
+        Raises
+        ------
+        OPItemListException
+            If the item list operation fails for any reason during command execution
+
+        Returns
+        -------
+        item_list: OPItemList
+            An OPItemList object
+        """
+        if tags is None:
+            tags = list()
+        if categories is None:
+            categories = list()
+
+        argv = self._op._item_list_argv(categories=categories,
+                                        include_archive=include_archive,
+                                        tags=tags,
+                                        vault=vault)
+        try:
+            item_list_json = await self._run_with_auth_check(argv, capture_stdout=True, decode="utf-8")
+        except OPCmdFailedException as ocfe:
+            raise OPItemListException.from_opexception(ocfe) from ocfe
+        item_list = OPItemList(item_list_json, generic_okay=generic_okay)
+
+        if title_glob:
+            _list = []
+            for obj in item_list:
+                if fnmatch.fnmatch(obj.title, title_glob):
+                    _list.append(obj)
+            item_list = OPItemList(_list)
+        return item_list
+
+    async def document_get(self, document_name_or_id, vault=None, include_archive=False, relaxed_validation=False) -> Tuple[str, bytes]:
+        """
+        Download a document object from a 1Password vault by name or UUID.
+
+        See OP.document_get() for details
+
+        Raises
+        ------
+        OPInvalidDocumentException
+            If the retrieved item isn't a document object or lacks a document filename attribute
+        OPDocumentGetException
+            If the lookup fails for any reason during command execution
+
+        Returns
+        -------
+        file_name, document bytes: Tuple[str, bytes]
+            A tuple consisting of the filename and bytes of the specified document
+        """
+        try:
+            file_name = await self.item_get_filename(
+                document_name_or_id, vault=vault, include_archive=include_archive, relaxed_validation=relaxed_validation)
+        except AttributeError as ae:
+            raise OPInvalidDocumentException(
+                "Item has no 'fileName' attribute") from ae
+        except OPCmdFailedException as ocfe:
+            raise OPDocumentGetException.from_opexception(ocfe) from ocfe
+
+        argv = self._op._document_get_argv(
+            document_name_or_id, vault=vault, include_archive=include_archive)
+        try:
+            document_bytes = await self._run_with_auth_check(argv, capture_stdout=True)
+        except OPCmdFailedException as ocfe:
+            raise OPDocumentGetException.from_opexception(ocfe) from ocfe
+
+        return (file_name, document_bytes)
+
+    async def vault_get(self, vault_name_or_id: str) -> OPVault:
+        """
+        Return the details for the vault specified by name or UUID.
+
+        Raises
+        ------
+        OPVaultGetException
+            If the lookup fails for any reason during command execution
+
+        Returns
+        -------
+        vault: OPVault
+            An OPVault object
+        """
+        argv = self._op._vault_get_argv(vault_name_or_id)
+        try:
+            vault_json = await self._run_with_auth_check(argv, capture_stdout=True, decode="utf-8")
+        except OPCmdFailedException as ocfe:
+            raise OPVaultGetException.from_opexception(ocfe) from ocfe
+        vault = OPVault(vault_json)
+        return vault
+
+    async def vault_list(self, group_name_or_id=None, user_name_or_id=None) -> OPVaultDescriptorList:
+        """
+        List vaults in an account, optionally filtered by group or user.
+
+        Raises
+        ------
+        OPVaultListException
+            If the vault list operation fails for any reason during command execution
+
+        Returns
+        -------
+        vault_list: OPVaultDescriptorList
+            An OPVaultDescriptorList object
+        """
+        argv = self._op._vault_list_argv(
+            group_name_or_id=group_name_or_id, user_name_or_id=user_name_or_id)
+        try:
+            vault_list_json = await self._run_with_auth_check(argv, capture_stdout=True, decode="utf-8")
+        except OPCmdFailedException as ocfe:
+            raise OPVaultListException.from_opexception(ocfe) from ocfe
+        vault_list = OPVaultDescriptorList(vault_list_json)
+        return vault_list
+
+    async def user_get(self, user_name_or_id: str) -> OPUser:
+        """
+        Return the details for the user specified by name or UUID.
+
+        Raises
+        ------
+        OPUserGetException
+            If the lookup fails for any reason during command execution
+
+        Returns
+        -------
+        user: OPUser
+            An OPUser object
+        """
+        argv = self._op._user_get_argv(user_name_or_id)
+        try:
+            user_json = await self._run_with_auth_check(argv, capture_stdout=True, decode="utf-8")
+        except OPCmdFailedException as ocfe:
+            raise OPUserGetException.from_opexception(ocfe) from ocfe
+        user = OPUser(user_json)
+        return user
+
+    async def user_list(self, group_name_or_id=None, vault_name_or_id=None) -> OPUserDescriptorList:
+        """
+        List users in an account, optionally filtered by group or vault.
+
+        Raises
+        ------
+        OPUserListException
+            If the user list operation fails for any reason during command execution
+
+        Returns
+        -------
+        user_list: OPUserDescriptorList
+            An OPUserDescriptorList object
+        """
+        argv = self._op._user_list_argv(
+            group_name_or_id=group_name_or_id, vault=vault_name_or_id)
+        try:
+            user_list_json = await self._run_with_auth_check(argv, capture_stdout=True, decode="utf-8")
+        except OPCmdFailedException as ocfe:
+            raise OPUserListException.from_opexception(ocfe) from ocfe
+        user_list = OPUserDescriptorList(user_list_json)
+        return user_list
+
+    async def group_get(self, group_name_or_id: str) -> OPGroup:
+        """
+        Return the details for the group specified by name or UUID.
+
+        Raises
+        ------
+        OPGroupGetException
+            If the lookup fails for any reason during command execution
+
+        Returns
+        -------
+        group: OPGroup
+            An OPGroup object
+        """
+        argv = self._op._group_get_argv(group_name_or_id)
+        try:
+            group_json = await self._run_with_auth_check(argv, capture_stdout=True, decode="utf-8")
+        except OPCmdFailedException as ocfe:
+            raise OPGroupGetException.from_opexception(ocfe) from ocfe
+        group = OPGroup(group_json)
+        return group
+
+    async def group_list(self, user_name_or_id=None, vault=None) -> OPGroupDescriptorList:
+        """
+        List groups in an account, optionally filtered by user or vault.
+
+        Raises
+        ------
+        OPGroupListException
+            If the group list operation fails for any reason during command execution
+
+        Returns
+        -------
+        group_list: OPGroupDescriptorList
+            An OPGroupDescriptorList object
+        """
+        argv = self._op._group_list_argv(
+            user_name_or_id=user_name_or_id, vault=vault)
+        try:
+            group_list_json = await self._run_with_auth_check(argv, capture_stdout=True, decode="utf-8")
+        except OPCmdFailedException as ocfe:
+            raise OPGroupListException.from_opexception(ocfe) from ocfe
+        group_list = OPGroupDescriptorList(group_list_json)
+        return group_list
+
+    def _get_semaphore(self) -> asyncio.Semaphore:
+        if self._semaphore is None:
+            self._semaphore = asyncio.Semaphore(self._max_concurrency)
+        return self._semaphore
+
+    def _get_reauth_lock(self) -> asyncio.Lock:
+        if self._reauth_lock is None:
+            self._reauth_lock = asyncio.Lock()
+        return self._reauth_lock
+
+    async def _verify_auth(self):
+        op = self._op
+        async with self._get_semaphore():
+            await asyncio.to_thread(op._verify_auth, op.op_path, op._account_identifier,
+                                    timeout=op.timeout)
+
+    async def _reauthenticate(self, started_at: float):
+        op = self._op
+        # only one task at a time waits on a thread for the OP object's own
+        # reauthentication lock, which is also shared with non-async callers
+        async with self._get_reauth_lock():
+            await asyncio.to_thread(op._reauthenticate_after_failure, started_at)
+
+    async def _run_with_timeout_retry(self, argv: _OPArgv, **kwargs):
+        # asyncio counterpart to _OPCommandInterface._run_with_timeout_retry()
+        op = self._op
+        retries = op._timeout_retries if argv.is_read_only() else 0
+        attempt = 0
+        while True:
+            try:
+                output = await op._run_async(argv, timeout=op.timeout, **kwargs)
+                break
+            except OPCommandTimeoutException:
+                if attempt >= retries:
+                    raise
+                attempt += 1
+                op.logger.warning(
+                    f"Retrying timed out 'op' command, attempt {attempt} of {retries}")
+        return output
+
+    async def _run_with_auth_check(self,
+                                   argv: _OPArgv,
+                                   capture_stdout: bool = False,
+                                   input: Union[str, bytes] = None,
+                                   decode: str = None):
+        # asyncio counterpart to _OPCommandInterface._run_with_auth_check()
+        op = self._op
+        # this may stat() 'op' and run 'op --version', so keep it off the event loop
+        await asyncio.to_thread(op._check_op_version, op.op_path, timeout=op.timeout)
+        if op._auth_verification_due():
+            await self._verify_auth()
+
+        op._check_svc_account_support(argv)
+
+        # at most one retry, and only if a new sign-in is performed in between
+        attempts = 0
+        max_attempts = 2 if op._auth_retry else 1
+        while True:
+            attempts += 1
+            started_at = time.monotonic()
+            try:
+                async with self._get_semaphore():
+                    output = await self._run_with_timeout_retry(argv,
+                                                                capture_stdout=capture_stdout,
+                                                                input=input,
+                                                                decode=decode)
+                break
+            except OPCmdFailedException as ocfe:
+                if op.auth_verify_policy == AUTH_VERIFY_REACTIVE:
+                    op._raise_unless_reauth_possible(
+                        ocfe, attempts, max_attempts)
+                    await self._reauthenticate(started_at)
+                    continue
+                elif op.auth_verify_policy != AUTH_VERIFY_ALWAYS:
+                    await self._verify_auth()
+                raise
+
+        return output
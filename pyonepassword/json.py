@@ -1,4 +1,204 @@
+import codecs
+import io
 import json
+import os
+import re
+from typing import IO, Any, Dict, Iterator, List, Optional, Tuple, Type, Union
+
+try:
+    import orjson
+except ImportError:  # pragma: no coverage
+    orjson = None
+
+# Default number of bytes (or characters) to read from a stream at a time
+DEFAULT_STREAM_CHUNK_SIZE = 64 * 1024
+
+# Environment variable to select a JSON backend, if not selected via set_json_backend()
+JSON_BACKEND_ENV_VAR = "PYOP_JSON_BACKEND"
+
+JSON_BACKEND_AUTO = "auto"
+JSON_BACKEND_STDLIB = "stdlib"
+JSON_BACKEND_ORJSON = "orjson"
+
+_NON_WHITESPACE = re.compile(r"\S")
+
+
+class OPJSONBackendException(Exception):
+    pass
+
+
+class _StdlibJSONBackend:
+    """
+    JSON backend using python's 'json' module
+
+    Other backends must produce the same objects this one does
+    """
+    NAME = JSON_BACKEND_STDLIB
+
+    def loads(self, json_str: Union[str, bytes]) -> Any:
+        obj = json.loads(json_str)
+        return obj
+
+    def loads_multiple(self, json_str: str) -> List[Any]:
+        # read the entire string in one go, since it's already in memory
+        chunk_size = max(len(json_str), 1)
+        objects = list(unjson_stream(
+            io.StringIO(json_str), chunk_size=chunk_size))
+        return objects
+
+    def dumps(self, obj: Any, indent: Optional[int] = None) -> str:
+        json_str = json.dumps(obj, indent=indent)
+        return json_str
+
+
+class _OrjsonJSONBackend(_StdlibJSONBackend):
+    """
+    JSON backend that decodes using 'orjson', falling back to the 'json' module
+    for anything 'orjson' wouldn't decode the same way
+
+    Encoding is left to the 'json' module, since 'orjson' can't produce identical output
+    (e.g., it doesn't escape non-ASCII characters, or put spaces after separators), and
+    serialized JSON is often sent to 'op'
+    """
+    NAME = JSON_BACKEND_ORJSON
+
+    # 'orjson' decodes integers too big for 64 bits as floats, rather than ints
+    # Any such integer has at least 20 digits, so look for a run of 20 digits,
+    # after turning all digits into zeros
+    _ZERO_DIGITS = bytes.maketrans(b"123456789", b"000000000")
+    _BIG_INT_DIGITS = b"0" * 20
+
+    # 'orjson' can't decode concatenated documents, as 'op' outputs when getting
+    # multiple items. Since JSON strings can't contain raw newlines, and '}' can only
+    # be followed by '{' between documents, this only matches between objects
+    _OBJECT_BOUNDARY = re.compile(r"(?<=\})\s*\n\s*(?=\{)")
+
+    # returned by _orjson_loads() when the 'json' module has to be used instead
+    _USE_STDLIB = object()
+
+    def _orjson_loads(self, json_str: Union[str, bytes]) -> Any:
+        try:
+            if isinstance(json_str, str):
+                json_bytes = json_str.encode("utf-8")
+            else:
+                json_bytes = json_str
+        except UnicodeEncodeError:
+            # lone surrogates, which the 'json' module decodes, but 'orjson' can't
+            return self._USE_STDLIB
+
+        if self._BIG_INT_DIGITS in json_bytes.translate(self._ZERO_DIGITS):
+            return self._USE_STDLIB
+
+        try:
+            obj = orjson.loads(json_bytes)
+        except orjson.JSONDecodeError:
+            # Either this is JSON 'orjson' doesn't support, such as NaN,
+            # or it's invalid, in which case the 'json' module should raise
+            # the same exception it always would
+            obj = self._USE_STDLIB
+        return obj
+
+    def loads(self, json_str: Union[str, bytes]) -> Any:
+        obj = self._orjson_loads(json_str)
+        if obj is self._USE_STDLIB:
+            obj = super().loads(json_str)
+        return obj
+
+    def loads_multiple(self, json_str: str) -> List[Any]:
+        objects = []
+        for document in self._OBJECT_BOUNDARY.split(json_str):
+            obj = self._orjson_loads(document)
+            if obj is self._USE_STDLIB:
+                # documents that aren't objects, or aren't separated by newlines
+                # Start over, letting the 'json' module sort it out
+                return super().loads_multiple(json_str)
+            objects.append(obj)
+        return objects
+
+
+_JSON_BACKENDS: Dict[str, Type[_StdlibJSONBackend]] = {
+    JSON_BACKEND_STDLIB: _StdlibJSONBackend
+}
+if orjson is not None:
+    _JSON_BACKENDS[JSON_BACKEND_ORJSON] = _OrjsonJSONBackend
+
+# in order of preference when the backend is "auto"
+_AUTO_JSON_BACKENDS = [JSON_BACKEND_ORJSON, JSON_BACKEND_STDLIB]
+
+_active_json_backend: Optional[_StdlibJSONBackend] = None
+
+
+def available_json_backends() -> List[str]:
+    """
+    Get the names of the JSON backends that are available
+
+    Returns
+    -------
+    List[str]
+        Names of available backends. "stdlib" is always available
+    """
+    return list(_JSON_BACKENDS.keys())
+
+
+def set_json_backend(backend_name: str = JSON_BACKEND_AUTO) -> str:
+    """
+    Select the JSON backend used to decode and encode JSON process-wide
+
+    Parameters
+    ----------
+    backend_name : str, optional
+        "orjson", "stdlib", or "auto", by default "auto"
+        "auto" selects the fastest available backend
+
+    Returns
+    -------
+    str
+        The name of the selected backend
+
+    Raises
+    ------
+    OPJSONBackendException
+        If the requested backend is unknown, or not installed
+    """
+    global _active_json_backend
+    if backend_name == JSON_BACKEND_AUTO:
+        backend_name = next(
+            name for name in _AUTO_JSON_BACKENDS if name in _JSON_BACKENDS)
+    try:
+        backend_class = _JSON_BACKENDS[backend_name]
+    except KeyError as e:
+        raise OPJSONBackendException(
+            f"JSON backend '{backend_name}' is unknown or not installed. "
+            f"Available backends: {available_json_backends()}") from e
+    _active_json_backend = backend_class()
+    return backend_name
+
+
+def get_json_backend() -> str:
+    """
+    Get the name of the active JSON backend
+
+    If no backend has been selected via set_json_backend(), the backend is
+    selected from the PYOP_JSON_BACKEND environment variable, or "auto" if it's not set
+
+    Returns
+    -------
+    str
+        The name of the active backend, such as "orjson" or "stdlib"
+    """
+    backend = _json_backend()
+    return backend.NAME
+
+
+def _json_backend() -> _StdlibJSONBackend:
+    if _active_json_backend is None:
+        backend_name = os.environ.get(JSON_BACKEND_ENV_VAR, JSON_BACKEND_AUTO)
+        try:
+            set_json_backend(backend_name)
+        except OPJSONBackendException as e:
+            raise OPJSONBackendException(
+                f"Invalid {JSON_BACKEND_ENV_VAR} environment variable: {e}") from e
+    return _active_json_backend
 
 
 def safe_unjson(json_or_obj):
@@ -6,7 +206,201 @@ def safe_unjson(json_or_obj):
     Transparently un-json things if they are strings, and no-op if not
     """
     if isinstance(json_or_obj, str):
-        obj = json.loads(json_or_obj)
+        obj = _json_backend().loads(json_or_obj)
     else:
         obj = json_or_obj
     return obj
+
+
+def serialize_json(obj: Any, indent: Optional[int] = None) -> str:
+    """
+    Serialize an object to JSON using the active JSON backend
+
+    Parameters
+    ----------
+    obj : Any
+        The object to serialize
+    indent : int, optional
+        Number of spaces to indent nested objects & lists, by default None
+
+    Returns
+    -------
+    str
+        The serialized JSON
+    """
+    json_str = _json_backend().dumps(obj, indent=indent)
+    return json_str
+
+
+class _DocumentScanner:
+    """
+    Find where each top-level JSON document ends, in text that arrives a piece at a time
+
+    Nesting depth, and whether we're inside a string, are carried over from one piece
+    to the next, so each character is scanned once, rather than repeatedly trying to
+    decode a partial document
+    """
+    # everything up to the next bracket, including any complete strings
+    _SKIP_TO_BRACKET = re.compile(r'(?:[^"{}\[\]]+|"[^"\\]*(?:\\.[^"\\]*)*")*',
+                                  re.DOTALL)
+    # the rest of a string, through its closing quote
+    _STRING_REST = re.compile(r'[^"\\]*(?:\\.[^"\\]*)*"', re.DOTALL)
+    # whatever ends a number, true, false, or null
+    _SCALAR_END = re.compile(r'[\s{}\[\]"]')
+
+    def __init__(self):
+        self.in_document = False
+        self._depth = 0
+        self._in_string = False
+        self._escape_pending = False
+        self._scalar = False
+
+    def scan(self, text: str, pos: int) -> Optional[Tuple[int, Optional[int]]]:
+        """
+        Scan 'text' from 'pos', returning where the current document starts in 'text',
+        and where it ends, or None if it continues past the end of 'text'
+
+        Returns None if there's nothing but whitespace between documents
+        """
+        if self.in_document:
+            start = pos
+        else:
+            non_ws = _NON_WHITESPACE.search(text, pos)
+            if non_ws is None:
+                return None
+            start = non_ws.start()
+            first = text[start]
+            if first in "{[":
+                self._depth = 1
+            elif first == '"':
+                self._in_string = True
+            else:
+                self._scalar = True
+            self.in_document = True
+            pos = start + 1
+
+        end = self._document_end(text, pos)
+        if end is not None:
+            self.in_document = False
+        return (start, end)
+
+    def _document_end(self, text: str, pos: int) -> Optional[int]:
+        if self._scalar:
+            # objects, arrays, and strings are self-delimiting, but anything else
+            # only ends once something else follows it
+            scalar_end = self._SCALAR_END.search(text, pos)
+            if scalar_end is None:
+                return None
+            self._scalar = False
+            return scalar_end.start()
+
+        while True:
+            if self._in_string:
+                if self._escape_pending:
+                    # the previous piece ended with a backslash, escaping this character
+                    if pos >= len(text):
+                        return None
+                    pos += 1
+                    self._escape_pending = False
+                string_rest = self._STRING_REST.match(text, pos)
+                if string_rest is None:
+                    # the string continues into the next piece
+                    rest = text[pos:]
+                    trailing_backslashes = len(rest) - len(rest.rstrip("\\"))
+                    self._escape_pending = trailing_backslashes % 2 == 1
+                    return None
+                pos = string_rest.end()
+                self._in_string = False
+                if self._depth == 0:
+                    return pos
+
+            pos = self._SKIP_TO_BRACKET.match(text, pos).end()
+            if pos >= len(text):
+                return None
+            char = text[pos]
+            pos += 1
+            if char == '"':
+                # a string that continues into the next piece
+                self._in_string = True
+            elif char in "{[":
+                self._depth += 1
+            else:
+                self._depth -= 1
+                if self._depth == 0:
+                    return pos
+
+
+def unjson_stream(stream: Union[IO[bytes], IO[str]],
+                  chunk_size: int = DEFAULT_STREAM_CHUNK_SIZE,
+                  encoding: str = "utf-8") -> Iterator[Any]:
+    """
+    Incrementally decode a stream of zero or more concatenated JSON documents, such
+    as the output of 'op item get -' when multiple items are provided on stdin
+
+    Objects are yielded one at a time as soon as enough of the stream has been read
+    to decode them, so only one document needs to be held in memory at a time
+
+    Parameters
+    ----------
+    stream : Union[IO[bytes], IO[str]]
+        A binary or text file-like object, such as a subprocess's stdout pipe
+    chunk_size : int, optional
+        Number of bytes (or characters) to read at a time, by default 64 KiB
+    encoding : str, optional
+        Encoding to decode a binary stream with, by default "utf-8"
+
+    Yields
+    ------
+    Any
+        Each decoded JSON document, in stream order
+
+    Raises
+    ------
+    JSONDecodeError
+        If the stream contains invalid JSON, or ends partway through a document
+    """
+    backend = _json_backend()
+    scanner = _DocumentScanner()
+    # decode bytes incrementally so a multi-byte character split across
+    # two reads doesn't cause a UnicodeDecodeError
+    text_decoder = codecs.getincrementaldecoder(encoding)()
+    # pieces of the current, partially read, document
+    pieces: List[str] = []
+
+    while True:
+        chunk = stream.read(chunk_size)
+        if isinstance(chunk, bytes):
+            text = text_decoder.decode(chunk, final=not chunk)
+        else:
+            text = chunk
+        pos = 0
+        while pos < len(text):
+            found = scanner.scan(text, pos)
+            if found is None:
+                break
+            start, end = found
+            if end is None:
+                pieces.append(text[start:])
+                break
+            pieces.append(text[start:end])
+            # only decode once the whole document has been read
+            obj = backend.loads("".join(pieces))
+            pieces = []
+            pos = end
+            yield obj
+        if not chunk:
+            break
+
+    if pieces:
+        # either a number (or true/false/null) that ended with the stream, or a
+        # partial document, which raises JSONDecodeError
+        yield backend.loads("".join(pieces))
+
+
+def unjson_multiple(json_str: str) -> List[Any]:
+    """
+    Decode a string consisting of zero or more concatenated JSON documents, such
+    as the output of 'op item get -' when multiple items are provided on stdin
+    """
+    objects = _json_backend().loads_multiple(json_str)
+    return objects
@@ -1,7 +1,6 @@
-import json
 from typing import List, Union
 
-from ..json import safe_unjson
+from ..json import safe_unjson, serialize_json
 from ._item_descriptor_registry import OPItemDescriptorFactory
 from .item_types._item_descriptor_base import OPAbstractItemDescriptor
 
@@ -10,10 +9,20 @@ class OPItemList(List[OPAbstractItemDescriptor]):
     def __init__(self, item_list_json: Union[str, List], generic_okay=False):
         super().__init__()
         item_list = safe_unjson(item_list_json)
-        for i_dict in item_list:
-            descriptor = OPItemDescriptorFactory.item_descriptor(
-                i_dict, generic_okay=generic_okay)
-            self.append(descriptor)
+        if item_list is not item_list_json:
+            # We decoded this list ourselves, so nothing else refers to it.
+            # Pop each dictionary as its descriptor is made, so it can be freed
+            # right away, rather than once the whole list is done.
+            # The order doesn't matter since we sort below
+            while item_list:
+                descriptor = OPItemDescriptorFactory.item_descriptor(
+                    item_list.pop(), generic_okay=generic_okay)
+                self.append(descriptor)
+        else:
+            for i_dict in item_list:
+                descriptor = OPItemDescriptorFactory.item_descriptor(
+                    i_dict, generic_okay=generic_okay)
+                self.append(descriptor)
 
         # 'op item list' returns items in a non-deterministic order
         # so sorting ourselves hopefully ensures we are in a consistent order every time
@@ -22,7 +31,7 @@ class OPItemList(List[OPAbstractItemDescriptor]):
         self.sort()
 
     def serialize(self, indent=None) -> str:
-        json_str = json.dumps(self, indent=indent)
+        json_str = serialize_json(self, indent=indent)
         return json_str
 
     def sort(self):  # type: ignore[override]
@@ -1,6 +1,8 @@
+import time
 from json.decoder import JSONDecodeError
 from typing import Any, Dict, Type, Union
 
+from .._metrics import get_metrics
 from ..json import safe_unjson
 from ..py_op_exceptions import OPInvalidItemException
 from .item_types._item_base import OPAbstractItem
@@ -114,6 +116,9 @@ class OPItemFactory:
         OPInvalidItemException
             If unserializing JSON fails, or the dictionary is otherwise invalid for an item object
         """
+        metrics = get_metrics()
+        if metrics is not None:
+            start = time.perf_counter()
         try:
             item_dict = safe_unjson(item_json_or_dict)
         except JSONDecodeError as jdce:
@@ -121,6 +126,8 @@ class OPItemFactory:
                 f"Failed to unserialize item JSON: {jdce}") from jdce
         obj = cls._item_from_dict(
             item_dict, generic_okay=generic_okay, relaxed_validation=relaxed_validation)
+        if metrics is not None:
+            metrics.item_parsed(time.perf_counter() - start)
         return obj
 
 
@@ -1,6 +1,6 @@
-import json
 from typing import Dict, List, Optional
 
+from ..json import serialize_json
 from ..py_op_exceptions import OPInvalidItemException
 from ._new_field_registry import OPNewItemField, OPNewItemFieldFactory
 from .fields_sections.item_field_base import OPItemField
@@ -215,7 +215,7 @@ class OPNewItemMixin:
         super().__init__(*args)
 
     def serialize(self, indent=None) -> str:
-        json_str = json.dumps(self, indent=indent)
+        json_str = serialize_json(self, indent=indent)
         return json_str
 
     def supports_passwords(self) -> bool:
@@ -0,0 +1,37 @@
+from typing import Dict, Generic, Iterable, List, Protocol, TypeVar
+
+
+class _Labeled(Protocol):
+    @property
+    def label(self) -> str: ...  # pragma: no coverage
+
+
+T = TypeVar("T", bound=_Labeled)
+
+
+class _LabelIndex(Generic[T]):
+    """
+    Index of fields or sections by label, both exactly and case-insensitively
+
+    Labels aren't unique, so each label maps to every matching object, in the
+    order they were added
+    """
+
+    def __init__(self, labeled: Iterable[T]):
+        self._exact: Dict[str, List[T]] = {}
+        self._lower: Dict[str, List[T]] = {}
+        for obj in labeled:
+            self.add(obj)
+
+    def add(self, obj: T):
+        label = obj.label
+        self._exact.setdefault(label, []).append(obj)
+        self._lower.setdefault(label.lower(), []).append(obj)
+
+    def lookup(self, label: str, case_sensitive: bool = True) -> List[T]:
+        if case_sensitive:
+            matches = self._exact.get(label)
+        else:
+            matches = self._lower.get(label.lower())
+        # return a copy so callers can't modify the index
+        return list(matches) if matches else []
@@ -1,8 +1,9 @@
 import copy
-from typing import List, Union
+from typing import List, Optional, Union
 
 from ...py_op_exceptions import OPInvalidItemException
 from ..field_registry import OPItemFieldFactory
+from ._label_index import _LabelIndex
 from .item_field_base import OPItemField
 
 
@@ -36,6 +37,8 @@ class OPSection(dict):
         # shadow fields map makes it easy to detect collisions
         # by looking up a field's ID to see if it's already been registered
         self._shadow_fields = {}
+        # built on first lookup by label
+        self._field_label_index: Optional[_LabelIndex[OPItemField]] = None
 
     @property
     def section_id(self) -> str:
@@ -69,10 +72,31 @@ class OPSection(dict):
         field_list = self.setdefault("fields", [])
         return field_list
 
-    def register_field(self, field_dict: Union[OPItemField, dict], relaxed_validation: bool = False):
+    def register_field(self,
+                       field_dict: Union[OPItemField, dict],
+                       relaxed_validation: bool = False,
+                       copy_field: bool = True):
+        """
+        Associate a field with this section
+
+        Parameters
+        ----------
+        field_dict : Union[OPItemField, dict]
+            The field object or dictionary to register
+        relaxed_validation : bool, optional
+            Whether to tolerate field ID collisions and missing field IDs, by default False
+        copy_field : bool, optional
+            If 'field_dict' is an OPItemField, whether this section should hold a copy of it,
+            rather than the object itself, by default True
+            Only pass False if the field's "section" element doesn't refer back to this
+            section's "fields" list, or there will be a circular reference
+        """
         if isinstance(field_dict, OPItemField):
-            # make a copy of the field so we don't end up with a circular reference
-            field = copy.copy(field_dict)
+            if copy_field:
+                # make a copy of the field so we don't end up with a circular reference
+                field = copy.copy(field_dict)
+            else:
+                field = field_dict
         else:
             field = OPItemFieldFactory.item_field(field_dict)
 
@@ -103,6 +127,8 @@ class OPSection(dict):
         else:
             self._shadow_fields[field_id] = field
         self.fields.append(field)
+        if self._field_label_index is not None:
+            self._field_label_index.add(field)
 
     def fields_by_label(self, label: str, case_sensitive: bool = True) -> List[OPItemField]:
         """
@@ -126,16 +152,13 @@ class OPSection(dict):
         OPFieldNotFoundException
             If no matching fields are found
         """
-        matching_fields = []
-        f: OPItemField
-        for f in self.fields:
-            f_label = f.label
+        if self._field_label_index is None:
+            self._field_label_index = _LabelIndex(self.fields)
+        matching_fields = self._field_label_index.lookup(
+            label, case_sensitive=case_sensitive)
+        if not matching_fields:
             if not case_sensitive:
-                f_label = f_label.lower()
                 label = label.lower()
-            if f_label == label:
-                matching_fields.append(f)
-        if not matching_fields:
             raise OPFieldNotFoundException(
                 f"No fields found by label '{label}'")
         return matching_fields
@@ -0,0 +1,179 @@
+from typing import Set
+
+"""
+Module for classes & functions related to when item objects build their
+section and field objects.
+
+By default, an item object builds all of its OPSection and OPItemField objects
+when it's created. For items with many fields, this is most of the cost of
+creating the item. If a caller only needs top-level properties, such as the
+item's title, this is wasted.
+
+With lazy fields enabled, section and field objects aren't built until the first
+section- or field-oriented method or property is used. Item validation (e.g.,
+missing IDs, and ID collisions) still happens when the item is created, so the
+same exceptions are raised at the same point either way.
+
+This module provides mechanisms to enable/disable lazy fields globally, or on a
+per-class basis
+"""
+
+
+class _OPItemFieldPolicy:
+    """
+    Class representing the active policy whether a 1Password item object should
+    defer building its section and field objects until they're needed
+    """
+    _lazy_item_classes: Set[type] = set()
+    _lazy_fields: bool = False
+
+    @classmethod
+    def _enable_lazy_fields(cls) -> None:
+        """
+        Enable lazy fields globally
+        """
+        cls._lazy_fields = True
+
+    @classmethod
+    def _disable_lazy_fields(cls) -> None:
+        """
+        Disable lazy fields globally
+
+        Per-class lazy fields will still apply
+        """
+        cls._lazy_fields = False
+
+    @classmethod
+    def _get_lazy_fields(cls, item_class: type = None) -> bool:
+        """
+        Get the lazy fields policy taking into a account global policy and optionally 'item_class':
+            True if either is true
+
+        Note: if item_class is not provided, then only the global policy is consulted
+
+        Parameters
+        ----------
+        item_class : type, optional
+            Any OPAbstractItem class, by default None
+
+        Returns
+        -------
+        bool
+            Whether lazy fields are enabled
+        """
+        global_lazy = cls._lazy_fields
+
+        class_lazy = False
+        if item_class is not None:
+            class_lazy = cls._get_lazy_fields_for_class(item_class)
+
+        lazy = global_lazy or class_lazy
+
+        return lazy
+
+    @classmethod
+    def _get_lazy_fields_for_class(cls, item_class: type) -> bool:
+        """
+        Get the lazy fields policy only for 'item_class'
+
+        Parameters
+        ----------
+        item_class : type
+            Any OPAbstractItem class
+
+        Returns
+        -------
+        bool
+            Whether lazy fields are set for 'item_class'
+        """
+        lazy = False
+        if cls._lazy_item_classes and issubclass(item_class, tuple(cls._lazy_item_classes)):
+            lazy = True
+        return lazy
+
+    @classmethod
+    def _set_lazy_fields_for_class(cls, item_class) -> None:
+        """
+        Enable lazy fields for 'item_class'
+
+        Parameters
+        ----------
+        item_class : type
+            Any OPAbstractItem class
+        """
+        cls._lazy_item_classes.add(item_class)
+
+    @classmethod
+    def _set_eager_fields_for_class(cls, item_class) -> None:
+        """
+        Disable lazy fields for 'item_class'
+
+        Parameters
+        ----------
+        item_class : type
+            Any OPAbstractItem class
+        """
+        if item_class in cls._lazy_item_classes:
+            cls._lazy_item_classes.remove(item_class)
+
+
+def enable_lazy_fields() -> None:
+    """
+    Convenience method to enable lazy fields globally
+    """
+    _OPItemFieldPolicy._enable_lazy_fields()
+
+
+def disable_lazy_fields() -> None:
+    """
+    Convenience method to disable lazy fields globally.
+
+    Per-class lazy fields policy still applies
+    """
+    _OPItemFieldPolicy._disable_lazy_fields()
+
+
+def get_lazy_fields(item_class=None) -> bool:
+    """
+    Get lazy fields policy.
+
+    If optional 'item_class' is provided, the returned value represents the union of global
+    lazy fields policy, and the class-specific lazy fields policy.
+
+    Parameters
+    ----------
+    item_class : type, optional
+        Any OPAbstractItem class, by default None
+
+    Returns
+    -------
+    bool
+        The union of the global lazy fields policy and the class's lazy fields policy
+    """
+    return _OPItemFieldPolicy._get_lazy_fields(item_class=item_class)
+
+
+def set_lazy_fields_for_class(item_class) -> None:
+    """
+    Enable lazy fields for the specified op item class
+
+    Parameters
+    ----------
+    item_class : type
+        Any OPAbstractItem class
+    """
+    _OPItemFieldPolicy._set_lazy_fields_for_class(item_class)
+
+
+def set_eager_fields_for_class(item_class) -> None:
+    """
+    Remove the specified op item class from the lazy fields list
+
+    Note: lazy fields may still apply if enabled globally
+
+    Parameters
+    ----------
+    item_class : type
+        Any OPAbstractItem class
+    """
+    _OPItemFieldPolicy._set_eager_fields_for_class(item_class)
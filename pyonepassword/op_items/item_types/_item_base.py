@@ -4,6 +4,7 @@ from ..._abc_meta import enforcedmethod
 from ..._py_op_deprecation import deprecated
 from ...py_op_exceptions import OPInvalidItemException
 from ..field_registry import OPItemFieldFactory
+from ..fields_sections._label_index import _LabelIndex
 from ..fields_sections.item_field_base import OPItemField
 from ..fields_sections.item_section import (
     OPFieldNotFoundException,
@@ -11,6 +12,7 @@ from ..fields_sections.item_section import (
     OPSection,
     OPSectionCollisionException
 )
+from ..item_field_policy import get_lazy_fields
 from ..item_validation_policy import get_relaxed_validation
 from ._item_descriptor_base import OPAbstractItemDescriptor
 
@@ -30,14 +32,33 @@ class OPAbstractItem(OPAbstractItemDescriptor):
     @enforcedmethod
     def __init__(self, item_dict_or_json: Union[Dict, str]):
         super().__init__(item_dict_or_json)
-        self._section_map = self._initialize_sections()
-        self._field_map = self._initialize_fields()
+        self._sections_fields_initialized = False
+        # built on first lookup by label
+        self._section_label_index: Optional[_LabelIndex[OPSection]] = None
+        self._field_label_index: Optional[_LabelIndex[OPItemField]] = None
+        if self.lazy_fields():
+            # section & field objects get built on first use, but invalid
+            # items should still be rejected here
+            self._validate_sections_fields()
+        else:
+            self._initialize_sections_fields()
 
     @property
     def sections(self) -> List[OPSection]:
+        self._ensure_sections_fields()
         section_list = self.get("sections", [])
         return section_list
 
+    @property
+    def _section_map(self) -> Dict[str, OPSection]:
+        self._ensure_sections_fields()
+        return self.__section_map
+
+    @property
+    def _field_map(self) -> Dict[str, OPItemField]:
+        self._ensure_sections_fields()
+        return self.__field_map
+
     def relaxed_validation(self) -> bool:
         """
         Get relaxed validation policy
@@ -59,6 +80,24 @@ class OPAbstractItem(OPAbstractItemDescriptor):
                 relaxed = get_relaxed_validation(item_class=self.__class__)
         return relaxed
 
+    def lazy_fields(self) -> bool:
+        """
+        Get lazy fields policy
+
+        If enabled, this item's section and field objects aren't built until the first
+        section- or field-oriented method or property is used. Until then, the item's
+        "sections" and "fields" dictionary entries are left as they were parsed from JSON
+
+        Returns
+        -------
+        bool
+            Whether lazy fields policy is enabled
+        """
+        lazy = False
+        if not self.FROM_TEMPLATE:
+            lazy = get_lazy_fields(item_class=self.__class__)
+        return lazy
+
     def sections_by_label(self, section_label: str, case_sensitive: bool = True) -> List[OPSection]:
         """
         Returns a list of one or more sections matching the given label.
@@ -82,22 +121,22 @@ class OPAbstractItem(OPAbstractItemDescriptor):
         OPSectionNotFoundException
             If no sections are found matching the given label
         """
-        matching_sections = []
-        sect: OPSection
-        for sect in self.sections:
-            s_label = sect.label
-            if not case_sensitive:
-                s_label = s_label.lower()
-                section_label = section_label.lower()
-            if s_label == section_label:
-                matching_sections.append(sect)
+        if self._section_label_index is None:
+            self._section_label_index = _LabelIndex(self.sections)
+        matching_sections = self._section_label_index.lookup(
+            section_label, case_sensitive=case_sensitive)
 
         if not matching_sections:
+            if not case_sensitive:
+                section_label = section_label.lower()
             raise OPSectionNotFoundException(
                 f"No sections found with label '{section_label}'")
         return matching_sections
 
     def section_by_id(self, section_id) -> OPSection:
+        # build sections & fields first, so errors doing so aren't mistaken for
+        # a missing section
+        self._ensure_sections_fields()
         try:
             section: OPSection = self._section_map[section_id]
         except KeyError:
@@ -147,6 +186,9 @@ class OPAbstractItem(OPAbstractItemDescriptor):
         return self.field_value_by_section_label(section_title, field_label)  # pragma: no coverage
 
     def field_by_id(self, field_id) -> OPItemField:
+        # build sections & fields first, so errors doing so aren't mistaken for
+        # a missing field
+        self._ensure_sections_fields()
         try:
             field = self._field_map[field_id]
         except KeyError:
@@ -176,17 +218,13 @@ class OPAbstractItem(OPAbstractItemDescriptor):
         OPFieldNotFoundException
             If no matching fields are found
         """
-        fields = []
-        f: OPItemField
-        for _, f in self._field_map.items():
-            f_label = f.label
+        if self._field_label_index is None:
+            self._field_label_index = _LabelIndex(self._field_map.values())
+        fields = self._field_label_index.lookup(
+            field_label, case_sensitive=case_sensitive)
+        if not fields:
             if not case_sensitive:
-                f_label = f_label.lower()
                 field_label = field_label.lower()
-
-            if f_label == field_label:
-                fields.append(f)
-        if not fields:
             raise OPFieldNotFoundException(
                 f"No fields found by label '{field_label}'")
         return fields
@@ -234,6 +272,75 @@ class OPAbstractItem(OPAbstractItemDescriptor):
         value = section_field.value
         return value
 
+    def _ensure_sections_fields(self):
+        if not self._sections_fields_initialized:
+            self._initialize_sections_fields()
+
+    def _initialize_sections_fields(self):
+        _missing = object()
+        _sections = self.get("sections", _missing)
+        _fields = self.get("fields", _missing)
+        # set this first, since initializing fields looks up sections
+        self._sections_fields_initialized = True
+        try:
+            self.__section_map = self._initialize_sections()
+            self.__field_map = self._initialize_fields()
+        except Exception:
+            # put things back the way they were, so the
+            # same exception is raised if this is tried again
+            self._sections_fields_initialized = False
+            for key, value in [("sections", _sections), ("fields", _fields)]:
+                if value is _missing:
+                    self.pop(key, None)
+                else:
+                    self[key] = value
+            raise
+
+    def _validate_sections_fields(self):
+        # The same checks, in the same order, as _initialize_sections() and
+        # _initialize_fields(), without building section or field objects
+        relaxed_validation = self.relaxed_validation()
+        section_ids = set()
+        _sections = self.get("sections")
+        if _sections:
+            for section_dict in _sections:
+                try:
+                    section_id = section_dict["id"]
+                except KeyError as e:
+                    if relaxed_validation:
+                        section_id = ""
+                    else:
+                        raise OPInvalidItemException(
+                            f"section has no ID {section_dict}") from e
+                if section_id in section_ids and not relaxed_validation:
+                    raise OPSectionCollisionException(
+                        f"Section {section_id} already registered")
+                section_ids.add(section_id)
+
+        field_ids = set()
+        for field_dict in self.get("fields", []):
+            # raises KeyError if the field has no type, same as building it would
+            field_class = OPItemFieldFactory.field_type_lookup(field_dict)
+            try:
+                field_id = field_dict["id"]
+            except KeyError as e:
+                if relaxed_validation:
+                    field_id = ""
+                else:
+                    field = field_class(field_dict)
+                    raise OPInvalidItemException(
+                        f"Field has no ID: {field.label}") from e
+            if field_id in field_ids and not relaxed_validation:
+                raise OPItemFieldCollisionException(
+                    f"Field {field_id} already registered")
+            section_dict = field_dict.get("section")
+            if section_dict:
+                section_id = section_dict["id"]
+                if section_id not in section_ids:
+                    raise OPSectionNotFoundException(
+                        f"Section not found with Section ID: {section_id}")
+            field_ids.add(field_id)
+
     def _initialize_sections(self):
         section_list = []
         section_map = {}
@@ -312,8 +419,11 @@ class OPAbstractItem(OPAbstractItemDescriptor):
             if section_dict:
                 section_id = section_dict["id"]
                 section = self.section_by_id(section_id)
+                # the section shares this item's field object, rather than having its own
+                # the field's "section" is the plain dictionary from the item's JSON, so
+                # there's no circular reference
                 section.register_field(
-                    field_dict, relaxed_validation=relaxed_validation)
+                    field, relaxed_validation=relaxed_validation, copy_field=False)
             field_list.append(field)
             field_map[field_id] = field
         self["fields"] = field_list
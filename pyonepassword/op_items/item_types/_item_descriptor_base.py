@@ -16,13 +16,13 @@ class OPAbstractItemDescriptor(dict, metaclass=ABCMetaDict):
         super().__init__(item_dict)
         vault_dict = self.get("vault")
         if vault_dict:
-            self._vault = OPVaultDescriptor(vault_dict)
-        else:
-            self._vault = None
+            # replace the plain vault dictionary, rather than keeping both it and
+            # a vault descriptor object around for the life of this object
+            self["vault"] = OPVaultDescriptor(vault_dict)
 
     @property
     def vault(self) -> OPVaultDescriptor:
-        return self._vault
+        return self.get("vault") or None
 
     @property
     def unique_id(self) -> str:
@@ -93,6 +93,10 @@ class OPLoginItem(OPAbstractItem):
             if url.primary:
                 primary_url = url
             urls.append(url)
+        if url_list and not self.FROM_TEMPLATE:
+            # the URL objects stand in for the dictionaries they were made from,
+            # the same as sections & fields. Templates keep their own "urls" list
+            self["urls"] = urls
         self._urls = urls
         self._primary_url = primary_url
 
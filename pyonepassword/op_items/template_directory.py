@@ -1,19 +1,111 @@
-import json
+"""
+New item templates, cached for the life of the process
+
+Each template is read from package data at most once. Templates are cached as JSON, and
+every lookup decodes a fresh copy, since new items modify their templates
+"""
+import threading
+from types import MappingProxyType
+from typing import Any, Dict, Mapping, Optional
 
 from .. import data
+from ..json import safe_unjson
 from ..pkg_resources import pkgfiles
 
+_template_lock = threading.Lock()
+# category -> template file name
+_template_registry: Optional[Mapping[str, str]] = None
+# category -> template JSON
+_template_json: Mapping[str, str] = {}
+_templates_frozen = False
+
+
+def _read_data_file(file_name: str) -> str:
+    with pkgfiles(data).joinpath(file_name).open("r") as _file:
+        return _file.read()
+
+
+def _registry() -> Mapping[str, str]:
+    global _template_registry
+    registry = _template_registry
+    if registry is None:
+        with _template_lock:
+            if _template_registry is None:
+                _template_registry = MappingProxyType(
+                    safe_unjson(_read_data_file(data.TEMPLATE_REGISTRY_JSON)))
+            registry = _template_registry
+    return registry
+
+
+def _template_json_for_category(category: str) -> str:
+    global _template_json
+    template_json = _template_json.get(category)
+    if template_json is None:
+        # raises KeyError for unknown categories
+        template_name = _registry()[category]
+        with _template_lock:
+            template_json = _template_json.get(category)
+            if template_json is None:
+                template_json = _read_data_file(template_name)
+                # replace rather than modify, so lookups never need the lock
+                _template_json = {**_template_json, category: template_json}
+    return template_json
+
+
+def preload_templates(freeze: bool = False):
+    """
+    Load every new item template, so creating new items never reads package data
+
+    Parameters
+    ----------
+    freeze : bool, optional
+        If True, the template cache becomes read-only until clear_template_cache() is
+        called, by default False
+    """
+    global _template_json
+    global _templates_frozen
+    registry = _registry()
+    for category in registry:
+        _template_json_for_category(category)
+    if freeze:
+        with _template_lock:
+            _template_json = MappingProxyType(dict(_template_json))
+            _templates_frozen = True
+
+
+def clear_template_cache():
+    """
+    Discard all cached new item templates, unfreezing the template cache if it was frozen
+
+    Templates are loaded again as they're needed
+    """
+    global _template_registry
+    global _template_json
+    global _templates_frozen
+    with _template_lock:
+        _template_registry = None
+        _template_json = {}
+        _templates_frozen = False
+
+
+def templates_frozen() -> bool:
+    """
+    Whether the template cache has been frozen by preload_templates()
+
+    Returns
+    -------
+    bool
+        True if the template cache is frozen
+    """
+    return _templates_frozen
+
 
 class OPTemplateDirectory:
 
     def __init__(self):
-        with pkgfiles(data).joinpath(data.TEMPLATE_REGISTRY_JSON).open("r") as _file:
-            self._registry = json.load(_file)
-
-    def template_for_category(self, category: str):
-        template_name = self._registry[category]
-        template = None
-        with pkgfiles(data).joinpath(template_name).open("r") as _file:
-            template = json.load(_file)
+        self._registry = _registry()
 
+    def template_for_category(self, category: str) -> Dict[str, Any]:
+        # decode a new copy every time, since callers modify it
+        template = safe_unjson(_template_json_for_category(category))
         return template
@@ -168,6 +168,13 @@ class OPDocumentDeleteException(OPCmdFailedException):
         super().__init__(stderr_out, returncode)
 
 
+class OPDocumentCreateException(OPCmdFailedException):
+    MSG = "1Password 'document create' failed."
+
+    def __init__(self, stderr_out, returncode):
+        super().__init__(stderr_out, returncode)
+
+
 class OPDocumentEditException(OPCmdFailedException):
     MSG = "1Password 'document edit' failed."
 
@@ -265,6 +272,23 @@ class OPRevokedSvcAcctTokenException(_OPCalledProcessException):
         super().__init__(stderr_out, returncode)
 
 
+class OPCommandTimeoutException(OPBaseException):
+    """
+    Raised when an 'op' command doesn't finish within the allotted time
+
+    The 'op' process, and any processes it started, are killed before this is raised
+
+    This intentionally does not extend OPCmdFailedException, so it isn't
+    masked by code that handles OPCmdFailedException
+    """
+    MSG = "1Password CLI command timed out after %s seconds"
+
+    def __init__(self, argv: List[str], timeout: float):
+        super().__init__(self.MSG % timeout)
+        self.argv = list(argv)
+        self.timeout = timeout
+
+
 class OPInvalidItemException(OPBaseException):
     def __init__(self, msg):
         super().__init__(msg)
@@ -1,10 +1,25 @@
 from __future__ import annotations
 
+import errno
 import fnmatch
 import logging
+import os
+from concurrent.futures import ThreadPoolExecutor
+from json import JSONDecodeError
 from os import environ as env
 from pathlib import Path
-from typing import TYPE_CHECKING, List, Optional, Type, Union
+from typing import (
+    IO,
+    TYPE_CHECKING,
+    Any,
+    BinaryIO,
+    Iterable,
+    List,
+    Optional,
+    Tuple,
+    Type,
+    Union
+)
 
 if TYPE_CHECKING:  # pragma: no coverage
     from .op_items.fields_sections.item_field import OPItemField
@@ -12,13 +27,20 @@ if TYPE_CHECKING:  # pragma: no coverage
 from ._field_assignment import OPFieldTypeEnum
 from ._op_cli_version import OPCLIVersion
 from ._op_commands import (
+    AUTH_VERIFY_ALWAYS,
+    DEFAULT_AUTH_VERIFY_TTL,
     EXISTING_AUTH_IGNORE,
+    AuthVerifyPolicyEnum,
     ExistingAuthEnum,
     _OPCommandInterface
 )
 from .account import OPAccountList
+from .json import safe_unjson, unjson_stream
 from .op_items._item_list import OPItemList
-from .op_items._item_type_registry import OPItemFactory
+from .op_items._item_type_registry import (
+    OPItemFactory,
+    OPUnknownItemTypeException
+)
 from .op_items._new_item import OPNewItemMixin
 from .op_items.fields_sections.item_field import OPConcealedField
 from .op_items.fields_sections.item_section import OPFieldNotFoundException
@@ -26,6 +48,7 @@ from .op_items.item_types._item_base import (
     OPAbstractItem,
     OPSectionNotFoundException
 )
+from .op_items.item_types._item_descriptor_base import OPAbstractItemDescriptor
 from .op_items.item_types.generic_item import (
     _OPGenericItem,
     _OPGenericItemRelaxedValidation
@@ -67,6 +90,28 @@ from .py_op_exceptions import (
 from .string import RedactedString
 from .version import PyOPAboutMixin
 
+# Default maximum number of concurrent 'op' processes for OP.item_get_many()
+DEFAULT_ITEM_GET_MANY_WORKERS = 8
+
+
+def _document_input(file_path_or_document) -> Tuple[Any, Optional[str]]:
+    # Paths are passed to 'op', which reads the file itself, so the document
+    # never passes through Python. Bytes, file-like objects, and iterables
+    # of chunks are streamed to 'op' on stdin
+    # returns (document input, file path), one of which is None
+    if isinstance(file_path_or_document, (str, Path)):
+        file_path = str(file_path_or_document)
+        # check here rather than leave it to 'op', so a bad path fails the same way
+        # it did when the file was read in Python, before any 'op' commands are run
+        if not os.path.isfile(file_path):
+            raise FileNotFoundError(
+                errno.ENOENT, os.strerror(errno.ENOENT), file_path)
+        # 'op' would take '-' to mean stdin, and '-foo' to be an option
+        if file_path.startswith("-"):
+            file_path = os.path.join(".", file_path)
+        return (None, file_path)
+    return (file_path_or_document, None)
+
 
 class OP(_OPCommandInterface, PyOPAboutMixin):
     """
@@ -80,7 +125,12 @@ class OP(_OPCommandInterface, PyOPAboutMixin):
                  password_prompt: bool = True,
                  vault: Optional[str] = None,
                  op_path: str = 'op',
-                 logger: Optional[logging.Logger] = None):
+                 logger: Optional[logging.Logger] = None,
+                 auth_verify_policy: AuthVerifyPolicyEnum = AUTH_VERIFY_ALWAYS,
+                 auth_verify_ttl: float = DEFAULT_AUTH_VERIFY_TTL,
+                 auth_retry: bool = False,
+                 timeout: Optional[float] = None,
+                 timeout_retries: int = 0):
         """
         Create an OP object. The 1Password (non-initial) sign-in happens during object instantiation.
 
@@ -106,6 +156,30 @@ class OP(_OPCommandInterface, PyOPAboutMixin):
             Optional path to the `op` command, if it's not at the default location
         logger : logging.Logger
             A logging object. If not provided a basic logger is created and used
+        auth_verify_policy : AuthVerifyPolicyEnum
+            When to verify authentication (via 'op whoami') before running 'op' commands
+            Valid values:
+              - AUTH_VERIFY_ALWAYS: Verify before every command
+              - AUTH_VERIFY_TTL: Verify at most once every 'auth_verify_ttl' seconds
+              - AUTH_VERIFY_ON_FAILURE: Only verify after a command fails
+              - AUTH_VERIFY_REACTIVE: Never verify. If a command fails, inspect its error output
+                for signs that authentication has expired
+            In all cases OPAuthenticationException is raised if authentication has expired
+        auth_verify_ttl : float
+            Number of seconds an authentication verification is considered valid
+            when 'auth_verify_policy' is AUTH_VERIFY_TTL, by default 300
+        auth_retry : bool
+            If 'auth_verify_policy' is AUTH_VERIFY_REACTIVE and a command fails due to expired
+            authentication, sign in again and retry the command once, by default False
+            NOTE: The password is not retained, so without biometric, signing in again requires
+            'password_prompt' to be True
+        timeout : float, optional
+            Number of seconds to allow each 'op' command to run before it, and any processes it started,
+            are killed and OPCommandTimeoutException is raised. Sign-in is not subject to this timeout,
+            since it may be waiting on the user. By default None, meaning no timeout
+        timeout_retries : int
+            Number of additional attempts to make when a read-only command ('get' or 'list')
+            times out, by default 0
 
         Raises
         ------
@@ -126,7 +200,12 @@ class OP(_OPCommandInterface, PyOPAboutMixin):
                          logger=logger,
                          op_path=op_path,
                          existing_auth=existing_auth,
-                         password_prompt=password_prompt)
+                         password_prompt=password_prompt,
+                         auth_verify_policy=auth_verify_policy,
+                         auth_verify_ttl=auth_verify_ttl,
+                         auth_retry=auth_retry,
+                         timeout=timeout,
+                         timeout_retries=timeout_retries)
 
     def document_get(self, document_name_or_id, vault=None, include_archive=False, relaxed_validation=False):
         """
@@ -177,9 +256,91 @@ class OP(_OPCommandInterface, PyOPAboutMixin):
 
         return (file_name, document_bytes)
 
+    def document_get_to_path(self,
+                             document_name_or_id,
+                             dest_path: Union[str, Path],
+                             vault=None,
+                             include_archive=False,
+                             relaxed_validation=False,
+                             overwrite=False) -> Path:
+        """
+        Download a document object from a 1Password vault by name or UUID, and save it to disk.
+
+        Unlike document_get(), the document's bytes are written directly to disk by 'op'
+        rather than passing through Python, so memory use doesn't grow with document size.
+
+        Parameters
+        ----------
+        document_name_or_id : str
+            The item to look up
+        dest_path: Union[str, Path]
+            Path to save the document to. If this is an existing directory, the document
+            is saved in it using the document's filename. This requires looking up
+            the document's filename first
+        vault: str, optional
+            The name or ID of a vault to override the object's default vault
+        include_archive: bool, optional
+            Include items in the Archive, by default False
+        relaxed_validation: bool, optional
+            Whether to enable relaxed item validation when looking up the document's filename,
+            in order to parse non-conformant data
+            by default False
+        overwrite: bool, optional
+            Whether to replace the destination file if it already exists, by default False
+
+        Raises
+        ------
+        FileExistsError
+            If the destination file already exists and 'overwrite' is False
+        OPInvalidDocumentException
+            If the document's filename is needed, and the retrieved item isn't a document object
+            or lacks a documents expected attributes
+        OPDocumentGetException
+            If document lookup fails for any reason during command execution
+        OPNotFoundException
+            If the 1Password command can't be found
+
+        Returns
+        -------
+        path: Path
+            The path of the saved document
+
+        Service Account Support
+        -----------------------
+        Supported
+          required keyword arguments: vault
+        """
+        dest_path = Path(dest_path)
+        if dest_path.is_dir():
+            # 'op document get --out-file' doesn't report the document's filename,
+            # so it has to be looked up separately
+            try:
+                file_name = self.item_get_filename(
+                    document_name_or_id, vault=vault, include_archive=include_archive, relaxed_validation=relaxed_validation)
+            except AttributeError as ae:
+                raise OPInvalidDocumentException(
+                    "Item has no 'fileName' attribute") from ae
+            except OPCmdFailedException as ocfe:
+                raise OPDocumentGetException.from_opexception(ocfe) from ocfe
+            # don't let the document's filename take us outside of dest_path
+            base_name = Path(file_name).name
+            if base_name in ["", ".", ".."]:
+                raise OPInvalidDocumentException(
+                    f"Document filename can't be saved to a directory: '{file_name}'")
+            dest_path = Path(dest_path, base_name)
+
+        if dest_path.exists() and not overwrite:
+            raise FileExistsError(f"File exists: {dest_path}")
+
+        self._document_get_to_file(document_name_or_id,
+                                   str(dest_path),
+                                   vault=vault,
+                                   include_archive=include_archive)
+        return dest_path
+
     def document_edit(self,
                       document_identifier: str,
-                      file_path_or_document_bytes: Union[str, Path, bytes],
+                      file_path_or_document_bytes: Union[str, Path, bytes, BinaryIO, Iterable[bytes]],
                       file_name: Optional[str] = None,
                       new_title: Optional[str] = None,
                       vault: Optional[str] = None,
@@ -191,9 +352,13 @@ class OP(_OPCommandInterface, PyOPAboutMixin):
         ----------
         document_identifier : str
             Name or identifier of the document to edit
-        file_path_or_document_bytes: Union[str, Path, bytes],
+        file_path_or_document_bytes: Union[str, Path, bytes, BinaryIO, Iterable[bytes]],
             Either the path to the file to replace the current document with,
-            or the actual bytes representation of the replacement document
+            the actual bytes representation of the replacement document,
+            a binary file-like object, or an iterable of bytes chunks
+            Paths are passed to 'op', which reads the file itself. File-like objects
+            and iterables are streamed to 'op' in chunks rather than being read into
+            memory all at once
         file_name: str, optional
             Optionally set the document's fileName attribute to this value
         new_title: str, optional
@@ -214,6 +379,8 @@ class OP(_OPCommandInterface, PyOPAboutMixin):
             - If the document to be edit is not found
             - If there is more than one item matching 'document_identifier'
             - If the edit operation fails for any other reason
+        FileNotFoundError
+            If a path is provided, and it isn't a file
 
         Service Account Support
         -----------------------
@@ -221,11 +388,8 @@ class OP(_OPCommandInterface, PyOPAboutMixin):
           required keyword arguments: vault
         """
 
-        if isinstance(file_path_or_document_bytes, bytes):
-            document_bytes = file_path_or_document_bytes
-        else:
-            file_path_or_document_bytes = Path(file_path_or_document_bytes)
-            document_bytes = file_path_or_document_bytes.read_bytes()
+        document_input, file_path = _document_input(
+            file_path_or_document_bytes)
 
         # to satisfy mypy
         generic_item_class: Type[_OPGenericItem]
@@ -247,11 +411,68 @@ class OP(_OPCommandInterface, PyOPAboutMixin):
 
         # 'op document edit' doesn't have any stdout, so we're not
         # capturing any here
-        self._document_edit(document_id, document_bytes,
+        self._document_edit(document_id, document_input, file_path=file_path,
                             file_name=file_name, new_title=new_title, vault=vault)
 
         return document_id
 
+    def document_create(self,
+                        file_path_or_document: Union[str, Path, bytes, BinaryIO, Iterable[bytes]],
+                        file_name: Optional[str] = None,
+                        title: Optional[str] = None,
+                        vault: Optional[str] = None,
+                        tags: Optional[List[str]] = None) -> str:
+        """
+        Create a new document object from a file, bytes, or a stream of bytes
+
+        Parameters
+        ----------
+        file_path_or_document: Union[str, Path, bytes, BinaryIO, Iterable[bytes]],
+            Either the path to the file to upload, the actual bytes of the document,
+            a binary file-like object, or an iterable of bytes chunks
+            Paths are passed to 'op', which reads the file itself. File-like objects
+            and iterables are streamed to 'op' in chunks rather than being read into
+            memory all at once
+        file_name: str, optional
+            The document's fileName attribute. If a path is provided, defaults
+            to that path's name
+        title: str, optional
+            The title of the new document
+        vault : str, optional
+            The name or ID of a vault to override the default vault, by default None
+        tags: List[str], optional
+            A list of tags to apply to the new document
+        Returns
+        -------
+        document_id: str
+            Unique identifier of the document created
+
+        Raises
+        ------
+        OPDocumentCreateException
+            If the create operation fails for any reason
+        FileNotFoundError
+            If a path is provided, and it isn't a file
+
+        Service Account Support
+        -----------------------
+        Supported
+          required keyword arguments: vault
+        """
+        if file_name is None and isinstance(file_path_or_document, (str, Path)):
+            file_name = Path(file_path_or_document).name
+
+        document_input, file_path = _document_input(file_path_or_document)
+        output = self._document_create(document_input,
+                                       file_path=file_path,
+                                       title=title,
+                                       file_name=file_name,
+                                       vault=vault,
+                                       tags=tags)
+        created = safe_unjson(output)
+        document_id = created["uuid"]
+        return document_id
+
     def document_delete(self, document_identifier: str, vault: Optional[str] = None, archive: bool = False, relaxed_validation: bool = False) -> str:
         """
         Delete a document object based on document name or unique identifier
@@ -502,7 +723,13 @@ class OP(_OPCommandInterface, PyOPAboutMixin):
             new_item, password_recipe=password_recipe, vault=vault)
         return login_item
 
-    def item_get(self, item_identifier, vault=None, include_archive=False, generic_okay=False, relaxed_validation=False) -> OPAbstractItem:
+    def item_get(self,
+                 item_identifier,
+                 vault=None,
+                 include_archive=False,
+                 generic_okay=False,
+                 relaxed_validation=False,
+                 timeout: Optional[float] = None) -> OPAbstractItem:
         """
         Get an 'item' object from a 1Password vault.
         The returned object may be any of the item types extending OPAbstractItem.
@@ -531,6 +758,8 @@ class OP(_OPCommandInterface, PyOPAboutMixin):
         relaxed_validation: bool, optional
             Whether to enable relaxed item validation for this query, in order to parse non-conformant data
             by default False
+        timeout: float, optional
+            Number of seconds to allow 'op' to run, overriding the timeout this object was created with
         Note:
             If a non-unique item identifier is provided (e.g., item name/title), and there
             is more than one item that matches, OPItemGetException will be raised. Check the
@@ -546,6 +775,8 @@ class OP(_OPCommandInterface, PyOPAboutMixin):
             If the item object returned by 1Password isn't a known type and generic_okay is False
         OPNotFoundException
             If the 1Password command can't be found
+        OPCommandTimeoutException
+            If 'op' doesn't finish within the allotted time
         Returns
         -------
         item: OPAbstractItem
@@ -558,11 +789,182 @@ class OP(_OPCommandInterface, PyOPAboutMixin):
         """
 
         output = self._item_get(item_identifier, vault=vault,
-                                decode="utf-8", include_archive=include_archive)
+                                decode="utf-8", include_archive=include_archive,
+                                timeout=timeout)
         op_item = OPItemFactory.op_item(
             output, generic_okay=generic_okay, relaxed_validation=relaxed_validation)
         return op_item
 
+    def item_get_many(self,
+                      item_identifiers: Iterable[Union[str, OPAbstractItemDescriptor]],
+                      vault=None,
+                      include_archive=False,
+                      generic_okay=False,
+                      relaxed_validation=False,
+                      max_workers=DEFAULT_ITEM_GET_MANY_WORKERS,
+                      timeout: Optional[float] = None) -> List[Union[OPAbstractItem, Exception]]:
+        """
+        Get multiple 'item' objects from a 1Password vault concurrently.
+
+        Each item is looked up via its own 'op item get' command, as with item_get(). Up to
+        'max_workers' commands are run at a time.
+
+        Parameters
+        ----------
+        item_identifiers: Iterable[Union[str, OPAbstractItemDescriptor]]
+            Names or IDs of the items to look up. Item descriptors, such as those in an OPItemList
+            returned by item_list(), may also be provided, in which case each item's unique ID is used
+        vault: str, optional
+            The name or ID of a vault to override the object's default vault, by default None
+        include_archive: bool, optional
+            Include items in the Archive, by default False
+        generic_okay: bool, optional
+            Instantiate unknown item types as _OPGenericItem rather than raise OPUnknownItemException
+        relaxed_validation: bool, optional
+            Whether to enable relaxed item validation for this query, in order to parse non-conformant data
+            by default False
+        max_workers: int, optional
+            Maximum number of 'op item get' commands to run concurrently, by default 8
+        timeout: float, optional
+            Number of seconds to allow each 'op' command to run, overriding the timeout this
+            object was created with
+
+        Raises
+        ------
+        OPAuthenticationException
+            If authentication has expired, depending on the authentication verification policy
+        OPCommandTimeoutException
+            If an 'op' command runs longer than the timeout
+        OPNotFoundException
+            If the 1Password command can't be found
+
+        Returns
+        -------
+        items: List[Union[OPAbstractItem, Exception]]
+            A list of item objects, in the same order as 'item_identifiers'.
+            If an individual lookup fails, the exception raised for that item is placed in the list
+            instead, rather than aborting the remaining lookups. Such exceptions may be any of:
+            - OPItemGetException
+            - OPInvalidItemException
+            - OPUnknownItemTypeException
+
+        Service Account Support
+        -----------------------
+        Supported
+          required keyword arguments: vault
+        """
+        identifiers = []
+        for identifier in item_identifiers:
+            if isinstance(identifier, OPAbstractItemDescriptor):
+                identifier = identifier.unique_id
+            identifiers.append(identifier)
+
+        def _get_one(item_identifier) -> Union[OPAbstractItem, Exception]:
+            item: Union[OPAbstractItem, Exception]
+            try:
+                item = self.item_get(item_identifier,
+                                     vault=vault,
+                                     include_archive=include_archive,
+                                     generic_okay=generic_okay,
+                                     relaxed_validation=relaxed_validation,
+                                     timeout=timeout)
+            except (OPItemGetException,
+                    OPInvalidItemException,
+                    OPUnknownItemTypeException) as e:
+                item = e
+            return item
+
+        if not identifiers:
+            return []
+
+        max_workers = max(1, min(max_workers, len(identifiers)))
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            futures = [executor.submit(_get_one, identifier)
+                       for identifier in identifiers]
+            try:
+                items = [future.result() for future in futures]
+            except BaseException:
+                # any other exception means the remaining lookups are likely to fail as well
+                executor.shutdown(wait=True, cancel_futures=True)
+                raise
+        return items
+
+    def item_get_batch(self,
+                       item_list: OPItemList,
+                       vault=None,
+                       include_archive=False,
+                       generic_okay=False,
+                       relaxed_validation=False,
+                       batch_size=25) -> List[OPAbstractItem]:
+        """
+        Get full item objects for every item descriptor in an item list, such as one returned
+        by item_list(). Rather than one 'op item get' command per item, descriptors are provided
+        to 'op item get' over stdin, in batches of up to 'batch_size' items per command.
+
+        Parameters
+        ----------
+        item_list: OPItemList
+            The list of item descriptors to retrieve full items for
+        vault: str, optional
+            The name or ID of a vault to override the object's default vault, by default None
+        include_archive: bool, optional
+            Include items in the Archive, by default False
+        generic_okay: bool, optional
+            Instantiate unknown item types as _OPGenericItem rather than raise OPUnknownItemException
+        relaxed_validation: bool, optional
+            Whether to enable relaxed item validation for this query, in order to parse non-conformant data
+            by default False
+        batch_size: int, optional
+            Maximum number of items to get in each pass
+            by default 25
+            NOTE: The default batch size is subject to change without notice
+
+        Raises
+        ------
+        OPItemGetException
+            If any of the 'op item get' operations fail
+        OPInvalidItemException
+            If the item JSON fails to decode
+        OPUnknownItemTypeException
+            If an item object returned by 1Password isn't a known type and generic_okay is False
+        OPNotFoundException
+            If the 1Password command can't be found
+
+        Returns
+        -------
+        items: List[OPAbstractItem]
+            A list of item objects, one for each descriptor in 'item_list'
+
+        Service Account Support
+        -----------------------
+        Supported
+          required keyword arguments: vault
+        """
+        def _batch_items(stdout: IO[bytes]) -> List[OPAbstractItem]:
+            # create each item as soon as 'op' has written it, rather than
+            # waiting for all of its output
+            batch_items = []
+            try:
+                for item_dict in unjson_stream(stdout):
+                    op_item = OPItemFactory.op_item(
+                        item_dict, generic_okay=generic_okay, relaxed_validation=relaxed_validation)
+                    batch_items.append(op_item)
+            except JSONDecodeError as e:
+                raise OPInvalidItemException(
+                    f"Failed to unserialize item JSON: {e}") from e
+            return batch_items
+
+        items: List[OPAbstractItem] = []
+        for i in range(0, len(item_list), batch_size):
+            batch = OPItemList(item_list[i:i+batch_size])
+            batch_json = batch.serialize()
+            batch_items = self._item_get_multiple(batch_json,
+                                                  vault=vault,
+                                                  include_archive=include_archive,
+                                                  stdout_consumer=_batch_items)
+            items.extend(batch_items)
+        return items
+
     def item_get_totp(self, item_identifier: str, vault=None) -> OPTOTPItem:
         """
         Get a TOTP code from the item specified by name or UUID.
@@ -1613,7 +2015,8 @@ class OP(_OPCommandInterface, PyOPAboutMixin):
                   tags: Optional[List[str]] = None,
                   title_glob: str = None,
                   vault: str = None,
-                  generic_okay: bool = True) -> OPItemList:
+                  generic_okay: bool = True,
+                  timeout: Optional[float] = None) -> OPItemList:
         """
         Return a list of items in an account.
 
@@ -1633,6 +2036,8 @@ class OP(_OPCommandInterface, PyOPAboutMixin):
             The name or ID of a vault to override the object's default vault
         generic_okay: bool, optional
             Instantiate unknown item types as _OPGenericItem rather than raise OPUnknownItemException
+        timeout: float, optional
+            Number of seconds to allow 'op' to run, overriding the timeout this object was created with
 
         Raises
         ------
@@ -1643,6 +2048,8 @@ class OP(_OPCommandInterface, PyOPAboutMixin):
             that aren't a known type and generic_okay is False
         OPNotFoundException
             If the 1Password command can't be found
+        OPCommandTimeoutException
+            If 'op' doesn't finish within the allotted time
 
         Returns
         -------
@@ -1659,7 +2066,7 @@ class OP(_OPCommandInterface, PyOPAboutMixin):
             categories = list()
 
         item_list_json = self._item_list(
-            categories, include_archive, tags, vault)
+            categories, include_archive, tags, vault, timeout=timeout)
         item_list = OPItemList(item_list_json, generic_okay=generic_okay)
 
         if title_glob:
@@ -89,6 +89,9 @@ setup(
     install_requires=[
         "python-singleton-metaclasses"
     ],
+    extras_require={
+        "orjson": ["orjson"]
+    },
     package_data={'pyonepassword': ['data/**', 'py.typed']},
     entry_points={"console_scripts":
                   ["opconfig=pyonepassword.opconfig_main:main",
@@ -0,0 +1,118 @@
+"""
+Tests for the process-wide cache of new item templates
+"""
+from __future__ import annotations
+
+import pytest
+
+import pyonepassword.op_items.template_directory
+from pyonepassword.api.object_types import OPLoginItemTemplate
+from pyonepassword.api.template_cache import (
+    clear_template_cache,
+    preload_templates,
+    templates_frozen
+)
+from pyonepassword.op_items.template_directory import OPTemplateDirectory
+
+
+@pytest.fixture(autouse=True)
+def init_template_cache():
+    clear_template_cache()
+
+    yield  # clean up after each test
+
+    clear_template_cache()
+
+
+@pytest.fixture
+def data_file_reads(monkeypatch):
+    # record, and still perform, every read of template package data
+    reads = []
+    read_data_file = pyonepassword.op_items.template_directory._read_data_file
+
+    def _read_data_file(file_name):
+        reads.append(file_name)
+        return read_data_file(file_name)
+
+    monkeypatch.setattr(pyonepassword.op_items.template_directory,
+                        "_read_data_file", _read_data_file)
+    return reads
+
+
+def test_template_cache_010(data_file_reads):
+    """
+    Test:
+      - Create several new login items
+    Verify:
+      - The template registry and the login template are each read only once
+    """
+    for i in range(5):
+        OPLoginItemTemplate(f"Login {i}", "username", "password")
+    assert data_file_reads == ["template-registry.json", "login.json"]
+
+
+def test_template_cache_020():
+    """
+    Test:
+      - Look up the same template twice, and modify the first copy
+    Verify:
+      - Each lookup returns a separate copy
+      - Modifying one copy doesn't affect the other
+    """
+    directory = OPTemplateDirectory()
+    template_1 = directory.template_for_category("LOGIN")
+    template_1["title"] = "Modified"
+    template_1["fields"][0]["value"] = "modified"
+
+    template_2 = directory.template_for_category("LOGIN")
+    assert template_2 is not template_1
+    assert template_2["title"] == ""
+    assert template_2["fields"][0]["value"] == ""
+
+
+def test_template_cache_030(data_file_reads):
+    """
+    Test:
+      - Preload & freeze templates
+      - Create a new item of every category in the template registry
+    Verify:
+      - The template cache is frozen
+      - No template package data is read after preloading
+    """
+    preload_templates(freeze=True)
+    assert templates_frozen()
+    data_file_reads.clear()
+
+    directory = OPTemplateDirectory()
+    for category in directory._registry:
+        template = directory.template_for_category(category)
+        assert template["category"] == category
+    assert data_file_reads == []
+
+
+def test_template_cache_040():
+    """
+    Test:
+      - Preload & freeze templates, then clear the template cache
+      - Look up a template
+    Verify:
+      - The template cache is no longer frozen
+      - Templates can still be looked up
+    """
+    preload_templates(freeze=True)
+    clear_template_cache()
+    assert not templates_frozen()
+
+    template = OPTemplateDirectory().template_for_category("LOGIN")
+    assert template["category"] == "LOGIN"
+
+
+def test_template_cache_050():
+    """
+    Test:
+      - Look up a template for an unknown category
+    Verify:
+      - KeyError is raised
+    """
+    with pytest.raises(KeyError):
+        OPTemplateDirectory().template_for_category("NOT_A_CATEGORY")
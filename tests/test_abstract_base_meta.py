@@ -5,6 +5,7 @@ from typing import Dict, Union
 
 import pytest
 
+from pyonepassword._abc_meta import ABCMetaDict
 from pyonepassword.op_items.item_types._item_base import OPAbstractItem
 from pyonepassword.op_items.item_types._item_descriptor_base import (
     OPAbstractItemDescriptor
@@ -63,3 +64,32 @@ def test_abc_meta_03(valid_data: ValidData):
 
     # No error/exception should be raised, since enforced methods have been implemented
     OPConcreteItem(item_dict)
+
+
+def test_abc_meta_04(valid_data: ValidData, monkeypatch):
+    """
+    Test:
+      - Create a class implementing all enforced methods
+      - Prevent enforced methods from being looked up again
+      - Instantiate the class
+
+    Verify:
+        - Enforced methods were determined once, when the class was created
+        - Instantiation succeeds without determining enforced methods again
+    """
+    class OPConcreteItem(OPAbstractItem):
+
+        def __init__(self, item_dict_or_json: Union[Dict, str]):
+            super().__init__(item_dict_or_json)
+
+    def _fail(cls):
+        raise AssertionError("Enforced methods should not be looked up again")
+
+    assert OPConcreteItem._abc_enforced_methods == frozenset()
+    assert OPAbstractItem._abc_enforced_methods == frozenset(["__init__"])
+    monkeypatch.setattr(ABCMetaDict, "_find_enforced_methods", _fail)
+
+    item_dict = valid_data.data_for_name(VALID_INPUT_ITEM)
+    OPConcreteItem(item_dict)
+    with pytest.raises(TypeError):
+        OPAbstractItem(item_dict)
@@ -0,0 +1,334 @@
+"""
+Module for testing authentication verification policies, including:
+- verify authentication before every command
+- verify authentication at most once per TTL window
+- verify authentication only after a command fails
+- classify command failures without verifying authentication
+"""
+from __future__ import annotations
+
+import threading
+
+import pytest
+
+from pyonepassword import OP
+from pyonepassword.api.authentication import (
+    AUTH_VERIFY_ALWAYS,
+    AUTH_VERIFY_ON_FAILURE,
+    AUTH_VERIFY_REACTIVE,
+    AUTH_VERIFY_TTL
+)
+from pyonepassword.api.exceptions import (
+    OPAuthenticationException,
+    OPCmdFailedException,
+    OPItemGetException
+)
+
+pytestmark = pytest.mark.usefixtures("valid_op_cli_config_homedir")
+
+ACCOUNT_ID = "5GHHPJK5HZC5BAT7WDUXW57G44"
+OP_MASTER_PASSWORD = "made-up-password"
+ITEM_NAME = "Example Login 1"
+VAULT = "Test Data"
+
+
+class _AuthCheckCounter:
+    """
+    Wrap an OP object's _auth_expired() method in order to count how many
+    times authentication gets verified
+    """
+
+    def __init__(self, op: OP, expired=False):
+        self._auth_expired = op._auth_expired
+        self.expired = expired
+        self.count = 0
+
+    def __call__(self, op_path, account, timeout=None):
+        self.count += 1
+        if self.expired:
+            return True
+        return self._auth_expired(op_path, account, timeout=timeout)
+
+
+def _op_with_policy(auth_verify_policy, auth_verify_ttl=300.0, auth_retry=False):
+    op = OP(op_path="mock-op",
+            account=ACCOUNT_ID,
+            password=OP_MASTER_PASSWORD,
+            auth_verify_policy=auth_verify_policy,
+            auth_verify_ttl=auth_verify_ttl,
+            auth_retry=auth_retry)
+    return op
+
+
+@pytest.mark.usefixtures("setup_normal_op_env")
+def test_auth_verify_always_010(monkeypatch):
+    """
+    Test:
+      - Create an OP object with AUTH_VERIFY_ALWAYS
+      - Perform several 'item_get' operations
+    Verify:
+      - Authentication is verified before every command
+    """
+    op = _op_with_policy(AUTH_VERIFY_ALWAYS)
+    counter = _AuthCheckCounter(op)
+    monkeypatch.setattr(op, "_auth_expired", counter)
+    for _ in range(3):
+        op.item_get(ITEM_NAME, vault=VAULT)
+    assert counter.count == 3
+
+
+@pytest.mark.usefixtures("setup_normal_op_env")
+def test_auth_verify_ttl_010(monkeypatch):
+    """
+    Test:
+      - Create an OP object with AUTH_VERIFY_TTL and a long TTL
+      - Perform several 'item_get' operations
+    Verify:
+      - Authentication is not verified again, since sign-in verified it
+    """
+    op = _op_with_policy(AUTH_VERIFY_TTL)
+    counter = _AuthCheckCounter(op)
+    monkeypatch.setattr(op, "_auth_expired", counter)
+    for _ in range(3):
+        op.item_get(ITEM_NAME, vault=VAULT)
+    assert counter.count == 0
+
+
+@pytest.mark.usefixtures("setup_normal_op_env")
+def test_auth_verify_ttl_020(monkeypatch):
+    """
+    Test:
+      - Create an OP object with AUTH_VERIFY_TTL and a TTL of 0
+      - Perform several 'item_get' operations
+    Verify:
+      - Authentication is verified before every command, since the TTL always expires
+    """
+    op = _op_with_policy(AUTH_VERIFY_TTL, auth_verify_ttl=0)
+    counter = _AuthCheckCounter(op)
+    monkeypatch.setattr(op, "_auth_expired", counter)
+    for _ in range(3):
+        op.item_get(ITEM_NAME, vault=VAULT)
+    assert counter.count == 3
+
+
+@pytest.mark.usefixtures("setup_normal_op_env")
+def test_auth_verify_ttl_030(monkeypatch):
+    """
+    Test:
+      - Create an OP object with AUTH_VERIFY_TTL and a TTL of 0
+      - Simulate expired authentication
+    Verify:
+      - OPAuthenticationException is raised
+    """
+    op = _op_with_policy(AUTH_VERIFY_TTL, auth_verify_ttl=0)
+    counter = _AuthCheckCounter(op, expired=True)
+    monkeypatch.setattr(op, "_auth_expired", counter)
+    with pytest.raises(OPAuthenticationException):
+        op.item_get(ITEM_NAME, vault=VAULT)
+
+
+@pytest.mark.usefixtures("setup_normal_op_env")
+def test_auth_verify_on_failure_010(monkeypatch):
+    """
+    Test:
+      - Create an OP object with AUTH_VERIFY_ON_FAILURE
+      - Perform several successful 'item_get' operations
+    Verify:
+      - Authentication is never verified
+    """
+    op = _op_with_policy(AUTH_VERIFY_ON_FAILURE)
+    counter = _AuthCheckCounter(op)
+    monkeypatch.setattr(op, "_auth_expired", counter)
+    for _ in range(3):
+        op.item_get(ITEM_NAME, vault=VAULT)
+    assert counter.count == 0
+
+
+@pytest.mark.usefixtures("setup_normal_op_env")
+def test_auth_verify_on_failure_020(monkeypatch):
+    """
+    Test:
+      - Create an OP object with AUTH_VERIFY_ON_FAILURE
+      - Look up an invalid item while authentication is still valid
+    Verify:
+      - Authentication is verified once, after the failure
+      - The original OPItemGetException is raised
+    """
+    op = _op_with_policy(AUTH_VERIFY_ON_FAILURE)
+    counter = _AuthCheckCounter(op)
+    monkeypatch.setattr(op, "_auth_expired", counter)
+    with pytest.raises(OPItemGetException):
+        op.item_get("Invalid Item")
+    assert counter.count == 1
+
+
+@pytest.mark.usefixtures("setup_normal_op_env")
+def test_auth_verify_on_failure_030(monkeypatch):
+    """
+    Test:
+      - Create an OP object with AUTH_VERIFY_ON_FAILURE
+      - Simulate expired authentication
+      - Look up an item, which fails
+    Verify:
+      - OPAuthenticationException is raised rather than OPItemGetException
+    """
+    op = _op_with_policy(AUTH_VERIFY_ON_FAILURE)
+    counter = _AuthCheckCounter(op, expired=True)
+    monkeypatch.setattr(op, "_auth_expired", counter)
+    with pytest.raises(OPAuthenticationException):
+        op.item_get("Invalid Item")
+
+
+class _SignedOutOnce:
+    """
+    Wrap an OP object's _run() method so the first 'op' command fails as if
+    authentication has expired
+    """
+
+    def __init__(self, op: OP, err_output, failures=1):
+        self._run = op._run
+        self.err_output = err_output
+        self.failures = failures
+        self.count = 0
+
+    def __call__(self, argv, **kwargs):
+        self.count += 1
+        if self.count <= self.failures:
+            raise OPCmdFailedException(self.err_output, 1)
+        return self._run(argv, **kwargs)
+
+
+@pytest.mark.usefixtures("setup_normal_op_env")
+def test_auth_verify_reactive_010(monkeypatch):
+    """
+    Test:
+      - Create an OP object with AUTH_VERIFY_REACTIVE
+      - Perform several successful 'item_get' operations
+    Verify:
+      - Authentication is never verified
+    """
+    op = _op_with_policy(AUTH_VERIFY_REACTIVE)
+    counter = _AuthCheckCounter(op)
+    monkeypatch.setattr(op, "_auth_expired", counter)
+    for _ in range(3):
+        op.item_get(ITEM_NAME, vault=VAULT)
+    assert counter.count == 0
+
+
+@pytest.mark.usefixtures("setup_normal_op_env")
+def test_auth_verify_reactive_020(monkeypatch):
+    """
+    Test:
+      - Create an OP object with AUTH_VERIFY_REACTIVE
+      - Look up an invalid item
+    Verify:
+      - Authentication is never verified
+      - The original OPItemGetException is raised
+    """
+    op = _op_with_policy(AUTH_VERIFY_REACTIVE)
+    counter = _AuthCheckCounter(op)
+    monkeypatch.setattr(op, "_auth_expired", counter)
+    with pytest.raises(OPItemGetException):
+        op.item_get("Invalid Item")
+    assert counter.count == 0
+
+
+@pytest.mark.usefixtures("setup_normal_op_env")
+def test_auth_verify_reactive_030(monkeypatch):
+    """
+    Test:
+      - Create an OP object with AUTH_VERIFY_REACTIVE, auth_retry disabled
+      - Simulate an 'op' command failing due to not being signed in
+    Verify:
+      - OPAuthenticationException is raised
+    """
+    op = _op_with_policy(AUTH_VERIFY_REACTIVE)
+    err_output = "[ERROR] 2023/03/10 20:47:00 account is not signed in"
+    monkeypatch.setattr(op, "_run", _SignedOutOnce(op, err_output))
+    with pytest.raises(OPAuthenticationException):
+        op.item_get(ITEM_NAME, vault=VAULT)
+
+
+@pytest.mark.usefixtures("setup_normal_op_env")
+def test_auth_verify_reactive_040(monkeypatch):
+    """
+    Test:
+      - Create an OP object with AUTH_VERIFY_REACTIVE, auth_retry enabled
+      - Simulate an 'op' command failing due to not being signed in
+    Verify:
+      - A new sign-in is performed exactly once
+      - The command is retried and succeeds
+    """
+    op = _op_with_policy(AUTH_VERIFY_REACTIVE, auth_retry=True)
+    err_output = "[ERROR] 2023/03/10 20:47:00 account is not signed in"
+    signed_out = _SignedOutOnce(op, err_output)
+    reauth_count = 0
+
+    def _reauthenticate():
+        nonlocal reauth_count
+        reauth_count += 1
+
+    monkeypatch.setattr(op, "_run", signed_out)
+    monkeypatch.setattr(op, "_reauthenticate", _reauthenticate)
+    item = op.item_get(ITEM_NAME, vault=VAULT)
+    assert item.title == ITEM_NAME
+    assert reauth_count == 1
+    assert signed_out.count == 2
+
+
+@pytest.mark.usefixtures("setup_normal_op_env")
+def test_auth_verify_reactive_050(monkeypatch):
+    """
+    Test:
+      - Create an OP object with AUTH_VERIFY_REACTIVE, auth_retry enabled
+      - Simulate an 'op' command failing due to not being signed in, even after retrying
+    Verify:
+      - The command is retried only once
+      - OPAuthenticationException is raised
+    """
+    op = _op_with_policy(AUTH_VERIFY_REACTIVE, auth_retry=True)
+    err_output = "[ERROR] 2023/03/10 20:47:00 account is not signed in"
+    signed_out = _SignedOutOnce(op, err_output, failures=2)
+    monkeypatch.setattr(op, "_run", signed_out)
+    monkeypatch.setattr(op, "_reauthenticate", lambda: None)
+    with pytest.raises(OPAuthenticationException):
+        op.item_get(ITEM_NAME, vault=VAULT)
+    assert signed_out.count == 2
+
+
+@pytest.mark.usefixtures("setup_normal_op_env")
+def test_auth_verify_reactive_060(monkeypatch):
+    """
+    Test:
+      - Create an OP object with AUTH_VERIFY_REACTIVE, auth_retry enabled
+      - Simulate every 'op' command started before a new sign-in failing due to
+        not being signed in
+      - Look up several items concurrently with item_get_many()
+    Verify:
+      - A new sign-in is performed exactly once
+      - Every item is returned
+    """
+    op = _op_with_policy(AUTH_VERIFY_REACTIVE, auth_retry=True)
+    err_output = "[ERROR] 2023/03/10 20:47:00 account is not signed in"
+    run = op._run
+    reauthenticate = op._reauthenticate
+    all_started = threading.Barrier(4)
+    reauth_count = 0
+
+    def _run(argv, **kwargs):
+        if not reauth_count:
+            # make sure every command fails before anyone signs in again
+            all_started.wait(timeout=10)
+            raise OPCmdFailedException(err_output, 1)
+        return run(argv, **kwargs)
+
+    def _reauthenticate():
+        nonlocal reauth_count
+        reauth_count += 1
+        reauthenticate()
+
+    monkeypatch.setattr(op, "_run", _run)
+    monkeypatch.setattr(op, "_reauthenticate", _reauthenticate)
+    items = op.item_get_many([ITEM_NAME] * 4, vault=VAULT, max_workers=4)
+    assert [item.title for item in items] == [ITEM_NAME] * 4
+    assert reauth_count == 1
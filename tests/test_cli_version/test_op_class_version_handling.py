@@ -115,3 +115,62 @@ def test_op_public_version_check_invalid_op_path_080(console_logger):
     OP.set_logger(console_logger)
     with pytest.raises(OPNotFoundException):
         OP.check_op_version(op_path)
+
+
+class _CallCounter:
+    """
+    Wrap a callable in order to count how many times it gets called
+    """
+
+    def __init__(self, func, return_value=None):
+        self.func = func
+        self.return_value = return_value
+        self.count = 0
+
+    def __call__(self, *args, **kwargs):
+        self.count += 1
+        if self.return_value is not None:
+            return self.return_value
+        return self.func(*args, **kwargs)
+
+
+@pytest.mark.usefixtures("valid_op_cli_config_homedir")
+@pytest.mark.usefixtures("setup_normal_op_env")
+def test_op_version_check_cached_090(monkeypatch):
+    """
+    Test repeatedly checking the version of the same 'op' path within the
+    revalidation interval
+
+    Verify: The 'op' path is resolved and stat()ed only once
+    """
+    size_mtime = _CallCounter(OP._op_path_size_mtime)
+    monkeypatch.setattr(OP, "_op_path_size_mtime", size_mtime)
+    for _ in range(5):
+        OP.check_op_version("mock-op")
+    assert size_mtime.count == 1
+
+
+@pytest.mark.usefixtures("valid_op_cli_config_homedir")
+@pytest.mark.usefixtures("setup_normal_op_env")
+def test_op_version_check_revalidate_100(monkeypatch):
+    """
+    Test checking the version of an 'op' path after the revalidation
+    interval has expired, and the binary has been replaced
+
+    Verify:
+      - The 'op' path is stat()ed again
+      - The replaced binary's version is checked
+    """
+    monkeypatch.setattr(OP, "OP_PATH_REVALIDATE_INTERVAL", 0)
+    OP.check_op_version("mock-op")
+
+    size_mtime = _CallCounter(OP._op_path_size_mtime,
+                              return_value=(1, 1.0))
+    get_version = _CallCounter(OP._get_cli_version)
+    monkeypatch.setattr(OP, "_op_path_size_mtime", size_mtime)
+    monkeypatch.setattr(OP, "_get_cli_version", get_version)
+    OP.check_op_version("mock-op")
+    OP.check_op_version("mock-op")
+    assert size_mtime.count == 2
+    # the version is only checked once for the replaced binary
+    assert get_version.count == 1
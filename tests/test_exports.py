@@ -3,7 +3,13 @@ import pyonepassword.api.constants
 import pyonepassword.api.decorators
 import pyonepassword.api.descriptor_types
 import pyonepassword.api.exceptions
+import pyonepassword.api.facts_cache
+import pyonepassword.api.fields
+import pyonepassword.api.json_backend
+import pyonepassword.api.metrics
 import pyonepassword.api.object_types
+import pyonepassword.api.observer
+import pyonepassword.api.template_cache
 import pyonepassword.api.validation
 
 """
@@ -66,6 +72,50 @@ def test_exceptions_exports():
         assert symbol in exceptions_all
 
 
+def test_facts_cache_exports():
+    """
+    Verify all symbols in pyonepassword.api.facts_cache are properly re-exported
+    """
+    facts_cache_all = pyonepassword.api.facts_cache.__all__
+    for symbol in dir(pyonepassword.api.facts_cache):
+        if symbol.startswith("__"):
+            continue
+        assert symbol in facts_cache_all
+
+
+def test_fields_exports():
+    """
+    Verify all symbols in pyonepassword.api.fields are properly re-exported
+    """
+    fields_all = pyonepassword.api.fields.__all__
+    for symbol in dir(pyonepassword.api.fields):
+        if symbol.startswith("__"):
+            continue
+        assert symbol in fields_all
+
+
+def test_json_backend_exports():
+    """
+    Verify all symbols in pyonepassword.api.json_backend are properly re-exported
+    """
+    json_backend_all = pyonepassword.api.json_backend.__all__
+    for symbol in dir(pyonepassword.api.json_backend):
+        if symbol.startswith("__"):
+            continue
+        assert symbol in json_backend_all
+
+
+def test_metrics_exports():
+    """
+    Verify all symbols in pyonepassword.api.metrics are properly re-exported
+    """
+    metrics_all = pyonepassword.api.metrics.__all__
+    for symbol in dir(pyonepassword.api.metrics):
+        if symbol.startswith("__"):
+            continue
+        assert symbol in metrics_all
+
+
 def test_object_types_exports():
     """
     Verify all symbols in pyonepassword.api.object_types are properly re-exported
@@ -77,6 +127,28 @@ def test_object_types_exports():
         assert symbol in object_types_all
 
 
+def test_observer_exports():
+    """
+    Verify all symbols in pyonepassword.api.observer are properly re-exported
+    """
+    observer_all = pyonepassword.api.observer.__all__
+    for symbol in dir(pyonepassword.api.observer):
+        if symbol.startswith("__"):
+            continue
+        assert symbol in observer_all
+
+
+def test_template_cache_exports():
+    """
+    Verify all symbols in pyonepassword.api.template_cache are properly re-exported
+    """
+    template_cache_all = pyonepassword.api.template_cache.__all__
+    for symbol in dir(pyonepassword.api.template_cache):
+        if symbol.startswith("__"):
+            continue
+        assert symbol in template_cache_all
+
+
 def test_object_validation_exports():
     """
     Verify all synmbols in pyonepassword.api.validation are properly re-exported
@@ -0,0 +1,189 @@
+"""
+Tests for the persistent facts cache, which lets OP objects skip running 'op' to
+gather facts about 'op' and its config
+"""
+from __future__ import annotations
+
+import os
+import stat
+from pathlib import Path
+
+import pytest
+
+import pyonepassword._facts_cache
+from pyonepassword import OP
+from pyonepassword._op_cli_config import OPCLIConfig
+from pyonepassword.api.facts_cache import (
+    OPFactsCache,
+    disable_facts_cache,
+    enable_facts_cache,
+    get_facts_cache
+)
+from pyonepassword.api.observer import OPCommandObserver, OPCommandRecord
+
+pytestmark = pytest.mark.usefixtures("valid_op_cli_config_homedir")
+
+ACCOUNT_ID = "5GHHPJK5HZC5BAT7WDUXW57G44"
+OP_MASTER_PASSWORD = "made-up-password"
+
+
+class _RecordingObserver(OPCommandObserver):
+
+    def __init__(self):
+        self.records = []
+
+    def command_finished(self, record: OPCommandRecord):
+        self.records.append(record)
+
+    def fact_commands(self):
+        # 'op --version' and 'op account list'
+        commands = [r for r in self.records
+                    if r.version_check or r.command == "account"]
+        return commands
+
+
+@pytest.fixture
+def recording_observer():
+    observer = _RecordingObserver()
+    OP.add_command_observer(observer)
+    yield observer
+    OP.remove_command_observer(observer)
+
+
+@pytest.fixture(autouse=True)
+def init_facts_cache():
+    facts_cache = pyonepassword._facts_cache._active_facts_cache
+
+    yield  # clean up after each test
+
+    pyonepassword._facts_cache._active_facts_cache = facts_cache
+
+
+def _new_op():
+    op = OP(op_path="mock-op",
+            account=ACCOUNT_ID,
+            password=OP_MASTER_PASSWORD)
+    return op
+
+
+@pytest.mark.usefixtures("setup_normal_op_env")
+def test_facts_cache_010(tmp_path: Path, recording_observer: _RecordingObserver):
+    """
+    Test:
+      - Enable the facts cache
+      - Create two OP objects
+    Verify:
+      - The first OP object runs 'op --version' and 'op account list'
+      - The second OP object doesn't, and is otherwise set up the same
+      - The cache file is only readable & writable by the owner
+    """
+    cache_path = Path(tmp_path, "facts.json")
+    enable_facts_cache(cache_path=cache_path)
+
+    op_1 = _new_op()
+    assert recording_observer.fact_commands()
+    recording_observer.records.clear()
+
+    # start fresh, as if this were a new process
+    OP._reset_class()
+    op_2 = _new_op()
+    assert recording_observer.fact_commands() == []
+    assert recording_observer.records
+
+    assert op_2.session_var == op_1.session_var
+    assert str(op_2._cli_version) == str(op_1._cli_version)
+    assert op_2._account_list == op_1._account_list
+    assert op_2._op_config == op_1._op_config
+    assert op_2._op_config.account_map.keys() == op_1._op_config.account_map.keys()
+    assert stat.S_IMODE(os.stat(cache_path).st_mode) == 0o600
+
+
+@pytest.mark.usefixtures("setup_normal_op_env")
+def test_facts_cache_020(tmp_path: Path, recording_observer: _RecordingObserver):
+    """
+    Test:
+      - Enable the facts cache, and create an OP object
+      - Update the 'op' config's modification time
+      - Create another OP object
+    Verify:
+      - The second OP object runs 'op --version' and 'op account list' again
+    """
+    enable_facts_cache(cache_path=Path(tmp_path, "facts.json"))
+    _new_op()
+    recording_observer.records.clear()
+
+    config_path = OPCLIConfig._get_config_path()
+    config_stat = os.stat(config_path)
+    os.utime(config_path, (config_stat.st_atime, config_stat.st_mtime + 10))
+
+    OP._reset_class()
+    _new_op()
+    assert recording_observer.fact_commands()
+
+
+@pytest.mark.usefixtures("setup_normal_op_env")
+def test_facts_cache_030(tmp_path: Path):
+    """
+    Test:
+      - Enable the facts cache, with a cache file that isn't valid JSON
+      - Create an OP object
+    Verify:
+      - The OP object is created normally
+      - The cache file is replaced with one containing facts
+    """
+    cache_path = Path(tmp_path, "facts.json")
+    cache_path.write_text("not json")
+    facts_cache = enable_facts_cache(cache_path=cache_path)
+
+    _new_op()
+    assert facts_cache.load("mock-op") is not None
+
+
+@pytest.mark.usefixtures("setup_normal_op_env")
+def test_facts_cache_040(tmp_path: Path):
+    """
+    Test:
+      - Enable the facts cache with a maximum age, and create an OP object
+      - Load cached facts with a cache object whose maximum age has passed
+    Verify:
+      - Cached facts are found when not expired, and not found when expired
+    """
+    cache_path = Path(tmp_path, "facts.json")
+    facts_cache = enable_facts_cache(cache_path=cache_path, max_age=3600)
+    _new_op()
+    assert facts_cache.load("mock-op") is not None
+
+    expired_cache = OPFactsCache(cache_path=cache_path, max_age=-1)
+    assert expired_cache.load("mock-op") is None
+
+
+@pytest.mark.usefixtures("setup_normal_op_env")
+def test_facts_cache_050(tmp_path: Path):
+    """
+    Test:
+      - Enable then disable the facts cache
+      - Create an OP object
+    Verify:
+      - get_facts_cache() returns None
+      - No cache file is written
+    """
+    cache_path = Path(tmp_path, "facts.json")
+    enable_facts_cache(cache_path=cache_path)
+    disable_facts_cache()
+    assert get_facts_cache() is None
+
+    _new_op()
+    assert not cache_path.exists()
+
+
+def test_facts_cache_060(monkeypatch, tmp_path: Path):
+    """
+    Test:
+      - Create an OPFactsCache object without a path, with XDG_CACHE_HOME set
+    Verify:
+      - The cache path is under XDG_CACHE_HOME
+    """
+    monkeypatch.setenv("XDG_CACHE_HOME", str(tmp_path))
+    facts_cache = OPFactsCache()
+    assert facts_cache.cache_path == Path(
+        tmp_path, "pyonepassword", "facts.json")
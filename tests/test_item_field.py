@@ -248,3 +248,32 @@ def test_item_lookup_field_03(valid_data: ValidData, expected_login_item_data):
         field_label_lower, case_sensitive=False)
 
     assert result.value == expected_field.value
+
+
+def test_item_lookup_field_04(valid_data: ValidData):
+    """
+    Test field lookup by label returns every match, in order
+
+    Create:
+        - a login item with fields and sections
+        - look up fields by each field label, exactly, and case-insensitively
+    Verify:
+        - each lookup returns the same list of fields as checking every field's label
+        - modifying a returned list doesn't affect later lookups
+    """
+    valid_item_dict = valid_data.data_for_name("example-login-with-fields")
+    result_login_item = OPLoginItem(valid_item_dict)
+    all_fields = list(result_login_item._field_map.values())
+
+    for field in all_fields:
+        label = field.label
+        expected = [f for f in all_fields if f.label == label]
+        assert result_login_item.fields_by_label(label) == expected
+
+        expected = [f for f in all_fields if f.label.lower() == label.lower()]
+        result = result_login_item.fields_by_label(
+            label.upper(), case_sensitive=False)
+        assert result == expected
+        result.clear()
+        assert result_login_item.fields_by_label(
+            label.upper(), case_sensitive=False) == expected
@@ -0,0 +1,182 @@
+"""
+Tests for lazy field policy, where item objects defer building their
+section and field objects until they're needed
+"""
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+import pytest
+
+if TYPE_CHECKING:
+    from .fixtures.non_comformant_data import NonConformantData
+    from .fixtures.valid_data import ValidData
+
+from pyonepassword.api.exceptions import (
+    OPInvalidItemException,
+    OPItemFieldCollisionException,
+    OPSectionCollisionException
+)
+from pyonepassword.api.fields import (
+    enable_lazy_fields,
+    get_lazy_fields,
+    set_eager_fields_for_class,
+    set_lazy_fields_for_class
+)
+from pyonepassword.api.object_types import (
+    OPLoginItem,
+    OPLoginItemRelaxedValidation
+)
+from pyonepassword.op_items.field_registry import OPItemFieldFactory
+from pyonepassword.op_items.item_field_policy import _OPItemFieldPolicy
+
+VALID_LOGIN = "example-login-with-fields"
+
+
+@pytest.fixture(autouse=True)
+def init_item_field_policy():
+    lazy_classes = set(_OPItemFieldPolicy._lazy_item_classes)
+    lazy_flag = _OPItemFieldPolicy._lazy_fields
+
+    yield  # clean up after each test
+
+    _OPItemFieldPolicy._lazy_item_classes = lazy_classes
+    _OPItemFieldPolicy._lazy_fields = lazy_flag
+
+
+def test_lazy_fields_010(valid_data: ValidData):
+    """
+    Test:
+      - Enable lazy fields globally
+      - Create a login item, and read its title
+    Verify:
+      - Section & field objects are not built until a field is accessed
+      - Field values are correct once they are
+    """
+    login_dict = valid_data.data_for_name(VALID_LOGIN)
+    eager_item = OPLoginItem(login_dict)
+    enable_lazy_fields()
+    item = OPLoginItem(login_dict)
+    assert item.lazy_fields()
+    assert item.title == eager_item.title
+    assert not item._sections_fields_initialized
+
+    assert item.password == eager_item.password
+    assert item._sections_fields_initialized
+
+
+def test_lazy_fields_020(valid_data: ValidData):
+    """
+    Test:
+      - Create a login item with lazy fields, and another without
+      - Look up sections on the lazy item
+    Verify:
+      - Once sections and fields are built, both items are identical
+    """
+    login_dict = valid_data.data_for_name(VALID_LOGIN)
+    eager_item = OPLoginItem(login_dict)
+    set_lazy_fields_for_class(OPLoginItem)
+    lazy_item = OPLoginItem(login_dict)
+
+    assert len(lazy_item.sections) == len(eager_item.sections)
+    assert lazy_item == eager_item
+    section = eager_item.sections[0]
+    assert lazy_item.section_by_id(section.section_id) == section
+
+
+def test_lazy_fields_030():
+    """
+    Test:
+      - Set lazy fields for OPLoginItem, then set eager fields
+    Verify:
+      - The per-class policy is applied only to that class, and can be removed
+      - The global policy is unaffected
+    """
+    set_lazy_fields_for_class(OPLoginItem)
+    assert get_lazy_fields(item_class=OPLoginItem)
+    assert not get_lazy_fields()
+    set_eager_fields_for_class(OPLoginItem)
+    assert not get_lazy_fields(item_class=OPLoginItem)
+
+
+@pytest.mark.parametrize("data_name,exception_class",
+                         [("login-duplicate-section", OPSectionCollisionException),
+                          ("login-duplicate-field", OPItemFieldCollisionException),
+                          ("login-field-missing-id", OPInvalidItemException)])
+def test_lazy_fields_040(non_conformant_data: NonConformantData, data_name, exception_class):
+    """
+    Test:
+      - Enable lazy fields globally
+      - Create login items from non-conformant data
+    Verify:
+      - The same exceptions are raised as without lazy fields, when the item is created
+    """
+    enable_lazy_fields()
+    login_dict = non_conformant_data.data_for_name(data_name)
+    with pytest.raises(exception_class):
+        OPLoginItem(login_dict)
+
+
+def test_lazy_fields_050(non_conformant_data: NonConformantData):
+    """
+    Test:
+      - Create a relaxed validation login item from non-conformant data, with
+        and without lazy fields
+    Verify:
+      - Sections and fields are built without exceptions, same as without lazy fields
+    """
+    login_dict = non_conformant_data.data_for_name("login-duplicate-section")
+    eager_item = OPLoginItemRelaxedValidation(login_dict)
+    enable_lazy_fields()
+    item = OPLoginItemRelaxedValidation(login_dict)
+
+    assert not item._sections_fields_initialized
+    assert item.username == eager_item.username
+    assert item.sections == eager_item.sections
+
+
+def _login_dict_without_password_type(valid_data: ValidData):
+    login_dict = valid_data.data_for_name(VALID_LOGIN)
+    for field_dict in login_dict["fields"]:
+        if field_dict["id"] == "password":
+            del field_dict["type"]
+    return login_dict
+
+
+def test_lazy_fields_060(valid_data: ValidData):
+    """
+    Test:
+      - Create login items whose password field has no "type", with and
+        without lazy fields
+    Verify:
+      - The same exception is raised in both cases, when the item is created
+    """
+    with pytest.raises(KeyError) as eager_exc_info:
+        OPLoginItem(_login_dict_without_password_type(valid_data))
+    enable_lazy_fields()
+    with pytest.raises(KeyError) as lazy_exc_info:
+        OPLoginItem(_login_dict_without_password_type(valid_data))
+    assert lazy_exc_info.value.args == eager_exc_info.value.args
+
+
+def test_lazy_fields_070(valid_data: ValidData, monkeypatch):
+    """
+    Test:
+      - Enable lazy fields globally, and create a login item
+      - Make building the item's fields fail with KeyError
+      - Look up a field and a section by ID
+    Verify:
+      - The KeyError is raised, rather than OPFieldNotFoundException or
+        OPSectionNotFoundException
+    """
+    enable_lazy_fields()
+    item = OPLoginItem(valid_data.data_for_name(VALID_LOGIN))
+
+    def _item_field(field_dict, *args):
+        raise KeyError("type")
+
+    monkeypatch.setattr(OPItemFieldFactory, "item_field", _item_field)
+    with pytest.raises(KeyError, match="type"):
+        item.field_by_id("password")
+    with pytest.raises(KeyError, match="type"):
+        item.section_by_id("add more")
@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import json
 from typing import TYPE_CHECKING, List
 
 import pytest
@@ -154,3 +155,62 @@ def test_section_field_not_found_02(valid_data: ValidData):
 
     with pytest.raises(OPFieldNotFoundException):
         result_section.first_field_by_label(field_label)
+
+
+def test_item_section_04(valid_data: ValidData):
+    """
+    Test field lookup by label after registering a new field
+
+    Create:
+      - Look up a section on the item object by its ID
+      - Look up a field on the section object by label
+      - Register a new field with the same label, differing in case
+    Verify:
+      - Case-sensitive lookup returns only the original field
+      - Case-insensitive lookup returns both, in the order they were registered
+    """
+    section_id = "vh4wk7qyw46urc7wuwczzhpm7u"
+    field_label = "Example Field"
+    valid_item_dict = valid_data.data_for_name("example-login-with-fields")
+    result_login_item = OPLoginItem(valid_item_dict)
+    result_section = result_login_item.section_by_id(section_id)
+    original_fields = result_section.fields_by_label(field_label)
+
+    new_field = {"id": "newfieldid",
+                 "type": "STRING",
+                 "label": field_label.upper(),
+                 "value": "new value"}
+    result_section.register_field(new_field)
+
+    assert result_section.fields_by_label(field_label) == original_fields
+    result = result_section.fields_by_label(
+        field_label, case_sensitive=False)
+    assert result == original_fields + [new_field]
+
+
+def test_item_section_05(valid_data: ValidData):
+    """
+    Test that sections share their item's field objects
+
+    Create:
+      - A login item object with fields and sections
+      - Look up a section on the item object by its ID
+    Verify:
+      - Each of the section's fields is the same object as the item's field with that ID
+      - A change made to a field via the section is visible via the item
+      - The item can still be serialized to JSON
+    """
+    section_id = "vh4wk7qyw46urc7wuwczzhpm7u"
+    valid_item_dict = valid_data.data_for_name("example-login-with-fields")
+    result_login_item = OPLoginItem(valid_item_dict)
+    result_section = result_login_item.section_by_id(section_id)
+
+    assert result_section.fields
+    for field in result_section.fields:
+        assert field is result_login_item.field_by_id(field.field_id)
+
+    field = result_section.fields[0]
+    field["value"] = "new value"
+    assert result_login_item.field_value_by_id(field.field_id) == "new value"
+
+    json.dumps(result_login_item)
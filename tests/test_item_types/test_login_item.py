@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import json
 from typing import TYPE_CHECKING
 
 if TYPE_CHECKING:
@@ -167,3 +168,24 @@ def test_login_item_100(valid_data: ValidData):
 
     # "favorite" is unset for Example Login 2
     assert result.favorite is False
+
+
+def test_login_item_110(valid_data: ValidData):
+    """
+    Create:
+        - login item object from "example login 1"
+    Verify:
+        - The item's "urls" and "vault" entries are the same objects returned by
+          the urls and vault properties, rather than copies
+        - Those entries still serialize to the same JSON as in the original dictionary
+        - The original dictionary isn't modified
+    """
+    item_dict = valid_data.data_for_name(VALID_LOGIN_1)
+    result = OPLoginItem(item_dict)
+
+    assert result["urls"] is result.urls
+    assert result["vault"] is result.vault
+    for key in ["urls", "vault"]:
+        assert json.loads(json.dumps(result[key])) == item_dict[key]
+    assert type(item_dict["urls"][0]) is dict
+    assert type(item_dict["vault"]) is dict
@@ -0,0 +1,198 @@
+"""
+Tests for selecting the JSON backend, and that every backend decodes and encodes
+JSON exactly as python's 'json' module does
+"""
+import json
+from pathlib import Path
+
+import pytest
+
+import pyonepassword.json
+from pyonepassword.api.exceptions import OPJSONBackendException
+from pyonepassword.api.json_backend import (
+    JSON_BACKEND_ENV_VAR,
+    JSON_BACKEND_ORJSON,
+    JSON_BACKEND_STDLIB,
+    available_json_backends,
+    get_json_backend,
+    set_json_backend
+)
+from pyonepassword.json import safe_unjson, serialize_json, unjson_multiple
+
+RESPONSE_PATH = Path("tests", "config", "mock-op", "responses")
+ITEM_LIST_OUTPUT_PATH = Path(
+    RESPONSE_PATH, "item-list-vault-test-data", "output")
+BATCH_OUTPUT_PATH = Path(
+    RESPONSE_PATH, "item-get-multiple-vault-test-data", "output")
+
+# JSON the 'json' module decodes, but 'orjson' either can't, or decodes differently
+UNUSUAL_JSON = [
+    "NaN",
+    "[Infinity, -Infinity]",
+    "123456789012345678901234567890",
+    '{"big": -98765432109876543210}',
+    '"\\ud800"',
+    '"\ud800"'
+]
+
+INVALID_JSON = ['{"a": }', '{"a": 1', "", '{"a": 1}{"b": 2}']
+
+
+@pytest.fixture(autouse=True)
+def init_json_backend():
+    json_backend = pyonepassword.json._active_json_backend
+
+    yield  # clean up after each test
+
+    pyonepassword.json._active_json_backend = json_backend
+
+
+def _types(obj):
+    if isinstance(obj, dict):
+        obj_types = {key: _types(value) for key, value in obj.items()}
+    elif isinstance(obj, list):
+        obj_types = [_types(value) for value in obj]
+    else:
+        obj_types = type(obj)
+    return obj_types
+
+
+@pytest.mark.parametrize("backend_name", available_json_backends())
+def test_json_backend_010(backend_name):
+    """
+    Test:
+      - Select each available JSON backend
+      - Decode 'op item list' output
+    Verify:
+      - The decoded objects, and their types, are the same as from json.loads()
+    """
+    json_str = ITEM_LIST_OUTPUT_PATH.read_text()
+    expected = json.loads(json_str)
+    set_json_backend(backend_name)
+
+    decoded = safe_unjson(json_str)
+    assert decoded == expected
+    assert _types(decoded) == _types(expected)
+
+
+@pytest.mark.parametrize("backend_name", available_json_backends())
+@pytest.mark.parametrize("json_str", UNUSUAL_JSON)
+def test_json_backend_020(backend_name, json_str):
+    """
+    Test:
+      - Select each available JSON backend
+      - Decode JSON that not all decoders handle the same way
+    Verify:
+      - The decoded objects, and their types, are the same as from json.loads()
+    """
+    expected = json.loads(json_str)
+    set_json_backend(backend_name)
+
+    decoded = safe_unjson(json_str)
+    # NaN != NaN, so compare repr()
+    assert repr(decoded) == repr(expected)
+    assert _types(decoded) == _types(expected)
+
+
+@pytest.mark.parametrize("backend_name", available_json_backends())
+@pytest.mark.parametrize("json_str", INVALID_JSON)
+def test_json_backend_030(backend_name, json_str):
+    """
+    Test:
+      - Select each available JSON backend
+      - Decode invalid JSON
+    Verify:
+      - The same JSONDecodeError is raised as from json.loads()
+    """
+    with pytest.raises(json.JSONDecodeError) as expected:
+        json.loads(json_str)
+    set_json_backend(backend_name)
+
+    with pytest.raises(json.JSONDecodeError) as e:
+        safe_unjson(json_str)
+    assert str(e.value) == str(expected.value)
+
+
+@pytest.mark.parametrize("backend_name", available_json_backends())
+@pytest.mark.parametrize("json_str",
+                         [BATCH_OUTPUT_PATH.read_text(),
+                          '{"a": 1}\n{"b": "}\\n{"}\n',
+                          '{"a": 1}{"b": 2} 3\n[4]\n{"c": 5}',
+                          '{"big": 123456789012345678901234567890}\n{"a": 1}'])
+def test_json_backend_040(backend_name, json_str):
+    """
+    Test:
+      - Select each available JSON backend
+      - Decode concatenated JSON documents, such as 'op item get -' output
+    Verify:
+      - The decoded documents, and their types, are the same as with the 'stdlib' backend
+    """
+    set_json_backend(JSON_BACKEND_STDLIB)
+    expected = unjson_multiple(json_str)
+    set_json_backend(backend_name)
+
+    decoded = unjson_multiple(json_str)
+    assert decoded == expected
+    assert _types(decoded) == _types(expected)
+
+
+@pytest.mark.parametrize("backend_name", available_json_backends())
+@pytest.mark.parametrize("indent", [None, 2])
+def test_json_backend_050(backend_name, indent):
+    """
+    Test:
+      - Select each available JSON backend
+      - Serialize decoded 'op item list' output
+    Verify:
+      - The serialized JSON is identical to json.dumps()
+    """
+    obj = {"items": json.loads(ITEM_LIST_OUTPUT_PATH.read_text()),
+           "non-ascii": "Ünïcödé",
+           "number": 1.5e16}
+    set_json_backend(backend_name)
+
+    assert serialize_json(obj, indent=indent) == json.dumps(obj, indent=indent)
+
+
+def test_json_backend_060():
+    """
+    Test:
+      - Select the "auto" backend
+    Verify:
+      - 'orjson' is selected if it is available, and 'stdlib' otherwise
+    """
+    backend_name = set_json_backend()
+    if JSON_BACKEND_ORJSON in available_json_backends():
+        assert backend_name == JSON_BACKEND_ORJSON
+    else:
+        assert backend_name == JSON_BACKEND_STDLIB
+    assert get_json_backend() == backend_name
+
+
+def test_json_backend_070(monkeypatch):
+    """
+    Test:
+      - Set the JSON backend environment variable, with no backend selected yet
+    Verify:
+      - The environment variable's backend is selected
+    """
+    monkeypatch.setenv(JSON_BACKEND_ENV_VAR, JSON_BACKEND_STDLIB)
+    pyonepassword.json._active_json_backend = None
+
+    assert get_json_backend() == JSON_BACKEND_STDLIB
+
+
+def test_json_backend_080(monkeypatch):
+    """
+    Test:
+      - Select an unknown backend via API, and via the environment variable
+    Verify:
+      - OPJSONBackendException is raised
+    """
+    with pytest.raises(OPJSONBackendException):
+        set_json_backend("not-a-json-backend")
+
+    monkeypatch.setenv(JSON_BACKEND_ENV_VAR, "not-a-json-backend")
+    pyonepassword.json._active_json_backend = None
+    with pytest.raises(OPJSONBackendException):
+        safe_unjson('{"a": 1}')
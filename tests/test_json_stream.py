@@ -0,0 +1,145 @@
+import io
+import json
+from pathlib import Path
+
+import pytest
+
+import pyonepassword.json
+from pyonepassword.json import unjson_multiple, unjson_stream
+
+RESPONSE_PATH = Path("tests", "config", "mock-op", "responses")
+BATCH_OUTPUT_PATH = Path(
+    RESPONSE_PATH, "item-get-multiple-vault-test-data", "output")
+
+MIXED_DOCUMENTS = [
+    {"title": "Ünïcödé", "fields": [1, 2, {"value": "}{"}]},
+    123,
+    "a string",
+    [4.5e3, -1],
+    True,
+    None,
+    4.5
+]
+
+
+def _mixed_json():
+    docs = [json.dumps(doc, ensure_ascii=False) for doc in MIXED_DOCUMENTS]
+    return "\n".join(docs) + "\n"
+
+
+@pytest.mark.parametrize("chunk_size", [1, 2, 3, 7, 64, 1024 * 1024])
+def test_unjson_stream_010(chunk_size):
+    """
+    Decode a binary stream of concatenated JSON documents, reading a variety of
+    chunk sizes, including ones that split multi-byte characters
+
+    Verify the decoded documents match the originals
+    """
+    data = _mixed_json().encode("utf-8")
+    decoded = list(unjson_stream(io.BytesIO(data), chunk_size=chunk_size))
+    assert decoded == MIXED_DOCUMENTS
+
+
+@pytest.mark.parametrize("chunk_size", [1, 5, 1024 * 1024])
+def test_unjson_stream_020(chunk_size):
+    """
+    Decode a text stream of concatenated JSON documents
+
+    Verify the decoded documents match the originals
+    """
+    text = _mixed_json()
+    decoded = list(unjson_stream(io.StringIO(text), chunk_size=chunk_size))
+    assert decoded == MIXED_DOCUMENTS
+
+
+def test_unjson_stream_030():
+    """
+    Decode 'op item get -' output for multiple items, one document at a time
+
+    Verify:
+        - The first item is yielded before the entire stream has been read
+        - All items are decoded
+    """
+    data = BATCH_OUTPUT_PATH.read_bytes()
+    reader = io.BytesIO(data)
+    chunk_size = 1024
+    stream = unjson_stream(reader, chunk_size=chunk_size)
+
+    first = next(stream)
+    assert first["title"] == "Example Login 1"
+    assert reader.tell() < len(data)
+
+    remaining = list(stream)
+    assert [item["title"] for item in remaining] == ["Example Login 2"]
+
+
+def test_unjson_stream_040():
+    """
+    Decode a stream that ends partway through a document
+
+    Verify JSONDecodeError is raised after yielding the complete document
+    """
+    stream = unjson_stream(io.StringIO('{"a": 1}\n{"b": '), chunk_size=4)
+    assert next(stream) == {"a": 1}
+    with pytest.raises(json.JSONDecodeError):
+        next(stream)
+
+
+@pytest.mark.parametrize("text", ["", "   \n\t "])
+def test_unjson_multiple_010(text):
+    """
+    Decode empty or whitespace-only output
+
+    Verify an empty list is returned
+    """
+    assert unjson_multiple(text) == []
+
+
+def test_unjson_multiple_020():
+    """
+    Decode a string of concatenated JSON documents
+
+    Verify the decoded documents match the originals
+    """
+    assert unjson_multiple(_mixed_json()) == MIXED_DOCUMENTS
+
+
+@pytest.mark.parametrize("chunk_size", [1, 2, 3, 4, 5, 6, 7, 8])
+def test_unjson_stream_050(chunk_size):
+    """
+    Decode documents with escaped quotes & backslashes, and brackets inside strings,
+    reading chunk sizes that split escape sequences
+
+    Verify the decoded documents match the originals
+    """
+    documents = [{"a": 'quote " backslash \\ brackets }{][ end\\'},
+                 ["\\\"", "\\\\"],
+                 '"\\"']
+    text = "\n".join(json.dumps(doc) for doc in documents)
+    decoded = list(unjson_stream(io.StringIO(text), chunk_size=chunk_size))
+    assert decoded == documents
+
+
+def test_unjson_stream_060(monkeypatch):
+    """
+    Decode a large document, reading it in small chunks
+
+    Verify:
+        - The document is decoded
+        - Decoding is only attempted once the entire document has been read,
+          rather than once per chunk
+    """
+    document = {"fields": [{"label": f"field {i}", "value": "x" * 100}
+                           for i in range(10_000)]}
+    data = (json.dumps(document) + "\n").encode("utf-8")
+    backend = pyonepassword.json._json_backend()
+    loads_calls = []
+
+    def _loads(json_str):
+        loads_calls.append(len(json_str))
+        return type(backend).loads(backend, json_str)
+
+    monkeypatch.setattr(backend, "loads", _loads)
+    decoded = list(unjson_stream(io.BytesIO(data), chunk_size=1024))
+    assert decoded == [document]
+    assert loads_calls == [len(data) - 1]
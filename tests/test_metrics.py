@@ -0,0 +1,168 @@
+"""
+Tests for process-wide metrics and their Prometheus text exposition
+"""
+from __future__ import annotations
+
+import re
+
+import pytest
+
+from pyonepassword import OP
+from pyonepassword.api.metrics import (
+    OPMetrics,
+    disable_metrics,
+    enable_metrics,
+    get_metrics
+)
+from pyonepassword.api.observer import OPCommandRecord
+from pyonepassword.string import RedactedString
+
+pytestmark = pytest.mark.usefixtures("valid_op_cli_config_homedir")
+
+ITEM_NAME = "Example Login 1"
+VAULT = "Test Data"
+
+
+@pytest.fixture
+def metrics():
+    metrics = enable_metrics()
+    yield metrics
+    disable_metrics()
+
+
+def _sample(text, name, labels=""):
+    # find the value of a single sample in prometheus text output
+    pattern = rf"^pyonepassword_{name}{re.escape(labels)} (\S+)$"
+    match = re.search(pattern, text, re.MULTILINE)
+    assert match, f"no sample for {name}{labels}"
+    return float(match.group(1))
+
+
+def _record(command, subcommands, returncode=0, wall_time=0.5):
+    record = OPCommandRecord(command=command,
+                             subcommands=subcommands,
+                             cmdline=RedactedString("op"),
+                             wall_time=wall_time,
+                             returncode=returncode,
+                             stdout_bytes=0,
+                             stderr_bytes=0,
+                             auth_preflight=False,
+                             version_check=False)
+    return record
+
+
+def test_metrics_010():
+    """
+    Test:
+      - Enable metrics twice, then disable them
+    Verify:
+      - The same process-wide metrics object is returned both times
+      - get_metrics() returns None once metrics are disabled
+    """
+    metrics_1 = enable_metrics()
+    metrics_2 = enable_metrics()
+    assert metrics_1 is metrics_2
+    assert get_metrics() is metrics_1
+    disable_metrics()
+    assert get_metrics() is None
+
+
+@pytest.mark.usefixtures("setup_normal_op_env")
+def test_metrics_020(metrics: OPMetrics, signed_in_op: OP):
+    """
+    Test:
+      - Enable metrics
+      - Look up the same item three times
+    Verify:
+      - Three 'item get' processes are counted, with non-zero cumulative latency
+      - An auth check is counted for each lookup
+      - Each item parse is counted
+      - Version checks are counted as cache hits
+    """
+    metrics.reset()
+    for _ in range(3):
+        signed_in_op.item_get(ITEM_NAME, vault=VAULT)
+    text = metrics.prometheus_text()
+    assert _sample(text, "op_commands_total", '{command="item get"}') == 3
+    assert _sample(text, "op_command_seconds_total",
+                   '{command="item get"}') > 0
+    assert _sample(text, "op_commands_total", '{command="whoami"}') == 3
+    assert _sample(text, "auth_checks_total") == 3
+    assert _sample(text, "item_parses_total") == 3
+    assert _sample(text, "version_check_cache_hits_total") >= 3
+
+
+def test_metrics_030():
+    """
+    Test:
+      - Feed an OPMetrics object a successful, failed, and timed out command record
+    Verify:
+      - Failures and timeouts are counted separately
+      - Every sample has a HELP and TYPE header
+    """
+    metrics = OPMetrics()
+    metrics.command_finished(_record("item", ["get"]))
+    metrics.command_finished(_record("item", ["get"], returncode=1))
+    metrics.command_finished(_record("item", ["list"], returncode=None))
+    text = metrics.prometheus_text()
+    assert _sample(text, "op_commands_total", '{command="item get"}') == 2
+    assert _sample(text, "op_command_failures_total",
+                   '{command="item get"}') == 1
+    assert _sample(text, "op_command_timeouts_total",
+                   '{command="item list"}') == 1
+    assert _sample(text, "op_command_seconds_total",
+                   '{command="item get"}') == 1.0
+
+    names = set(re.findall(r"^(pyonepassword_\w+)", text, re.MULTILINE))
+    for name in names:
+        assert f"# HELP {name} " in text
+        assert f"# TYPE {name} counter" in text
+
+
+def test_metrics_040():
+    """
+    Test:
+      - Feed an OPMetrics object a record for a command containing characters
+        that must be escaped
+    Verify:
+      - The label value is escaped
+    """
+    metrics = OPMetrics()
+    metrics.command_finished(_record('it"em', ["get\\"]))
+    text = metrics.prometheus_text()
+    assert '{command="it\\"em get\\\\"}' in text
+
+
+def test_metrics_050(tmp_path):
+    """
+    Test:
+      - Write metrics to a file
+    Verify:
+      - The file contents match prometheus_text()
+      - No temporary files are left behind
+    """
+    metrics = OPMetrics()
+    metrics.command_finished(_record("item", ["get"]))
+    metrics_path = tmp_path / "pyonepassword.prom"
+    metrics.write_prometheus(metrics_path)
+    assert metrics_path.read_text() == metrics.prometheus_text()
+    assert list(tmp_path.iterdir()) == [metrics_path]
+
+
+@pytest.mark.usefixtures("setup_normal_op_env")
+def test_metrics_060(metrics: OPMetrics, signed_in_op: OP):
+    """
+    Test:
+      - Enable metrics
+      - Look up the same item three times, verifying authentication each time
+    Verify:
+      - The 'op' version cache is looked up exactly once per lookup, even though
+        authentication is verified too
+    """
+    metrics.reset()
+    for _ in range(3):
+        signed_in_op.item_get(ITEM_NAME, vault=VAULT)
+    text = metrics.prometheus_text()
+    assert _sample(text, "auth_checks_total") == 3
+    assert _sample(text, "version_check_cache_hits_total") == 3
+    assert _sample(text, "version_check_cache_misses_total") == 0
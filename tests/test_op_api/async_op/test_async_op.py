@@ -0,0 +1,217 @@
+from __future__ import annotations
+
+import asyncio
+import threading
+
+import pytest
+
+from pyonepassword import OP, AsyncOP
+from pyonepassword.api.exceptions import (
+    OPDocumentGetException,
+    OPItemGetException,
+    OPVaultGetException
+)
+from pyonepassword.api.object_types import OPLoginItem
+
+# ensure HOME env variable is set, and there's a valid op config present
+pytestmark = pytest.mark.usefixtures("valid_op_cli_config_homedir")
+
+ACCOUNT_ID = "5GHHPJK5HZC5BAT7WDUXW57G44"
+OP_MASTER_PASSWORD = "made-up-password"
+ITEM_UUID = "nok7367v4vbsfgg2fczwu4ei44"
+DOCUMENT_NAME = "Example Login 2 - 1200px-SpongeBob_SquarePants_character.svg.png.webp"
+
+
+def test_async_op_item_get_010(signed_in_op: OP):
+    """
+    Test:
+        - get an item via AsyncOP.item_get()
+    Verify:
+        - the item matches the one returned by OP.item_get()
+    """
+    async_op = AsyncOP(signed_in_op)
+    expected = signed_in_op.item_get(ITEM_UUID)
+    result = asyncio.run(async_op.item_get(ITEM_UUID))
+    assert isinstance(result, OPLoginItem)
+    assert result.unique_id == expected.unique_id
+    assert result.username == expected.username
+    assert result.password == expected.password
+
+
+def test_async_op_item_get_020(signed_in_op: OP):
+    """
+    Test:
+        - get an invalid item via AsyncOP.item_get()
+    Verify:
+        - OPItemGetException is raised
+    """
+    async_op = AsyncOP(signed_in_op)
+    with pytest.raises(OPItemGetException):
+        asyncio.run(async_op.item_get("Invalid Item"))
+
+
+def test_async_op_item_get_many_030(signed_in_op: OP):
+    """
+    Test:
+        - get several items via AsyncOP.item_get_many(), including one that doesn't exist
+    Verify:
+        - results are returned in the same order as the identifiers
+        - the failed lookup's OPItemGetException is returned in its place
+    """
+    async_op = AsyncOP(signed_in_op, max_concurrency=2)
+    identifiers = [ITEM_UUID, "Invalid Item", ITEM_UUID]
+    results = asyncio.run(async_op.item_get_many(identifiers))
+    assert len(results) == len(identifiers)
+    assert isinstance(results[1], OPItemGetException)
+    assert results[0].unique_id == ITEM_UUID
+    assert results[2].unique_id == ITEM_UUID
+
+
+def test_async_op_max_concurrency_040(signed_in_op: OP, monkeypatch):
+    """
+    Test:
+        - get many items via AsyncOP.item_get_many() with max_concurrency=2
+    Verify:
+        - no more than 2 'op' commands are ever running at once
+    """
+    running = 0
+    max_running = 0
+    run_async = signed_in_op._run_async
+
+    async def _counting_run_async(argv, **kwargs):
+        nonlocal running, max_running
+        running += 1
+        max_running = max(running, max_running)
+        try:
+            # give other tasks a chance to start, if they're allowed to
+            await asyncio.sleep(0.01)
+            return await run_async(argv, **kwargs)
+        finally:
+            running -= 1
+
+    monkeypatch.setattr(signed_in_op, "_run_async", _counting_run_async)
+    async_op = AsyncOP(signed_in_op, max_concurrency=2)
+    results = asyncio.run(async_op.item_get_many([ITEM_UUID] * 6))
+    assert len(results) == 6
+    assert max_running == 2
+
+
+def test_async_op_document_get_050(signed_in_op: OP):
+    """
+    Test:
+        - get a document via AsyncOP.document_get()
+    Verify:
+        - the filename and bytes match those returned by OP.document_get()
+    """
+    async_op = AsyncOP(signed_in_op)
+    vault = "Test Data"
+    expected = signed_in_op.document_get(DOCUMENT_NAME, vault=vault)
+    result = asyncio.run(async_op.document_get(DOCUMENT_NAME, vault=vault))
+    assert result == expected
+
+
+def test_async_op_document_get_060(signed_in_op: OP):
+    """
+    Test:
+        - get an invalid document via AsyncOP.document_get()
+    Verify:
+        - OPDocumentGetException is raised
+    """
+    async_op = AsyncOP(signed_in_op)
+    with pytest.raises(OPDocumentGetException):
+        asyncio.run(async_op.document_get("Invalid Document"))
+
+
+def test_async_op_objects_070(signed_in_op: OP):
+    """
+    Test:
+        - get and list vaults, users, groups, and items concurrently via AsyncOP
+    Verify:
+        - each result matches the result of the corresponding OP method
+    """
+    async_op = AsyncOP(signed_in_op)
+
+    async def _gather():
+        return await asyncio.gather(
+            async_op.vault_get("Test Data"),
+            async_op.user_get("Example User"),
+            async_op.group_get("Team Members"),
+            async_op.user_list(),
+            async_op.group_list(),
+            async_op.item_list(vault="Test Data"))
+
+    vault, user, group, user_list, group_list, item_list = asyncio.run(
+        _gather())
+    assert vault.unique_id == signed_in_op.vault_get("Test Data").unique_id
+    assert user.unique_id == signed_in_op.user_get("Example User").unique_id
+    assert group.unique_id == signed_in_op.group_get(
+        "Team Members").unique_id
+    assert len(user_list) == len(signed_in_op.user_list())
+    assert len(group_list) == len(signed_in_op.group_list())
+    expected_ids = [item.unique_id
+                    for item in signed_in_op.item_list(vault="Test Data")]
+    assert [item.unique_id for item in item_list] == expected_ids
+
+
+def test_async_op_vault_get_080(signed_in_op: OP):
+    """
+    Test:
+        - get an invalid vault via AsyncOP.vault_get()
+    Verify:
+        - OPVaultGetException is raised
+    """
+    async_op = AsyncOP(signed_in_op)
+    with pytest.raises(OPVaultGetException):
+        asyncio.run(async_op.vault_get("Invalid Vault"))
+
+
+@pytest.mark.usefixtures("setup_normal_op_env")
+def test_async_op_create_090():
+    """
+    Test:
+        - create and sign in via AsyncOP.create()
+    Verify:
+        - the wrapped OP object is signed in, and can be used to get an item
+    """
+    async def _create_and_get():
+        async_op = await AsyncOP.create(op_path="mock-op",
+                                        account=ACCOUNT_ID,
+                                        password=OP_MASTER_PASSWORD,
+                                        max_concurrency=4)
+        item = await async_op.item_get(ITEM_UUID)
+        return async_op, item
+
+    async_op, item = asyncio.run(_create_and_get())
+    assert async_op.max_concurrency == 4
+    assert isinstance(async_op.op, OP)
+    assert item.unique_id == ITEM_UUID
+
+
+def test_async_op_version_check_100(signed_in_op: OP, monkeypatch):
+    """
+    Test:
+        - get an item via AsyncOP.item_get()
+    Verify:
+        - the 'op' version check doesn't run on the event loop's thread,
+          since it may stat() 'op' and run 'op --version'
+    """
+    check_threads = []
+    check_op_version = signed_in_op._check_op_version
+
+    def _recording_check_op_version(op_path, **kwargs):
+        check_threads.append(threading.get_ident())
+        return check_op_version(op_path, **kwargs)
+
+    monkeypatch.setattr(signed_in_op, "_check_op_version",
+                        _recording_check_op_version)
+    async_op = AsyncOP(signed_in_op)
+
+    async def _item_get():
+        loop_thread = threading.get_ident()
+        item = await async_op.item_get(ITEM_UUID)
+        return loop_thread, item
+
+    loop_thread, item = asyncio.run(_item_get())
+    assert item.unique_id == ITEM_UUID
+    assert check_threads
+    assert loop_thread not in check_threads
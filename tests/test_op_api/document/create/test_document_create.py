@@ -0,0 +1,161 @@
+from __future__ import annotations
+
+import io
+import os
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from pyonepassword import OP
+
+    from ....fixtures.binary_input_data import BinaryImageData
+
+import pytest
+
+from pyonepassword.api.exceptions import OPDocumentCreateException
+
+pytestmark = pytest.mark.usefixtures("valid_op_cli_config_homedir")
+
+DOCUMENT_ID = "x3dbfsd4efqrkvsbq4qbtopwbq"
+TITLE = "Replacement Image 01"
+FILE_NAME = "replacement_image_01.png"
+
+
+def test_document_create_010(signed_in_op: OP, binary_image_data: BinaryImageData):
+    """
+    Test: OP.document_create() with the path to a file
+    Verify:
+        - The file name defaults to the name of the file
+        - The new document's ID is returned
+    """
+    input_data_path = binary_image_data.data_path_for_name(
+        "replacement-image-01")
+    document_id = signed_in_op.document_create(
+        input_data_path, title=TITLE, vault="Test Data")
+    assert document_id == DOCUMENT_ID
+
+
+def test_document_create_020(signed_in_op: OP, binary_image_data: BinaryImageData):
+    """
+    Test: OP.document_create() with the actual bytes of a file
+    Verify:
+        - The new document's ID is returned
+    """
+    input_data = binary_image_data.data_for_name("replacement-image-01")
+    document_id = signed_in_op.document_create(
+        input_data, file_name=FILE_NAME, title=TITLE, vault="Test Data")
+    assert document_id == DOCUMENT_ID
+
+
+def test_document_create_030(signed_in_op: OP, binary_image_data: BinaryImageData):
+    """
+    Test: OP.document_create() with a binary file-like object
+    Verify:
+        - The new document's ID is returned
+    """
+    input_data = binary_image_data.data_for_name("replacement-image-01")
+    document_id = signed_in_op.document_create(
+        io.BytesIO(input_data), file_name=FILE_NAME, title=TITLE, vault="Test Data")
+    assert document_id == DOCUMENT_ID
+
+
+def test_document_create_040(signed_in_op: OP, binary_image_data: BinaryImageData):
+    """
+    Test: OP.document_create() with an iterator of bytes chunks
+    Verify:
+        - The new document's ID is returned
+    """
+    input_data = binary_image_data.data_for_name("replacement-image-01")
+    chunks = (input_data[i:i + 4096] for i in range(0, len(input_data), 4096))
+    document_id = signed_in_op.document_create(
+        chunks, file_name=FILE_NAME, title=TITLE, vault="Test Data")
+    assert document_id == DOCUMENT_ID
+
+
+def test_document_create_050(signed_in_op: OP, binary_image_data: BinaryImageData):
+    """
+    Test: OP.document_create() with a vault that doesn't exist
+    Verify:
+        - OPDocumentCreateException is raised
+    """
+    input_data_path = binary_image_data.data_path_for_name(
+        "replacement-image-01")
+    with pytest.raises(OPDocumentCreateException):
+        signed_in_op.document_create(
+            input_data_path, title=TITLE, vault="Invalid Vault")
+
+
+class _RunRecorder:
+    """
+    Wrap an OP object's _run() method to record each command's argv & input
+    """
+
+    def __init__(self, op: OP, output=None):
+        self._run = op._run
+        self.output = output
+        self.calls = []
+
+    def __call__(self, argv, input=None, **kwargs):
+        self.calls.append((list(argv), input))
+        if self.output is not None:
+            # don't run 'op', just return canned output
+            return self.output
+        return self._run(argv, input=input, **kwargs)
+
+
+def test_document_create_060(signed_in_op: OP, binary_image_data: BinaryImageData, monkeypatch):
+    """
+    Test: OP.document_create() with the path to a file
+    Verify:
+        - The path is passed to 'op' as its file argument
+        - Nothing is sent to 'op' on stdin
+    """
+    input_data_path = binary_image_data.data_path_for_name(
+        "replacement-image-01")
+    recorder = _RunRecorder(signed_in_op)
+    monkeypatch.setattr(signed_in_op, "_run", recorder)
+    signed_in_op.document_create(
+        input_data_path, title=TITLE, vault="Test Data")
+
+    argv, input = recorder.calls[-1]
+    assert argv[argv.index("create") + 1] == str(input_data_path)
+    assert input is None
+
+
+def test_document_create_070(signed_in_op: OP, monkeypatch, tmp_path):
+    """
+    Test: OP.document_create() with a relative path beginning with '-'
+    Verify:
+        - The path passed to 'op' can't be mistaken for stdin or an option
+    """
+    # the path is relative to the working directory, which mock-op's
+    # responses aren't, so don't run 'op' at all, including to verify authentication
+    # we only care what's passed to 'op'
+    monkeypatch.chdir(tmp_path)
+    with open("-document.png", "wb") as f:
+        f.write(b"document")
+    recorder = _RunRecorder(
+        signed_in_op, output=f'{{"uuid": "{DOCUMENT_ID}"}}')
+    monkeypatch.setattr(signed_in_op, "_run", recorder)
+    monkeypatch.setattr(signed_in_op, "_auth_expired",
+                        lambda op_path, account, timeout=None: False)
+    signed_in_op.document_create(
+        "-document.png", title=TITLE, vault="Test Data")
+
+    argv, _ = recorder.calls[-1]
+    assert argv[argv.index("create") + 1] == os.path.join(".", "-document.png")
+
+
+@pytest.mark.parametrize("file_name", ["no-such-file.png", ""])
+def test_document_create_080(signed_in_op: OP, monkeypatch, tmp_path, file_name):
+    """
+    Test: OP.document_create() with a path that doesn't exist, and with a directory
+    Verify:
+        - FileNotFoundError is raised
+        - No 'op' commands are run
+    """
+    recorder = _RunRecorder(signed_in_op)
+    monkeypatch.setattr(signed_in_op, "_run", recorder)
+    with pytest.raises(FileNotFoundError):
+        signed_in_op.document_create(
+            tmp_path / file_name, title=TITLE, vault="Test Data")
+    assert recorder.calls == []
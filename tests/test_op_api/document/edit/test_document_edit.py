@@ -151,3 +151,58 @@ def test_document_edit_04(signed_in_op: OP, binary_image_data: BinaryImageData):
     document_item_2: OPDocumentItem = signed_in_op.item_get(
         item_name, vault=vault)
     assert document_item_2.file_name == new_file_name
+
+
+@pytest.mark.usefixtures("setup_stateful_document_edit")
+def test_document_edit_05(signed_in_op: OP, binary_image_data: BinaryImageData):
+    """
+    Test: OP.document_edit() with an open binary file object
+        - Retrieve document bytes and filename via OP.document_get()
+        - Call document_edit(), providing an open file object for the replacement file
+        - Retreive the same item a second time
+    Verify:
+        - The edited document's digest matches the digest of the replacement document bytes
+    """
+    item_name = "example document 01"
+    vault = "Test Data 2"
+    input_data_path = binary_image_data.data_path_for_name(
+        "replacement-image-01")
+    input_data = binary_image_data.data_for_name("replacement-image-01")
+    input_data_digest = digest(input_data)
+
+    _, data_1 = signed_in_op.document_get(item_name, vault=vault)
+    assert digest(data_1) != input_data_digest
+
+    with open(input_data_path, "rb") as input_file:
+        signed_in_op.document_edit(item_name, input_file, vault=vault)
+
+    _, data_2 = signed_in_op.document_get(item_name, vault=vault)
+    assert digest(data_2) == input_data_digest
+
+
+@pytest.mark.usefixtures("setup_stateful_document_edit")
+def test_document_edit_06(signed_in_op: OP, binary_image_data: BinaryImageData):
+    """
+    Test: OP.document_edit() with an iterator of small bytes chunks
+        - Retrieve document bytes and filename via OP.document_get()
+        - Call document_edit(), providing a generator that yields the replacement file in chunks
+        - Retreive the same item a second time
+    Verify:
+        - The edited document's digest matches the digest of the replacement document bytes
+    """
+    item_name = "example document 01"
+    vault = "Test Data 2"
+    input_data = binary_image_data.data_for_name("replacement-image-01")
+    input_data_digest = digest(input_data)
+
+    def _chunks(chunk_size=1000):
+        for offset in range(0, len(input_data), chunk_size):
+            yield input_data[offset:offset + chunk_size]
+
+    _, data_1 = signed_in_op.document_get(item_name, vault=vault)
+    assert digest(data_1) != input_data_digest
+
+    signed_in_op.document_edit(item_name, _chunks(), vault=vault)
+
+    _, data_2 = signed_in_op.document_get(item_name, vault=vault)
+    assert digest(data_2) == input_data_digest
@@ -19,3 +19,23 @@ def test_document_edit_invalid_document_01(signed_in_op: OP,
         "replacement-image-01")
     with pytest.raises(OPDocumentEditException):
         signed_in_op.document_edit(document_name, input_data_path)
+
+
+@pytest.mark.usefixtures("valid_op_cli_config_homedir")
+def test_document_edit_missing_file_01(signed_in_op: OP, monkeypatch, tmp_path):
+    """
+    Test: OP.document_edit() with a path that doesn't exist
+    Verify:
+        - FileNotFoundError is raised
+        - No 'op' commands are run, including looking up the document
+    """
+    commands = []
+
+    def _run(argv, **kwargs):
+        commands.append(argv)
+
+    monkeypatch.setattr(signed_in_op, "_run", _run)
+    with pytest.raises(FileNotFoundError):
+        signed_in_op.document_edit("example document 01",
+                                   tmp_path / "no-such-file.png")
+    assert commands == []
@@ -0,0 +1,140 @@
+from __future__ import annotations
+
+import copy
+from pathlib import Path
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from pyonepassword import OP
+
+import pytest
+
+from pyonepassword.api.exceptions import (
+    OPDocumentGetException,
+    OPInvalidDocumentException
+)
+
+from ....test_support.util import digest
+
+pytestmark = pytest.mark.usefixtures("valid_op_cli_config_homedir")
+
+DOCUMENT_NAME = "Example Login 2 - 1200px-SpongeBob_SquarePants_character.svg.png.webp"
+VAULT = "Test Data"
+
+
+class _OutFileWriter:
+    """
+    Wrap an OP object's _run() method to simulate 'op document get --out-file'
+
+    mock-op can't write files, so run the command without '--out-file' and '--force'
+    and write the captured output to the requested path
+    """
+
+    def __init__(self, op: OP):
+        self._run = op._run
+        self.argvs = []
+
+    def __call__(self, argv, capture_stdout=False, **kwargs):
+        self.argvs.append(list(argv))
+        if "--out-file" not in argv:
+            return self._run(argv, capture_stdout=capture_stdout, **kwargs)
+        stdout_argv = copy.copy(argv)
+        idx = stdout_argv.index("--out-file")
+        out_file = stdout_argv[idx + 1]
+        del stdout_argv[idx:idx + 2]
+        stdout_argv.remove("--force")
+        output = self._run(stdout_argv, capture_stdout=True, **kwargs)
+        Path(out_file).write_bytes(output)
+        return None
+
+
+@pytest.fixture
+def out_file_op(signed_in_op: OP, monkeypatch):
+    writer = _OutFileWriter(signed_in_op)
+    monkeypatch.setattr(signed_in_op, "_run", writer)
+    return signed_in_op, writer
+
+
+def test_document_get_to_path_010(out_file_op, expected_document_data, tmp_path):
+    """
+    Test:
+        - save a document to a file path via document_get_to_path()
+    Verify:
+        - 'op document get' is run with '--out-file <path>'
+        - the filename isn't looked up separately
+        - the saved file matches the expected document
+    """
+    op, writer = out_file_op
+    expected = expected_document_data.data_for_document(DOCUMENT_NAME)
+    dest = Path(tmp_path, "document.webp")
+
+    result = op.document_get_to_path(DOCUMENT_NAME, dest, vault=VAULT)
+
+    assert result == dest
+    data = dest.read_bytes()
+    assert len(data) == expected.size
+    assert digest(data) == expected.digest
+    document_argvs = [argv for argv in writer.argvs if "document" in argv]
+    assert len(document_argvs) == 1
+    assert ["--out-file", str(dest)] == document_argvs[0][-3:-1]
+    assert not [argv for argv in writer.argvs if "item" in argv]
+
+
+def test_document_get_to_path_020(out_file_op, expected_document_data, tmp_path):
+    """
+    Test:
+        - save a document to a directory via document_get_to_path()
+    Verify:
+        - the document is saved in the directory using the document's filename
+    """
+    op, _ = out_file_op
+    expected = expected_document_data.data_for_document(DOCUMENT_NAME)
+
+    result = op.document_get_to_path(DOCUMENT_NAME, tmp_path, vault=VAULT)
+
+    assert result == Path(tmp_path, expected.filename)
+    assert digest(result.read_bytes()) == expected.digest
+
+
+def test_document_get_to_path_030(out_file_op, tmp_path):
+    """
+    Test:
+        - save a document to a path that already exists, without and with overwrite=True
+    Verify:
+        - FileExistsError is raised without overwrite=True, and the file is untouched
+        - the file is replaced with overwrite=True
+    """
+    op, _ = out_file_op
+    dest = Path(tmp_path, "document.webp")
+    dest.write_bytes(b"existing")
+
+    with pytest.raises(FileExistsError):
+        op.document_get_to_path(DOCUMENT_NAME, dest, vault=VAULT)
+    assert dest.read_bytes() == b"existing"
+
+    op.document_get_to_path(DOCUMENT_NAME, dest, vault=VAULT, overwrite=True)
+    assert dest.read_bytes() != b"existing"
+
+
+def test_document_get_to_path_040(out_file_op, tmp_path):
+    """
+    Test:
+        - save a non-document item to a directory via document_get_to_path()
+    Verify:
+        - OPInvalidDocumentException is raised
+    """
+    op, _ = out_file_op
+    with pytest.raises(OPInvalidDocumentException):
+        op.document_get_to_path("Not A Document", tmp_path)
+
+
+def test_document_get_to_path_050(signed_in_op: OP, tmp_path):
+    """
+    Test:
+        - save an invalid document via document_get_to_path()
+    Verify:
+        - OPDocumentGetException is raised
+    """
+    with pytest.raises(OPDocumentGetException):
+        signed_in_op.document_get_to_path("Invalid Document", tmp_path)
+    assert not list(tmp_path.iterdir())
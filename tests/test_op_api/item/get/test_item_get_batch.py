@@ -0,0 +1,72 @@
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+import pytest
+
+if TYPE_CHECKING:
+    from pyonepassword import OP
+
+from pyonepassword.api.exceptions import OPItemGetException
+from pyonepassword.api.object_types import OPItemList, OPLoginItem
+
+# ensure HOME env variable is set, and there's a valid op config present
+pytestmark = pytest.mark.usefixtures("valid_op_cli_config_homedir")
+
+VAULT = "Test Data"
+ITEM_TITLES = ["Example Login 1", "Example Login 2"]
+
+
+def _item_list(op: OP, titles):
+    item_list = op.item_list(vault=VAULT)
+    return OPItemList([item for item in item_list if item.title in titles])
+
+
+@pytest.mark.parametrize("batch_size", [25, 1])
+def test_item_get_batch_010(signed_in_op: OP, batch_size):
+    """
+    Test:
+        - get full items for a list of item descriptors via item_get_batch()
+        - do so in a single batch, and in one batch per item
+    Verify:
+        - one item is returned for each descriptor, in the same order
+        - each item matches the item returned by item_get()
+    """
+    item_list = _item_list(signed_in_op, ITEM_TITLES)
+    items = signed_in_op.item_get_batch(
+        item_list, vault=VAULT, batch_size=batch_size)
+
+    assert len(items) == len(item_list)
+    for descriptor, item in zip(item_list, items):
+        expected: OPLoginItem = signed_in_op.item_get(
+            descriptor.title, vault=VAULT)
+        assert isinstance(item, OPLoginItem)
+        assert item.unique_id == descriptor.unique_id
+        assert item.username == expected.username
+        assert item.password == expected.password
+
+
+def test_item_get_batch_020(signed_in_op: OP):
+    """
+    Test:
+        - call item_get_batch() with a descriptor for an item that no longer exists
+    Verify:
+        - OPItemGetException is raised
+    """
+    item_list = _item_list(signed_in_op, ["Example Login 1"])
+    deleted_item = dict(item_list[0])
+    deleted_item["id"] = "ykrpydsu3jf6oytkgoulcdwaqe"
+    deleted_item["title"] = "Deleted Login"
+    with pytest.raises(OPItemGetException):
+        signed_in_op.item_get_batch(OPItemList([deleted_item]), vault=VAULT)
+
+
+def test_item_get_batch_030(signed_in_op: OP):
+    """
+    Test:
+        - call item_get_batch() with an empty item list
+    Verify:
+        - an empty list is returned
+    """
+    items = signed_in_op.item_get_batch(OPItemList([]), vault=VAULT)
+    assert items == []
@@ -0,0 +1,62 @@
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+import pytest
+
+if TYPE_CHECKING:
+    from pyonepassword import OP
+
+from pyonepassword.api.exceptions import OPItemGetException
+from pyonepassword.api.object_types import OPLoginItem
+
+# ensure HOME env variable is set, and there's a valid op config present
+pytestmark = pytest.mark.usefixtures("valid_op_cli_config_homedir")
+
+
+def test_item_get_many_010(signed_in_op: OP, expected_login_item_data):
+    """
+    Test:
+        - get several items via item_get_many(), including one that doesn't exist
+    Verify:
+        - results are returned in the same order as the identifiers
+        - the failed lookup's OPItemGetException is returned in its place
+        - the remaining items are retrieved successfully
+    """
+    item_uuid = "nok7367v4vbsfgg2fczwu4ei44"
+    identifiers = [item_uuid, "Invalid Item", item_uuid]
+    expected = expected_login_item_data.data_for_login(item_uuid)
+
+    results = signed_in_op.item_get_many(identifiers, max_workers=2)
+
+    assert len(results) == len(identifiers)
+    assert isinstance(results[1], OPItemGetException)
+    for result in (results[0], results[2]):
+        assert isinstance(result, OPLoginItem)
+        assert result.unique_id == item_uuid
+        assert result.username == expected.username
+
+
+def test_item_get_many_020(signed_in_op: OP):
+    """
+    Test:
+        - get an item via item_get_many(), passing an item descriptor rather than an identifier
+    Verify:
+        - the descriptor's unique ID is used to look up the item
+    """
+    item_uuid = "nok7367v4vbsfgg2fczwu4ei44"
+    descriptor = signed_in_op.item_get(item_uuid)
+    results = signed_in_op.item_get_many([descriptor])
+    assert len(results) == 1
+    assert results[0].unique_id == descriptor.unique_id
+
+
+def test_item_get_many_030(signed_in_op: OP):
+    """
+    Test:
+        - call item_get_many() with no identifiers
+    Verify:
+        - an empty list is returned
+    """
+    results = signed_in_op.item_get_many([])
+    assert results == []
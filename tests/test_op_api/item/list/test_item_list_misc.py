@@ -29,3 +29,23 @@ def test_item_list_serialize_02(signed_in_op: OP):
     items_copy = OPItemList(json.loads(items_json))
     for item in items_copy:
         assert item.unique_id in item_ids
+
+
+def test_item_list_serialize_03(signed_in_op: OP):
+    """
+    Test:
+      - Create an OPItemList from serialized JSON, and another from a list
+        of dictionaries
+    Verify:
+      - Both lists are identical, and in the same order
+      - The list of dictionaries isn't modified
+    """
+    items: OPItemList = signed_in_op.item_list(vault="Test Data")
+    items_json = items.serialize()
+    item_dicts = json.loads(items_json)
+
+    items_from_json = OPItemList(items_json)
+    items_from_dicts = OPItemList(item_dicts)
+    assert items_from_json == items_from_dicts
+    assert len(item_dicts) == len(items)
+    assert all(type(item_dict) is dict for item_dict in item_dicts)
@@ -0,0 +1,160 @@
+"""
+Tests for observing 'op' command invocations via OPCommandObserver
+"""
+from __future__ import annotations
+
+import pytest
+
+from pyonepassword import OP
+from pyonepassword.api.authentication import AUTH_VERIFY_ALWAYS
+from pyonepassword.api.exceptions import OPItemGetException
+from pyonepassword.api.observer import OPCommandObserver, OPCommandRecord
+
+pytestmark = pytest.mark.usefixtures("valid_op_cli_config_homedir")
+
+ACCOUNT_ID = "5GHHPJK5HZC5BAT7WDUXW57G44"
+OP_MASTER_PASSWORD = "made-up-password"
+ITEM_NAME = "Example Login 1"
+VAULT = "Test Data"
+
+
+class _RecordingObserver(OPCommandObserver):
+
+    def __init__(self):
+        self.records = []
+
+    def command_finished(self, record: OPCommandRecord):
+        self.records.append(record)
+
+
+class _BrokenObserver(OPCommandObserver):
+
+    def command_finished(self, record: OPCommandRecord):
+        raise RuntimeError("broken observer")
+
+
+@pytest.fixture
+def recording_observer():
+    observer = _RecordingObserver()
+    OP.add_command_observer(observer)
+    yield observer
+    OP.remove_command_observer(observer)
+
+
+@pytest.mark.usefixtures("setup_normal_op_env")
+def test_op_cli_observer_010(recording_observer: _RecordingObserver):
+    """
+    Test:
+      - Register an observer
+      - Create an OP object with AUTH_VERIFY_ALWAYS and look up an item
+    Verify:
+      - The 'op --version' check is recorded as a version check
+      - The 'op whoami' before 'op item get' is recorded as an auth preflight
+      - 'op item get' is recorded with its command, subcommands, exit status, and output size
+    """
+    op = OP(op_path="mock-op",
+            account=ACCOUNT_ID,
+            password=OP_MASTER_PASSWORD,
+            auth_verify_policy=AUTH_VERIFY_ALWAYS)
+    assert any(r.version_check for r in recording_observer.records)
+    recording_observer.records.clear()
+
+    op.item_get(ITEM_NAME, vault=VAULT)
+    preflight, item_get = recording_observer.records[-2:]
+    assert preflight.command == "whoami"
+    assert preflight.auth_preflight
+    assert not preflight.version_check
+
+    assert item_get.command == "item"
+    assert item_get.subcommands == ["get"]
+    assert item_get.returncode == 0
+    assert item_get.stdout_bytes > 0
+    assert item_get.wall_time >= 0
+    assert not item_get.auth_preflight
+    assert not item_get.version_check
+
+
+@pytest.mark.usefixtures("setup_normal_op_env")
+def test_op_cli_observer_020(signed_in_op: OP, recording_observer: _RecordingObserver):
+    """
+    Test:
+      - Register an observer
+      - Look up an invalid item
+    Verify:
+      - The failed command is recorded with its non-zero exit status and error output size
+    """
+    with pytest.raises(OPItemGetException):
+        signed_in_op.item_get("Invalid Item")
+    record = recording_observer.records[-1]
+    assert record.returncode != 0
+    assert record.stderr_bytes > 0
+
+
+@pytest.mark.usefixtures("setup_normal_op_env")
+def test_op_cli_observer_030(signed_in_op: OP, recording_observer: _RecordingObserver):
+    """
+    Test:
+      - Register an observer
+      - Look up an item by name
+    Verify:
+      - The recorded command line is redacted when converted to a string
+      - The unredacted command line is still available
+    """
+    signed_in_op.item_get(ITEM_NAME, vault=VAULT)
+    record = recording_observer.records[-1]
+    assert ITEM_NAME not in str(record.cmdline)
+    assert ITEM_NAME in record.cmdline
+
+
+@pytest.mark.usefixtures("setup_normal_op_env")
+def test_op_cli_observer_040(signed_in_op: OP):
+    """
+    Test:
+      - Register an observer that raises an exception
+      - Look up an item
+    Verify:
+      - The item lookup succeeds regardless
+    """
+    observer = _BrokenObserver()
+    OP.add_command_observer(observer)
+    try:
+        item = signed_in_op.item_get(ITEM_NAME, vault=VAULT)
+    finally:
+        OP.remove_command_observer(observer)
+    assert item.title == ITEM_NAME
+
+
+@pytest.mark.usefixtures("setup_normal_op_env")
+def test_op_cli_observer_050(signed_in_op: OP):
+    """
+    Test:
+      - Register and then unregister an observer
+      - Look up an item
+    Verify:
+      - The observer isn't notified
+    """
+    observer = _RecordingObserver()
+    OP.add_command_observer(observer)
+    OP.remove_command_observer(observer)
+    signed_in_op.item_get(ITEM_NAME, vault=VAULT)
+    assert observer.records == []
+
+
+@pytest.mark.usefixtures("setup_normal_op_env")
+def test_op_cli_observer_060(recording_observer: _RecordingObserver):
+    """
+    Test:
+      - Register an observer
+      - Create an OP object, signing in with a password
+    Verify:
+      - Exactly four 'op' commands are run, each only once:
+        'op --version', 'op account list', 'op signin', and 'op whoami'
+    """
+    OP(op_path="mock-op",
+       account=ACCOUNT_ID,
+       password=OP_MASTER_PASSWORD)
+    records = recording_observer.records
+    assert len(records) == 4
+    assert records[0].version_check
+    commands = [(r.command, r.subcommands) for r in records[1:]]
+    assert commands == [("account", ["list"]), ("signin", []), ("whoami", [])]
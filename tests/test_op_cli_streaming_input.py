@@ -0,0 +1,60 @@
+"""
+Tests for streaming input to 'op' a chunk at a time
+"""
+from __future__ import annotations
+
+import sys
+
+import pytest
+
+from pyonepassword._op_cli import _OPCLIExecute
+from pyonepassword._op_cli_argv import _OPArgv
+
+# a stand-in for an 'op' command that reads all of its input, then acts on it
+# the input's length is written to a file, since output is lost if the command
+# gets killed
+READ_INPUT_SCRIPT = (
+    "import sys; "
+    "data = sys.stdin.buffer.read(); "
+    "open({done_file!r}, 'w').write(str(len(data)))"
+)
+
+
+def _python_argv(script):
+    argv = _OPArgv(sys.executable, None, ["-c", script])
+    return argv
+
+
+def _failing_chunks():
+    yield b"partial input"
+    raise OSError("input went away")
+
+
+def test_op_cli_streaming_input_010(tmp_path):
+    """
+    Test:
+      - Stream input to a command, from an iterable of chunks
+    Verify:
+      - The command reads all of the input
+    """
+    done_file = tmp_path / "done"
+    argv = _python_argv(READ_INPUT_SCRIPT.format(done_file=str(done_file)))
+    chunks = [b"x" * 100_000, "some text", b"", b"more"]
+    _OPCLIExecute._run(argv, input=iter(chunks))
+    assert done_file.read_text() == str(100_000 + len("some text") + len("more"))
+
+
+@pytest.mark.parametrize("timeout", [None, 10.0])
+def test_op_cli_streaming_input_020(tmp_path, timeout):
+    """
+    Test:
+      - Stream input to a command, from an iterable that raises partway through
+    Verify:
+      - The iterable's exception is raised
+      - The command is killed rather than acting on truncated input
+    """
+    done_file = tmp_path / "done"
+    argv = _python_argv(READ_INPUT_SCRIPT.format(done_file=str(done_file)))
+    with pytest.raises(OSError, match="input went away"):
+        _OPCLIExecute._run(argv, input=_failing_chunks(), timeout=timeout)
+    assert not done_file.exists()
@@ -0,0 +1,114 @@
+"""
+Tests for reading 'op' output as it's written, rather than once 'op' has finished
+"""
+from __future__ import annotations
+
+import sys
+from pathlib import Path
+
+import pytest
+
+from pyonepassword._op_cli import _OPCLIExecute
+from pyonepassword._op_cli_argv import _OPArgv
+from pyonepassword.api.exceptions import OPCmdFailedException
+from pyonepassword.api.observer import OPCommandObserver, OPCommandRecord
+from pyonepassword.json import unjson_stream
+
+# a stand-in for an 'op' command that writes one document, then waits for the
+# reader to create a file before writing another
+# if the reader waited for all output first, the command would never finish
+WAIT_FOR_READER_SCRIPT = """
+import os, time
+print('{{"a": 1}}', flush=True)
+deadline = time.monotonic() + 10
+while not os.path.exists({flag_file!r}) and time.monotonic() < deadline:
+    time.sleep(0.01)
+print('{{"b": 2}}' if os.path.exists({flag_file!r}) else '{{"timed out": true}}')
+"""
+
+# a stand-in for an 'op' command that fails partway through its output
+FAIL_PARTWAY_SCRIPT = (
+    "import sys; "
+    "sys.stdout.write('{\"a\": 1}\\n{\"b\": '); "
+    "sys.stderr.write('[ERROR] something went wrong\\n'); "
+    "sys.exit(1)"
+)
+
+
+class _RecordingObserver(OPCommandObserver):
+
+    def __init__(self):
+        self.records = []
+
+    def command_finished(self, record: OPCommandRecord):
+        self.records.append(record)
+
+
+def _python_argv(script):
+    argv = _OPArgv(sys.executable, None, ["-c", script])
+    return argv
+
+
+def test_op_cli_streaming_output_010(tmp_path):
+    """
+    Test:
+      - Run a command that waits for its first document to be read before
+        writing the second one, consuming its output as it's written
+    Verify:
+      - Both documents are read
+      - The consumer's return value is the command's output
+    """
+    flag_file = Path(tmp_path, "flag")
+
+    def _consume(stdout):
+        documents = []
+        for document in unjson_stream(stdout):
+            documents.append(document)
+            flag_file.touch()
+        return documents
+
+    argv = _python_argv(
+        WAIT_FOR_READER_SCRIPT.format(flag_file=str(flag_file)))
+    output = _OPCLIExecute._run(argv, capture_stdout=True,
+                                stdout_consumer=_consume, timeout=30.0)
+    assert output == [{"a": 1}, {"b": 2}]
+
+
+@pytest.mark.parametrize("input", [None, '{"id": "abc"}'])
+def test_op_cli_streaming_output_020(input):
+    """
+    Test:
+      - Run a command that fails partway through its output, consuming its output
+        as it's written
+    Verify:
+      - OPCmdFailedException is raised with the command's error output, rather than
+        the consumer's exception for the incomplete output
+    """
+    def _consume(stdout):
+        return list(unjson_stream(stdout))
+
+    argv = _python_argv(FAIL_PARTWAY_SCRIPT)
+    with pytest.raises(OPCmdFailedException) as exc_info:
+        _OPCLIExecute._run(argv, capture_stdout=True,
+                           input=input, stdout_consumer=_consume)
+    assert "something went wrong" in exc_info.value.err_output
+
+
+def test_op_cli_streaming_output_030():
+    """
+    Test:
+      - Register a command observer
+      - Run a command, consuming its output as it's written
+    Verify:
+      - The observer is told how many bytes the command wrote to stdout
+    """
+    observer = _RecordingObserver()
+    _OPCLIExecute.add_command_observer(observer)
+    try:
+        argv = _python_argv("print('x' * 100000)")
+        output = _OPCLIExecute._run(argv, capture_stdout=True,
+                                    stdout_consumer=lambda stdout: stdout.read(10))
+    finally:
+        _OPCLIExecute.remove_command_observer(observer)
+    assert len(output) <= 10
+    assert observer.records[0].stdout_bytes == 100001
@@ -0,0 +1,323 @@
+"""
+Tests for 'op' command timeouts, including:
+- killing an 'op' process, and processes it started, once its timeout expires
+- retrying read-only commands that time out
+"""
+from __future__ import annotations
+
+import os
+import subprocess
+import sys
+import time
+
+import pytest
+
+from pyonepassword import OP
+from pyonepassword._op_cli import _OPCLIExecute, _ProcessWatchdog
+from pyonepassword._op_cli_argv import _OPArgv
+from pyonepassword.api.exceptions import OPCommandTimeoutException
+
+pytestmark = pytest.mark.usefixtures("valid_op_cli_config_homedir")
+
+ACCOUNT_ID = "5GHHPJK5HZC5BAT7WDUXW57G44"
+OP_MASTER_PASSWORD = "made-up-password"
+ITEM_NAME = "Example Login 1"
+VAULT = "Test Data"
+
+# a stand-in for an 'op' command that hangs, e.g., waiting on a biometric prompt
+HANG_SCRIPT = "import sys, time; sys.stdin.read(); time.sleep(30)"
+
+# a stand-in for an 'op' command that starts another process, then hangs
+# the other process's PID is written to a file, since output is lost
+# when the command gets killed
+HANG_WITH_CHILD_SCRIPT = (
+    "import subprocess, sys, time; "
+    "child = subprocess.Popen([sys.executable, '-c', 'import time; time.sleep(30)']); "
+    "open({pid_file!r}, 'w').write(str(child.pid)); "
+    "time.sleep(30)"
+)
+
+
+def _python_argv(script):
+    argv = _OPArgv(sys.executable, None, ["-c", script])
+    return argv
+
+
+def _pid_exists(pid):
+    try:
+        os.kill(pid, 0)
+    except ProcessLookupError:
+        return False
+    return True
+
+
+class _TimesOut:
+    """
+    Wrap an OP object's _run() method so the first 'op' commands time out
+    """
+
+    def __init__(self, op: OP, failures=1, subcommand=None):
+        self._run = op._run
+        self.failures = failures
+        self.subcommand = subcommand
+        self.count = 0
+        self.timeouts = []
+
+    def __call__(self, argv, timeout=None, **kwargs):
+        if self.subcommand and argv.subcommands[-1] != self.subcommand:
+            return self._run(argv, timeout=timeout, **kwargs)
+        self.count += 1
+        self.timeouts.append(timeout)
+        if self.count <= self.failures:
+            raise OPCommandTimeoutException(argv, timeout)
+        return self._run(argv, timeout=timeout, **kwargs)
+
+
+class _RecordsTimeouts:
+    """
+    Replace OP._run(), which is a classmethod, to record each command's timeout,
+    including commands run by other classmethods, such as 'op whoami'
+    """
+
+    def __init__(self):
+        self.timeouts = []
+
+    def install(self, monkeypatch):
+        _run = OP._run
+        recorder = self
+
+        def _recording_run(cls, argv, timeout=None, **kwargs):
+            recorder.timeouts.append((list(argv), timeout))
+            return _run(argv, timeout=timeout, **kwargs)
+
+        monkeypatch.setattr(OP, "_run", classmethod(_recording_run))
+
+    def timeouts_for(self, arg):
+        timeouts = [timeout for argv, timeout in self.timeouts if arg in argv]
+        return timeouts
+
+
+def _op_with_timeout(timeout=5.0, timeout_retries=0):
+    op = OP(op_path="mock-op",
+            account=ACCOUNT_ID,
+            password=OP_MASTER_PASSWORD,
+            timeout=timeout,
+            timeout_retries=timeout_retries)
+    return op
+
+
+def test_op_cli_timeout_010():
+    """
+    Test:
+      - Run a command that hangs, with a short timeout
+    Verify:
+      - OPCommandTimeoutException is raised
+      - The exception reports the timeout and command
+      - The timeout expires promptly
+    """
+    argv = _python_argv(HANG_SCRIPT)
+    start = time.monotonic()
+    with pytest.raises(OPCommandTimeoutException) as exc_info:
+        _OPCLIExecute._run(argv, capture_stdout=True, timeout=0.5)
+    assert time.monotonic() - start < 10
+    assert exc_info.value.timeout == 0.5
+    assert exc_info.value.argv == list(argv)
+
+
+def test_op_cli_timeout_020():
+    """
+    Test:
+      - Run a command that hangs while streaming it input, with a short timeout
+    Verify:
+      - OPCommandTimeoutException is raised
+    """
+    argv = _python_argv(HANG_SCRIPT)
+    chunks = iter([b"some input"])
+    with pytest.raises(OPCommandTimeoutException):
+        _OPCLIExecute._run(argv, input=chunks, timeout=0.5)
+
+
+@pytest.mark.skipif(os.name != "posix", reason="process groups are POSIX-only")
+def test_op_cli_timeout_030(tmp_path):
+    """
+    Test:
+      - Run a command that starts another process and then hangs, with a short timeout
+    Verify:
+      - The other process is also killed
+    """
+    pid_file = tmp_path / "child.pid"
+    script = HANG_WITH_CHILD_SCRIPT.format(pid_file=str(pid_file))
+    argv = _python_argv(script)
+    with pytest.raises(OPCommandTimeoutException):
+        _OPCLIExecute._run(argv, timeout=1.0)
+    child_pid = int(pid_file.read_text())
+    # give the child a moment to be reaped
+    deadline = time.monotonic() + 5
+    while _pid_exists(child_pid) and time.monotonic() < deadline:
+        time.sleep(0.05)
+    assert not _pid_exists(child_pid)
+
+
+def test_op_cli_timeout_040():
+    """
+    Test:
+      - Run a command that finishes well within its timeout
+    Verify:
+      - Its output is returned normally
+    """
+    argv = _python_argv("print('hello')")
+    output = _OPCLIExecute._run(
+        argv, capture_stdout=True, decode="utf-8", timeout=10.0)
+    assert output.strip() == "hello"
+
+
+@pytest.mark.skipif(not hasattr(os, "waitid"), reason="requires os.waitid()")
+def test_op_cli_timeout_050():
+    """
+    Test:
+      - Start a process with a watchdog, and let the process exit
+      - Let the watchdog's timeout expire before the process is waited on
+    Verify:
+      - The process isn't killed
+      - The process isn't reported as timed out
+    """
+    killed = []
+    with subprocess.Popen([sys.executable, "-c", "pass"]) as proc:
+        watchdog = _ProcessWatchdog(proc, None, killed.append)
+        # wait for the process to exit, but leave it for the watchdog to reap
+        os.waitid(os.P_PID, proc.pid, os.WEXITED | os.WNOWAIT)
+        watchdog._on_timeout()
+        returncode = watchdog.wait()
+    assert killed == []
+    assert returncode == 0
+    assert not watchdog.timed_out(returncode)
+
+
+def test_op_cli_timeout_060():
+    """
+    Test:
+      - Start a process with a watchdog, and wait for the process to exit
+      - Let the watchdog's timeout expire afterward
+    Verify:
+      - The process isn't killed
+      - The process isn't reported as timed out
+    """
+    killed = []
+    with subprocess.Popen([sys.executable, "-c", "pass"]) as proc:
+        watchdog = _ProcessWatchdog(proc, None, killed.append)
+        returncode = watchdog.wait()
+        watchdog._on_timeout()
+    assert killed == []
+    assert not watchdog.timed_out(returncode)
+
+
+@pytest.mark.usefixtures("setup_normal_op_env")
+def test_op_timeout_retry_010(monkeypatch):
+    """
+    Test:
+      - Create an OP object with a timeout and one timeout retry
+      - Simulate 'op item get' timing out once
+    Verify:
+      - The command is retried, and succeeds
+      - The OP object's timeout is applied to each attempt
+    """
+    op = _op_with_timeout(timeout=5.0, timeout_retries=1)
+    times_out = _TimesOut(op)
+    monkeypatch.setattr(op, "_run", times_out)
+    item = op.item_get(ITEM_NAME, vault=VAULT)
+    assert item.title == ITEM_NAME
+    assert times_out.count == 2
+    assert times_out.timeouts == [5.0, 5.0]
+
+
+@pytest.mark.usefixtures("setup_normal_op_env")
+def test_op_timeout_retry_020(monkeypatch):
+    """
+    Test:
+      - Create an OP object with a timeout and one timeout retry
+      - Simulate 'op item list' timing out repeatedly
+    Verify:
+      - The command is retried only once
+      - OPCommandTimeoutException is raised
+    """
+    op = _op_with_timeout(timeout=5.0, timeout_retries=1)
+    times_out = _TimesOut(op, failures=3)
+    monkeypatch.setattr(op, "_run", times_out)
+    with pytest.raises(OPCommandTimeoutException):
+        op.item_list(vault=VAULT)
+    assert times_out.count == 2
+
+
+@pytest.mark.usefixtures("setup_normal_op_env")
+def test_op_timeout_retry_030(monkeypatch):
+    """
+    Test:
+      - Create an OP object with a timeout and one timeout retry
+      - Simulate 'op item delete' timing out
+    Verify:
+      - The command is not retried, since it isn't read-only
+      - OPCommandTimeoutException is raised
+    """
+    op = _op_with_timeout(timeout=5.0, timeout_retries=1)
+    times_out = _TimesOut(op, subcommand="delete")
+    monkeypatch.setattr(op, "_run", times_out)
+    with pytest.raises(OPCommandTimeoutException):
+        op.item_delete("Delete Me Unique", vault=VAULT)
+    assert times_out.count == 1
+
+
+@pytest.mark.usefixtures("setup_normal_op_env")
+def test_op_timeout_retry_040(monkeypatch):
+    """
+    Test:
+      - Create an OP object with a timeout
+      - Call item_get() with a different timeout
+    Verify:
+      - The per-call timeout is applied rather than the OP object's timeout
+    """
+    op = _op_with_timeout(timeout=5.0)
+    times_out = _TimesOut(op, failures=0)
+    monkeypatch.setattr(op, "_run", times_out)
+    op.item_get(ITEM_NAME, vault=VAULT, timeout=1.5)
+    assert times_out.timeouts == [1.5]
+
+
+@pytest.mark.usefixtures("setup_normal_op_env")
+def test_op_timeout_retry_050(monkeypatch):
+    """
+    Test:
+      - Create an OP object with a timeout, that verifies authentication before every command
+      - Forget which 'op' executables have had their versions checked
+      - Call item_get() with a different timeout
+    Verify:
+      - The per-call timeout is applied to 'op --version', 'op whoami', and 'op item get'
+    """
+    op = _op_with_timeout(timeout=5.0)
+    monkeypatch.setattr(OP, "_op_paths_checked", set())
+    monkeypatch.setattr(OP, "_op_path_cache", {})
+    recorder = _RecordsTimeouts()
+    recorder.install(monkeypatch)
+    op.item_get(ITEM_NAME, vault=VAULT, timeout=1.5)
+    assert recorder.timeouts_for("--version") == [1.5]
+    assert recorder.timeouts_for("whoami") == [1.5]
+    assert recorder.timeouts_for("get") == [1.5]
+
+
+@pytest.mark.usefixtures("setup_normal_op_env")
+def test_op_timeout_retry_060(monkeypatch):
+    """
+    Test:
+      - Create an OP object with a timeout
+      - Call item_get_many() with a different timeout
+    Verify:
+      - The per-call timeout is applied to each 'op item get' and 'op whoami'
+    """
+    op = _op_with_timeout(timeout=5.0)
+    recorder = _RecordsTimeouts()
+    recorder.install(monkeypatch)
+    items = op.item_get_many([ITEM_NAME, "Example Login 2"],
+                             vault=VAULT,
+                             timeout=1.5)
+    assert [item.title for item in items] == [ITEM_NAME, "Example Login 2"]
+    assert recorder.timeouts_for("get") == [1.5, 1.5]
+    assert recorder.timeouts_for("whoami") == [1.5, 1.5]
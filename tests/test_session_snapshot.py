@@ -0,0 +1,204 @@
+"""
+Tests for creating OP objects from session snapshots, without running 'op'
+"""
+from __future__ import annotations
+
+import json
+import logging
+import os
+import pickle
+
+import pytest
+
+from pyonepassword import OP
+from pyonepassword.api.authentication import (
+    AUTH_VERIFY_ALWAYS,
+    OPSessionSnapshot
+)
+from pyonepassword.api.exceptions import (
+    OPAuthenticationException,
+    OPNotFoundException
+)
+from pyonepassword.api.observer import OPCommandObserver, OPCommandRecord
+
+pytestmark = pytest.mark.usefixtures("valid_op_cli_config_homedir")
+
+OP_MASTER_PASSWORD = "made-up-password"
+ITEM_NAME = "Example Login 1"
+VAULT = "Test Data"
+
+
+class _RecordingObserver(OPCommandObserver):
+
+    def __init__(self):
+        self.records = []
+
+    def command_finished(self, record: OPCommandRecord):
+        self.records.append(record)
+
+
+@pytest.fixture
+def recording_observer():
+    observer = _RecordingObserver()
+    OP.add_command_observer(observer)
+    yield observer
+    OP.remove_command_observer(observer)
+
+
+@pytest.mark.usefixtures("setup_normal_op_env")
+def test_session_snapshot_010(signed_in_op: OP, recording_observer: _RecordingObserver):
+    """
+    Test:
+      - Take a snapshot of a signed-in OP object
+      - Reset class state, as if in a new process, and create an OP object from the snapshot
+      - Look up an item
+    Verify:
+      - No 'op' commands are run to create the new OP object
+      - Only 'op item get' is run to look up the item
+      - The new OP object has the same session state as the original
+    """
+    snapshot = signed_in_op.snapshot()
+    OP._reset_class()
+
+    op = OP.from_snapshot(snapshot)
+    assert recording_observer.records == []
+    assert op.session_var == signed_in_op.session_var
+    assert op.token == signed_in_op.token
+    assert str(op._cli_version) == str(signed_in_op._cli_version)
+    assert os.path.isabs(op.op_path)
+
+    item = op.item_get(ITEM_NAME, vault=VAULT)
+    assert item.title == ITEM_NAME
+    commands = [(r.command, r.subcommands) for r in recording_observer.records]
+    assert commands == [("item", ["get"])]
+
+
+@pytest.mark.usefixtures("setup_alt_op_env")
+def test_session_snapshot_020(monkeypatch):
+    """
+    Test:
+      - Sign in without biometric, and take a snapshot of the OP object
+      - Pickle the snapshot, and convert it to & from JSON
+      - Create OP objects from the snapshot with and without the session environment
+        variable set
+    Verify:
+      - The snapshot survives both round trips unchanged
+      - The snapshot doesn't contain the session token
+      - The session token is read from the environment, or set in it if provided
+    """
+    signed_in_op = OP(op_path="mock-op",
+                      account="example_shorthand",
+                      password=OP_MASTER_PASSWORD)
+    token = signed_in_op.token
+    session_var = signed_in_op.session_var
+    assert token
+
+    snapshot = signed_in_op.snapshot()
+    assert pickle.loads(pickle.dumps(snapshot)) == snapshot
+    snapshot_json = json.dumps(snapshot._asdict())
+    assert OPSessionSnapshot(**json.loads(snapshot_json)) == snapshot
+    assert token not in snapshot_json
+
+    op = OP.from_snapshot(snapshot)
+    assert op.session_var == session_var
+    assert op.token == token
+
+    monkeypatch.delenv(session_var)
+    op = OP.from_snapshot(snapshot, token=token)
+    assert op.token == token
+    assert os.environ[session_var] == token
+
+
+@pytest.mark.usefixtures("setup_normal_op_env")
+def test_session_snapshot_030(signed_in_op: OP, recording_observer: _RecordingObserver):
+    """
+    Test:
+      - Take a snapshot of a signed-in OP object, and alter the recorded modification
+        time of 'op', as if it has since been replaced
+      - Reset class state, and create an OP object from the snapshot
+    Verify:
+      - The version of 'op' is checked again, and only once
+    """
+    snapshot = signed_in_op.snapshot()
+    snapshot = snapshot._replace(op_mtime=snapshot.op_mtime - 10)
+    OP._reset_class()
+
+    OP.from_snapshot(snapshot)
+    assert len(recording_observer.records) == 1
+    assert recording_observer.records[0].version_check
+
+
+@pytest.mark.usefixtures("setup_normal_op_env")
+def test_session_snapshot_040(signed_in_op: OP, monkeypatch):
+    """
+    Test:
+      - Create an OP object from a snapshot, with the default authentication
+        verification policy
+      - Simulate expired authentication
+      - Look up an item, which fails
+    Verify:
+      - Authentication is verified only after the failure
+      - OPAuthenticationException is raised
+    """
+    op = OP.from_snapshot(signed_in_op.snapshot())
+    auth_checks = []
+
+    def _auth_expired(op_path, account, timeout=None):
+        auth_checks.append(account)
+        return True
+
+    monkeypatch.setattr(op, "_auth_expired", _auth_expired)
+    with pytest.raises(OPAuthenticationException):
+        op.item_get("Invalid Item")
+    assert len(auth_checks) == 1
+
+
+@pytest.mark.usefixtures("setup_normal_op_env")
+def test_session_snapshot_050(signed_in_op: OP, recording_observer: _RecordingObserver):
+    """
+    Test:
+      - Create an OP object from a snapshot with AUTH_VERIFY_ALWAYS and a different
+        default vault
+      - Look up an item
+    Verify:
+      - The default vault is overridden
+      - Authentication is verified before 'op item get'
+    """
+    op = OP.from_snapshot(signed_in_op.snapshot(),
+                          vault=VAULT,
+                          auth_verify_policy=AUTH_VERIFY_ALWAYS)
+    assert op.vault == VAULT
+    op.item_get(ITEM_NAME)
+    commands = [r.command for r in recording_observer.records]
+    assert commands == ["whoami", "item"]
+
+
+@pytest.mark.usefixtures("setup_normal_op_env")
+def test_session_snapshot_060(signed_in_op: OP, tmp_path):
+    """
+    Test:
+      - Create an OP object from a snapshot whose 'op' path doesn't exist
+    Verify:
+      - OPNotFoundException is raised
+    """
+    snapshot = signed_in_op.snapshot()
+    snapshot = snapshot._replace(op_path=str(tmp_path / "no-such-op"))
+    with pytest.raises(OPNotFoundException):
+        OP.from_snapshot(snapshot)
+
+
+@pytest.mark.usefixtures("setup_normal_op_env")
+def test_session_snapshot_070(signed_in_op: OP, monkeypatch):
+    """
+    Test:
+      - Set the OP class logger
+      - Create an OP object from a snapshot, without a logger
+    Verify:
+      - The OP class logger is unchanged
+      - The new OP object has its own default logger
+    """
+    class_logger = logging.getLogger("test_session_snapshot_070")
+    monkeypatch.setattr(OP, "logger", class_logger)
+    op = OP.from_snapshot(signed_in_op.snapshot())
+    assert OP.logger is class_logger
+    assert op.logger.name == "OP"
@@ -1,7 +1,11 @@
 from __future__ import annotations
 
+import gc
+import weakref
 from typing import TYPE_CHECKING
 
+import pytest
+
 if TYPE_CHECKING:
     pass
 
@@ -95,3 +99,50 @@ def test_svc_acct_command_support_06():
     reg = OPSvcAcctSupportRegistry()
     support = reg.command_supported(item_get_argv)
     assert support.code == SVC_ACCT_INCOMPAT_OPTIONS
+
+
+def test_svc_acct_command_support_07():
+    """
+    Get the service account support registry, and release all references to it
+
+    Verify the same registry object is returned afterward, rather than
+    loading & compiling the command specs again
+    """
+    reg_ref = weakref.ref(OPSvcAcctSupportRegistry())
+    gc.collect()
+    assert reg_ref() is not None
+    assert OPSvcAcctSupportRegistry() is reg_ref()
+
+
+def test_svc_acct_command_support_08():
+    """
+    Check support for two argv lists that differ only by positional argument
+
+    Verify:
+      - The same cached result is returned for both
+      - Only one result is cached
+    """
+    reg = OPSvcAcctSupportRegistry()
+    argv_1 = ['op', '--format', 'json', 'item',
+              'get', 'example item 1', '--vault', 'test data']
+    argv_2 = ['op', '--format', 'json', 'item',
+              'get', 'example item 2', '--vault', 'other vault']
+    support_1 = reg.command_supported(argv_1)
+    cache_size = len(reg._support_cache)
+    support_2 = reg.command_supported(argv_2)
+    assert support_1.code == SVC_ACCT_SUPPORTED
+    assert support_2 is support_1
+    assert len(reg._support_cache) == cache_size
+
+
+def test_svc_acct_command_support_09():
+    """
+    Attempt to modify the compiled command specs
+
+    Verify TypeError is raised, since they're immutable
+    """
+    reg = OPSvcAcctSupportRegistry()
+    with pytest.raises(TypeError):
+        reg._supported_commands["item"] = {}
+    with pytest.raises(TypeError):
+        reg._supported_commands["item"][("get",)] = None